@@ -1,19 +1,101 @@
 import asyncio
+import json
 import os
-import signal
-from typing import Dict
-from src.core.orchestrator import GonzoOrchestrator
-from src.social.x_integration import XIntegration
+from typing import Dict, Optional
+from src.core.startup import get_profiler
+
+# Timed so the startup report shows what each SDK-backed package costs to import
+profiler = get_profiler()
+with profiler.measure('GonzoOrchestrator', 'import'):
+    from src.core.orchestrator import GonzoOrchestrator
+with profiler.measure('XIntegration', 'import'):
+    from src.social.x_integration import XIntegration
+with profiler.measure('BraveSearcher', 'import'):
+    from src.intelligence.brave_searcher import BraveSearcher
+
+from src.social.post_queue import PostLane
+from src.social.interaction_store import UserInteractionStore
+from src.social.tier_engine import TierEngine, UserTier
 from src.core.personality import GonzoPersonality
-from src.intelligence.brave_searcher import BraveSearcher
+from src.intelligence.brave_client import get_brave_client
+from src.intelligence.dedup import NearDuplicateDetector
+from src.config.registry import get_registry
+from src.core.work_queue import WorkQueue
+from src.core.scheduler import JobScheduler, MissedRunPolicy
+from src.core.lifecycle import LifecycleManager
+from src.core.snapshot import SnapshotManager
+from src.core.log_pipeline import configure_logging, shutdown_logging, get_logger
+
+logger = get_logger('launcher')
+
+# Work still queued at shutdown, re-queued on the next start
+PENDING_WORK_PATH = 'gonzo_pending_work.json'
+
+# Base priorities for the work queue; waiting items gain a point a minute
+MENTION_PRIORITY = {
+    UserTier.OWNER: 100,
+    UserTier.TRUSTED: 70,
+    UserTier.RESISTANCE: 60,
+    UserTier.STANDARD: 45,
+    UserTier.SUSPICIOUS: 5
+}
+
+def finding_priority(finding: Dict) -> float:
+    """Significance dominates; stories minutes or hours old get a freshness bump."""
+    age = str(finding.get('age', '')).lower()
+    fresh = 10 if 'minute' in age or 'hour' in age else 0
+    return 80 * finding.get('significance', 0.5) + fresh
 
 class GonzoLauncher:
     def __init__(self):
-        self.orchestrator = GonzoOrchestrator()
-        self.x_system = XIntegration()
+        # Knowledge, pattern and learning systems are built on the first request
+        with profiler.measure('GonzoOrchestrator', 'init'):
+            self.orchestrator = GonzoOrchestrator()
+        with profiler.measure('XIntegration', 'init'):
+            self.x_system = XIntegration()
         self.personality = GonzoPersonality()
-        self.brave_searcher = BraveSearcher()
-        self.shutdown_event = asyncio.Event()
+        with profiler.measure('BraveSearcher', 'init'):
+            self.brave_searcher = BraveSearcher()
+        # One orchestrator pass and post per story, however many topics surface it
+        self.dedup = NearDuplicateDetector()
+        # Owner and allowlisted users are known without interaction history
+        self.tiers = TierEngine(
+            UserInteractionStore('gonzo_interactions.db'),
+            owner_ids=[i for i in os.getenv('GONZO_OWNER_IDS', '').split(',') if i]
+        )
+        # Mentions and findings are handled in priority order, several at a time
+        self.work = WorkQueue(max_workers=4)
+        self.work.register('mention', self.handle_mention, max_concurrent=3)
+        self.work.register('finding', self.handle_finding, max_concurrent=2)
+        # Each workload runs on its own cadence instead of one shared cycle
+        self.scheduler = JobScheduler()
+        self.scheduler.add_job('mention_ingest', self.ingest_mentions, interval=120, jitter=10)
+        self.scheduler.add_job('topic_monitor', self.monitor_topics, interval=300)
+        self.scheduler.add_job('scheduled_posts', self.post_scheduled_content, interval=900, jitter=60)
+        self.scheduler.add_job('compaction', self.compact, interval=86400,
+                               missed=MissedRunPolicy.SKIP, run_immediately=False)
+        # Learned state and API cursors survive restarts instead of starting cold
+        self.snapshots = SnapshotManager()
+        self.snapshots.register('orchestrator', self.orchestrator)
+        self.snapshots.register('x_api', self.x_system.api_client)
+        # Last run times, so daily compaction survives restarts more often than daily
+        self.snapshots.register('scheduler', self.scheduler)
+        self.scheduler.add_job('snapshot', self.save_snapshot, interval=300, run_immediately=False)
+        # Dependencies first: shutdown drains and stops in reverse, so producers
+        # stop before the queues they feed, and those before the clients they use
+        self.lifecycle = LifecycleManager(deadline=30)
+        registry = get_registry()
+        self.lifecycle.register('registry', start=registry.start, stop=registry.stop)
+        # Restored before anything runs, saved after everything has stopped
+        self.lifecycle.register('snapshot', start=self.snapshots.restore, stop=self.snapshots.save)
+        self.lifecycle.register('brave_client', stop=lambda: get_brave_client().close())
+        self.lifecycle.register('orchestrator', start=self.orchestrator.start,
+                                drain=self._drain_orchestrator, stop=self.orchestrator.stop)
+        self.lifecycle.register('x_system', start=self.x_system.start,
+                                drain=self.x_system.drain, stop=self.x_system.stop)
+        self.lifecycle.register('work_queue', start=self._start_work,
+                                drain=self.work.join, stop=self._stop_work, drain_timeout=15)
+        self.lifecycle.register('scheduler', drain=self.scheduler.stop, start=self.scheduler.start)
         
     async def launch(self):
         print("""
@@ -28,77 +110,123 @@ class GonzoLauncher:
         
         try:
             # Initialize all systems
-            await self.orchestrator.process_input({"type": "system_init", "content": "Initializing Gonzo-3030 systems"})
+            self.lifecycle.install_signal_handlers()
+            await self.lifecycle.start()
+            profiler.mark_ready()
+            # No warm-up request: the lazy subsystems are built by the first real one
+            logger.info('Gonzo-3030 systems initialized')
+            
+            await self.lifecycle.wait_for_shutdown()
             
-            while not self.shutdown_event.is_set():
-                if self.x_system.safety_manager.is_operational():
-                    # Check for mentions and interactions
-                    mentions = self.x_system.api_client.get_mentions(since_minutes=5)
-                    if mentions:
-                        for mention in mentions:
-                            if self.shutdown_event.is_set():
-                                break
-                            await self.handle_mention(mention)
-                    
-                    # Check for significant new developments
-                    findings = await self.brave_searcher.monitor_topics()
-                    if findings:
-                        for finding in findings:
-                            if self.shutdown_event.is_set():
-                                break
-                            await self.handle_finding(finding)
-                    
-                    # Get system status
-                    status = self.x_system.get_system_status()
-                    
-                    if status['stats']['posts'] < self.x_system.engagement_system.daily_limits['standalone']:
-                        # Generate and post content if needed
-                        content = await self.orchestrator.process_input({
-                            "type": "content_generation",
-                            "content": "Generate next social post"
-                        })
-                        
-                        await self.x_system.post_content(
-                            content_type=content.get('type', 'WARNING'),
-                            context=content
-                        )
-                    
-                    # Dynamic wait based on activity
-                    had_activity = bool(mentions or findings)
-                    wait_time = 300 if had_activity else 900  # 5 mins if active, 15 if not
-                    print(f"\n⏳ Waiting {wait_time//60} minutes until next check...")
-                    try:
-                        await asyncio.wait_for(self.shutdown_event.wait(), timeout=wait_time)
-                    except asyncio.TimeoutError:
-                        continue
-                else:
-                    print("\n⚠️ Technical systems in recovery. Waiting...")
-                    try:
-                        await asyncio.wait_for(self.shutdown_event.wait(), timeout=3600)
-                    except asyncio.TimeoutError:
-                        continue
-                    
         except Exception as e:
             print(f"\n❌ Critical error: {str(e)}")
+            logger.exception(f'Critical error: {str(e)}', extra={'error_type': type(e).__name__})
             self.x_system.safety_manager.log_api_error('CRITICAL_ERROR', str(e))
             raise
         finally:
             await self._shutdown()
             
-    async def _shutdown(self, timeout: int = 5):
-        """Perform shutdown with timeout"""
+    async def _shutdown(self):
+        """Drain and stop every subsystem within the lifecycle deadline"""
         print("\n🛑 Shutting down Gonzo-3030...")
         try:
-            # Set a timeout for the shutdown process
-            shutdown_task = self.orchestrator.process_input({"type": "system_shutdown", "content": "Emergency shutdown initiated"})
-            await asyncio.wait_for(shutdown_task, timeout=timeout)
-        except asyncio.TimeoutError:
-            print("Shutdown timed out, forcing exit...")
+            report = await self.lifecycle.shutdown()
+            if any(isinstance(r, dict) and 'timeout' in r.values() for r in report.values()):
+                print("Shutdown timed out, forcing exit...")
         except Exception as e:
-            print(f"Error during shutdown: {e}")
+            logger.exception(f'Error during shutdown: {e}', extra={'error_type': type(e).__name__})
         finally:
             print("📴 Gonzo-3030 offline")
     
+    async def _drain_orchestrator(self):
+        # No shutdown request: it would build unused subsystems and call out while exiting
+        logger.info('Gonzo-3030 shutting down')
+        await self.orchestrator.drain()
+    
+    def _start_work(self):
+        """Re-queue work left over from the last shutdown, then start the workers."""
+        try:
+            with open(PENDING_WORK_PATH) as f:
+                restored = self.work.load(json.load(f))
+            os.remove(PENDING_WORK_PATH)
+            logger.info(f'Restored {restored} pending work items')
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f'Could not restore pending work: {e}', extra={'error_type': type(e).__name__})
+        self.work.start()
+    
+    async def _stop_work(self):
+        """Stop the workers and persist whatever did not get handled."""
+        pending = self.work.dump()
+        await self.work.stop()
+        if not pending:
+            return
+        tmp = PENDING_WORK_PATH + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(pending, f, default=str)
+        os.replace(tmp, PENDING_WORK_PATH)
+        logger.info(f'Saved {len(pending)} pending work items')
+    
+    def _recovery_wait(self) -> Optional[float]:
+        """Seconds until the X API circuit allows a probe, or None when operational."""
+        if self.x_system.safety_manager.is_operational():
+            return None
+        return max(1, self.x_system.safety_manager.seconds_until_recovery_probe())
+    
+    async def ingest_mentions(self) -> Optional[float]:
+        """Queue new mentions; while X is in recovery, retry when a probe is allowed."""
+        wait = self._recovery_wait()
+        if wait is not None:
+            print(f"\n⚠️ Technical systems in recovery. Probing again in {wait:.0f}s...")
+            return wait
+        mentions = await asyncio.to_thread(self.x_system.api_client.get_mentions, since_minutes=5)
+        for mention in mentions or []:
+            self.work.put('mention', mention, self.mention_priority(mention))
+        return None
+    
+    async def monitor_topics(self) -> float:
+        """Queue new findings; runs again when the next topic is due."""
+        findings = await self.brave_searcher.monitor_topics()
+        for finding in findings or []:
+            self.work.put('finding', finding, finding_priority(finding))
+        return max(1.0, self.brave_searcher.seconds_until_next_search())
+    
+    async def post_scheduled_content(self) -> Optional[float]:
+        """Generate and post standalone content while under the daily limit."""
+        wait = self._recovery_wait()
+        if wait is not None:
+            return wait
+        status = self.x_system.get_system_status()
+        if status['stats']['posts'] >= self.x_system.engagement_system.daily_limits['standalone']:
+            return None
+        
+        content = await self.orchestrator.process_input({
+            "type": "content_generation",
+            "content": "Generate next social post"
+        })
+        await self.x_system.post_content(
+            content_type=content.get('type', 'WARNING'),
+            context=content
+        )
+        return None
+    
+    async def compact(self) -> None:
+        """Trim state that only grows: seen URLs and finished outbox entries."""
+        # On the loop: both stores share one SQLite connection with loop code
+        pruned = self.brave_searcher.seen.prune()
+        purged = self.x_system.post_queue.purge()
+        logger.info(f'Compaction removed {pruned} seen URLs and {purged} finished posts',
+                    extra={'jobs': self.scheduler.stats()})
+    
+    async def save_snapshot(self) -> None:
+        self.snapshots.save()
+    
+    def mention_priority(self, mention: Dict) -> float:
+        author_id = mention.get('author_id')
+        tier = self.tiers.get_tier(author_id) if author_id else UserTier.STANDARD
+        return MENTION_PRIORITY[tier]
+    
     async def handle_mention(self, mention: Dict):
         """Handle a mention or interaction"""
         try:
@@ -114,10 +242,21 @@ class GonzoLauncher:
                 priority='HIGH'  # Mentions get high priority
             )
         except Exception as e:
-            print(f"Error handling mention: {str(e)}")
+            logger.exception(f'Error handling mention: {str(e)}', extra={
+                'error_type': type(e).__name__,
+                'tweet_id': mention.get('id')
+            })
     
     async def handle_finding(self, finding: Dict):
         """Handle a significant finding from Brave search"""
+        cluster, is_new = self.dedup.add(finding)
+        if not is_new:
+            logger.info(f'Skipping duplicate of finding {cluster.id}', extra={
+                'url': finding.get('url'),
+                'dedup': self.dedup.metrics()
+            })
+            return
+        
         try:
             # Prepare the content with finding details
             content = {
@@ -135,7 +274,8 @@ class GonzoLauncher:
             if finding.get('significance', 0.5) > 0.7:
                 await self.x_system.post_content(
                     content_type='WARNING',
-                    context=response
+                    context=response,
+                    lane=PostLane.CRITICAL
                 )
             else:
                 await self.x_system.post_content(
@@ -144,28 +284,22 @@ class GonzoLauncher:
                 )
                 
         except Exception as e:
-            print(f"Error handling finding: {str(e)}")
+            logger.exception(f'Error handling finding: {str(e)}', extra={
+                'error_type': type(e).__name__,
+                'url': finding.get('url')
+            })
     
     def shutdown(self):
         """Trigger a clean shutdown"""
-        if not self.shutdown_event.is_set():
+        if not self.lifecycle.shutdown_requested.is_set():
             print("\n🚨 Initiating shutdown sequence...")
-            self.shutdown_event.set()
-
-def handle_shutdown(signum, frame):
-    """Handle shutdown signals"""
-    if hasattr(asyncio, 'get_running_loop'):
-        try:
-            loop = asyncio.get_running_loop()
-            if hasattr(loop, 'launcher'):
-                loop.launcher.shutdown()
-        except RuntimeError:
-            pass
+            self.lifecycle.request_shutdown()
 
 if __name__ == "__main__":
     # Load environment variables
     from dotenv import load_dotenv
     load_dotenv()
+    configure_logging()
     
     # Verify API credentials exist
     required_vars = ['X_API_KEY', 'X_API_SECRET', 'X_ACCESS_TOKEN', 'X_ACCESS_SECRET']
@@ -176,15 +310,10 @@ if __name__ == "__main__":
         print("Please set these in your .env file")
         exit(1)
     
-    # Set up signal handlers
-    signal.signal(signal.SIGINT, handle_shutdown)
-    signal.signal(signal.SIGTERM, handle_shutdown)
-    
-    # Launch Gonzo
-    launcher = GonzoLauncher()
+    # Launch Gonzo; SIGINT/SIGTERM are routed to the lifecycle manager once running
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
-    loop.launcher = launcher  # Store reference for signal handler
+    launcher = GonzoLauncher()
     try:
         loop.run_until_complete(launcher.launch())
     except KeyboardInterrupt:
@@ -192,4 +321,5 @@ if __name__ == "__main__":
     finally:
         loop.run_until_complete(loop.shutdown_asyncgens())
         loop.close()
+        shutdown_logging()
         print("📴 Process terminated")
\ No newline at end of file
@@ -4,6 +4,8 @@ setup(
     name="gonzo-3030",
     version="0.1.0",
     packages=find_packages(),
+    package_data={'src.config': ['data/*.json']},
+    include_package_data=True,
     install_requires=[
         'pytest>=7.4.3',
         'pytest-cov>=4.1.0',
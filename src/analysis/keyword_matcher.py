@@ -0,0 +1,230 @@
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+@dataclass(frozen=True)
+class KeywordHit:
+    """One keyword occurrence found in a text."""
+    keyword: str
+    category: str
+    weight: float
+    start: int
+    end: int
+
+# Below this many distinct keywords, presence checks (scores, categories) use
+# plain ``in`` tests, which beat the regex scan in CPython; spans always use it
+IN_SCAN_LIMIT = 128
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Regex alternation shaped as a trie, e.g. ``he(?:rs)?|she``.
+
+    Shared prefixes are matched once, which makes large alternations far
+    cheaper for the regex engine than a flat ``a|b|c`` list, and the greedy
+    optional groups make every match the longest keyword at its position.
+    """
+    trie: Dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f'(?:{pattern})?' if '' in node else pattern
+
+    return build(trie)
+
+class KeywordMatcher:
+    """One precompiled regular expression over weighted, categorised keyword lists.
+
+    The keywords are compiled into a single trie-shaped alternation, so the C
+    regex engine does the scanning and finds the longest keyword at each
+    match position. Shorter keywords matching at the same position are
+    prefixes of that one and come from a table built at compile time, so
+    overlapping hits are all reported. Matching is case-insensitive
+    substring matching unless ``whole_words`` is set, either for the whole
+    matcher or per keyword. Small matchers answer presence questions with
+    ``in`` tests instead (see ``IN_SCAN_LIMIT``).
+    """
+
+    def __init__(self,
+                 keywords: Optional[Mapping[str, Iterable[str]]] = None,
+                 weights: Optional[Mapping[str, float]] = None,
+                 whole_words: bool = False):
+        self.whole_words = whole_words
+        # (keyword, category, weight, whole_word) in registration order
+        self._entries: List[Tuple[str, str, float, bool]] = []
+        self._compiled = False
+
+        for category, words in (keywords or {}).items():
+            weight = (weights or {}).get(category, 1.0)
+            for word in words:
+                self.add(word, category, weight)
+
+    def add(self,
+            keyword: str,
+            category: str = 'default',
+            weight: float = 1.0,
+            whole_word: Optional[bool] = None) -> None:
+        if whole_word is None:
+            whole_word = self.whole_words
+        if keyword:
+            self._entries.append((keyword.lower(), category, weight, whole_word))
+            self._compiled = False
+
+    def compile(self) -> None:
+        """Build the alternation and the keyword prefix table."""
+        # Entry indices per keyword text, split by whether they need word boundaries
+        by_text: Dict[str, Tuple[List[int], List[int]]] = {}
+        for index, (keyword, _, _, whole_word) in enumerate(self._entries):
+            by_text.setdefault(keyword, ([], []))[whole_word].append(index)
+
+        self._regex = re.compile(_trie_pattern(by_text)) if by_text else None
+        # (keyword, substring entries, whole-word entries, boundary regex) for ``in`` tests
+        self._in_scan = [
+            (text, anywhere, whole, re.compile(rf'(?<!\w){re.escape(text)}(?!\w)') if whole else None)
+            for text, (anywhere, whole) in by_text.items()
+        ] if len(by_text) <= IN_SCAN_LIMIT else None
+
+        # For each keyword, it and every shorter keyword that is its prefix, longest
+        # first: whatever matches at a position is one of these for the longest match
+        self._candidates: Dict[str, List[Tuple[int, List[int], List[int]]]] = {
+            text: [(length, *by_text[text[:length]]) for length in range(len(text), 0, -1)
+                   if text[:length] in by_text]
+            for text in by_text
+        }
+
+        # Where to resume after a match: the first offset inside it at which
+        # another keyword could start, so the rest of its span is not rescanned
+        prefixes = {text[:length] for text in by_text for length in range(1, len(text) + 1)}
+        self._resume: Dict[str, int] = {
+            text: next((i for i in range(1, len(text))
+                        if text[i:] in prefixes
+                        or any(text[i:j] in by_text for j in range(i + 1, len(text)))),
+                       len(text))
+            for text in by_text
+        }
+
+        self._order = {(k, c): i for i, (k, c, _, _) in enumerate(self._entries)}
+        # A keyword registered twice in one category still scores once
+        self._score_weights = [weight if self._order[(k, c)] == i else 0.0
+                               for i, (k, c, weight, _) in enumerate(self._entries)]
+        self._category_weights = {category: weight for _, category, weight, _ in self._entries}
+        self._compiled = True
+
+    def _scan(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """(entry index, start, end) for every keyword occurrence in lowercased ``text``."""
+        if not self._compiled:
+            self.compile()
+        if self._regex is None:
+            return
+        search = self._regex.search
+        found = search(text)
+        while found is not None:
+            start = found.start()
+            for length, anywhere, whole in self._candidates[found.group()]:
+                end = start + length
+                for index in anywhere:
+                    yield index, start, end
+                if whole and self._is_word(text, start, end):
+                    for index in whole:
+                        yield index, start, end
+            found = search(text, start + self._resume[found.group()])
+
+    def _present(self, text: str) -> Set[int]:
+        """Indices of the entries found in lowercased ``text``; the scoring hot path."""
+        if not self._compiled:
+            self.compile()
+        present: Set[int] = set()
+        if self._in_scan is not None:
+            for keyword, anywhere, whole, bounded in self._in_scan:
+                if keyword in text:
+                    present.update(anywhere)
+                    if whole and bounded.search(text):
+                        present.update(whole)
+            return present
+        if self._regex is None:
+            return present
+        search = self._regex.search
+        found = search(text)
+        while found is not None:
+            start = found.start()
+            keyword = found.group()
+            for length, anywhere, whole in self._candidates[keyword]:
+                present.update(anywhere)
+                if whole and self._is_word(text, start, start + length):
+                    present.update(whole)
+            found = search(text, start + self._resume[keyword])
+        return present
+
+    def find_all(self, text: str) -> List[KeywordHit]:
+        """Every keyword occurrence in ``text``, in order of where each one ends."""
+        hits = []
+        for index, start, end in self._scan(text.lower()):
+            keyword, category, weight, _ = self._entries[index]
+            hits.append(KeywordHit(keyword, category, weight, start, end))
+        hits.sort(key=lambda hit: (hit.end, hit.start))
+        return hits
+
+    def find_all_batch(self, texts: Sequence[str]) -> List[List[KeywordHit]]:
+        """``find_all`` for many texts in one scan; spans are relative to each text."""
+        # NUL never occurs in a keyword, so no match can span two texts.
+        # Offsets are taken after lowercasing, which can change lengths.
+        texts = [text.lower() for text in texts]
+        offsets = []
+        position = 0
+        for text in texts:
+            offsets.append(position)
+            position += len(text) + 1
+
+        per_text: List[List[KeywordHit]] = [[] for _ in texts]
+        for hit in self.find_all('\0'.join(texts)):
+            i = bisect_right(offsets, hit.start) - 1
+            base = offsets[i]
+            per_text[i].append(KeywordHit(hit.keyword, hit.category, hit.weight,
+                                          hit.start - base, hit.end - base))
+        return per_text
+
+    def match(self, text: str) -> List[KeywordHit]:
+        """First occurrence of each distinct keyword, in registration order."""
+        return self.distinct(self.find_all(text))
+
+    def distinct(self, hits: Iterable[KeywordHit]) -> List[KeywordHit]:
+        """Reduce hits to the first occurrence of each keyword, in registration order."""
+        if not self._compiled:
+            self.compile()
+        first: Dict[Tuple[str, str], KeywordHit] = {}
+        for hit in hits:
+            first.setdefault((hit.keyword, hit.category), hit)
+        return sorted(first.values(), key=lambda hit: self._order[(hit.keyword, hit.category)])
+
+    def categories(self, text: str) -> Set[str]:
+        """Categories with at least one keyword in ``text``."""
+        return {self._entries[index][1] for index in self._present(text.lower())}
+
+    def contains_any(self, text: str) -> bool:
+        return bool(self._present(text.lower()))
+
+    def keyword_score(self, text: str, categories: Optional[Iterable[str]] = None) -> float:
+        """Sum of weights of the distinct keywords present, optionally limited to ``categories``."""
+        present = self._present(text.lower())
+        if categories is None:
+            return sum(self._score_weights[index] for index in present)
+        allowed = set(categories)
+        return sum(self._score_weights[index] for index in present
+                   if self._entries[index][1] in allowed)
+
+    def category_score(self, text: str) -> float:
+        """Sum of category weights, counting each category once however many keywords hit."""
+        categories = self.categories(text)
+        return sum(self._category_weights[category] for category in categories)
+
+    def _is_word(self, text: str, start: int, end: int) -> bool:
+        before = text[start - 1] if start > 0 else ' '
+        after = text[end] if end < len(text) else ' '
+        return not (before.isalnum() or before == '_') and not (after.isalnum() or after == '_')
@@ -1,6 +1,12 @@
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 from enum import Enum
 from datetime import datetime
+from .keyword_matcher import KeywordHit, KeywordMatcher
+from .semantic_matcher import Embedder, NarrativeCentroids
+from ..config.registry import ConfigRegistry, RegistrySnapshot, get_registry
+from ..core.log_pipeline import get_logger
+
+logger = get_logger('narratives')
 
 class NarrativeType(Enum):
     CORPORATE_PROPAGANDA = "corporate_propaganda"
@@ -17,89 +23,155 @@ class PropagandaTechnique(Enum):
     MANUFACTURED_CONSENT = "manufactured_consent"
 
 class NarrativeDetector:
-    def __init__(self):
-        self.known_narratives = {
-            "crypto_fear": {
-                "type": NarrativeType.FEAR_MONGERING,
-                "triggers": ["crypto danger", "bitcoin criminal", "defi risks"],
-                "corporate_benefit": "Keeping people in traditional banking",
-                "future_impact": "Led to the Banking Control Act of 2028"
-            },
-            "centralization_good": {
-                "type": NarrativeType.CORPORATE_PROPAGANDA,
-                "triggers": ["regulatory clarity", "institutional adoption", "compliant platform"],
-                "corporate_benefit": "Maintaining control over financial systems",
-                "future_impact": "Enabled the Great Financial Consolidation"
-            },
-            "privacy_danger": {
-                "type": NarrativeType.SOCIAL_ENGINEERING,
-                "triggers": ["nothing to hide", "public safety", "prevent crime"],
-                "corporate_benefit": "Total surveillance capitalism",
-                "future_impact": "The Privacy Extinction of 2029"
-            }
-        }
-        
-        self.megacorp_tactics = {
-            "divide_and_conquer": [
-                "creating artificial conflicts",
-                "promoting tribal thinking",
-                "fostering echo chambers"
+    def __init__(self,
+                 semantic: bool = False,
+                 embedder: Optional[Embedder] = None,
+                 semantic_threshold: float = 0.8,
+                 semantic_thresholds: Optional[Dict[str, float]] = None,
+                 centroid_cache: Optional[str] = 'gonzo_narrative_centroids.npz',
+                 registry: Optional[ConfigRegistry] = None):
+        self.technique_patterns = {
+            PropagandaTechnique.EMOTIONAL_MANIPULATION: [
+                "fear", "danger", "threat", "risk", "scary"
             ],
-            "reality_distortion": [
-                "selective fact presentation",
-                "context manipulation",
-                "expert manufacturing"
+            PropagandaTechnique.FALSE_DICHOTOMY: [
+                "either", "only choice", "no alternative"
             ],
-            "consent_manufacturing": [
-                "artificial grassroots",
-                "controlled opposition",
-                "narrative seeding"
+            PropagandaTechnique.APPEAL_TO_AUTHORITY: [
+                "experts say", "studies show", "authorities confirm"
             ]
         }
+        
+        # Narratives and tactics come from the registry and are rebuilt
+        # whenever its data files change
+        self.registry = registry or get_registry()
+        self._load_narratives(self.registry.snapshot)
+        self.registry.subscribe(self._on_registry_change)
+        
+        # Optional semantic mode: content the keyword prefilter misses is
+        # compared against embedding centroids of each narrative
+        self.semantic = semantic
+        self.embedder = embedder
+        self.semantic_threshold = semantic_threshold
+        self.semantic_thresholds = semantic_thresholds
+        self.centroid_cache = centroid_cache
+        self.centroids: Optional[NarrativeCentroids] = None
+
+    def _load_narratives(self, snapshot: RegistrySnapshot) -> None:
+        data = snapshot.sections["narratives"]
+        known_narratives = {
+            name: {**details, "type": NarrativeType(details["type"]), "triggers": list(details["triggers"])}
+            for name, details in data["known_narratives"].items()
+        }
+        
+        # One precompiled index over narrative triggers and technique cues.
+        # Technique cues are short words, so they only match whole words.
+        index = KeywordMatcher()
+        for name, details in known_narratives.items():
+            for trigger in details["triggers"]:
+                index.add(trigger, f"narrative:{name}")
+        for technique, cues in self.technique_patterns.items():
+            for cue in cues:
+                index.add(cue, f"technique:{technique.value}", whole_word=True)
+        index.compile()
+        
+        self.known_narratives = known_narratives
+        self.megacorp_tactics = {name: list(tactics) for name, tactics in data.get("megacorp_tactics", {}).items()}
+        self.index = index
+        self.registry_version = snapshot.version
+
+    def _on_registry_change(self, snapshot: RegistrySnapshot) -> None:
+        try:
+            self._load_narratives(snapshot)
+        except ValueError as e:
+            logger.error(f"Keeping narratives from registry version {self.registry_version}: {e}")
+            return
+        # Centroids embed the old triggers and descriptions
+        self.centroids = None
 
     async def analyze_narrative(self, 
                               content: str,
                               context: Optional[Dict] = None) -> Dict:
         """Analyze content for narrative manipulation patterns."""
-        detected_patterns = []
-        future_implications = []
+        return (await self.analyze_batch([content], context))[0]
+
+    async def analyze_batch(self,
+                            contents: Sequence[str],
+                            context: Optional[Dict] = None) -> List[Dict]:
+        """Analyze many contents with one scan of the index.
+
+        Returns one ``analyze_narrative``-shaped result per item, in input order.
+        """
+        texts = [str(content) for content in contents]
+        hits = self.index.find_all_batch(texts)
+        
+        # Keywords are the fast path; only items they miss are embedded
+        similarities: List[Dict[str, float]] = [{} for _ in texts]
+        if self.semantic:
+            misses = [i for i, item_hits in enumerate(hits)
+                      if not any(hit.category.startswith("narrative:") for hit in item_hits)]
+            if misses:
+                centroids = await self._get_centroids()
+                for i, scores in zip(misses, await centroids.classify([texts[i] for i in misses])):
+                    similarities[i] = scores
         
-        # Check for known narrative patterns
+        return [self._build_analysis(item_hits, scores)
+                for item_hits, scores in zip(hits, similarities)]
+
+    async def _get_centroids(self) -> NarrativeCentroids:
+        if self.centroids is None:
+            if self.embedder is None:
+                from ..core.embeddings import EmbeddingProcessor
+                self.embedder = EmbeddingProcessor()
+            self.centroids = NarrativeCentroids(
+                self.embedder,
+                cache_path=self.centroid_cache,
+                threshold=self.semantic_threshold,
+                thresholds=self.semantic_thresholds
+            )
+        if not self.centroids.ready:
+            await self.centroids.build({
+                name: details["triggers"] + [details["description"]]
+                for name, details in self.known_narratives.items()
+            })
+        return self.centroids
+
+    def _build_analysis(self, hits: List[KeywordHit], similarities: Optional[Dict[str, float]] = None) -> Dict:
+        matched = {hit.category for hit in hits}
+        similarities = similarities or {}
+        
+        # Known narrative patterns
+        detected_patterns = []
         for narrative_name, details in self.known_narratives.items():
-            if self._matches_narrative(content, details["triggers"]):
-                detected_patterns.append({
+            keyword_match = f"narrative:{narrative_name}" in matched
+            if keyword_match or narrative_name in similarities:
+                pattern = {
                     "narrative": narrative_name,
                     "type": details["type"],
                     "corporate_benefit": details["corporate_benefit"],
-                    "future_impact": details["future_impact"]
-                })
+                    "future_impact": details["future_impact"],
+                    "match": "keyword" if keyword_match else "semantic"
+                }
+                if not keyword_match:
+                    pattern["similarity"] = similarities[narrative_name]
+                detected_patterns.append(pattern)
         
-        # Analyze manipulation techniques
-        techniques = self._detect_techniques(content)
+        # Manipulation techniques
+        techniques = [
+            technique for technique in self.technique_patterns
+            if f"technique:{technique.value}" in matched
+        ]
         
         return {
             "patterns": detected_patterns,
             "techniques": techniques,
+            "triggers": [hit.keyword for hit in self.index.distinct(hits)],
             "gonzo_analysis": self._generate_gonzo_warning(detected_patterns)
         }
 
     def _detect_techniques(self, content: str) -> List[PropagandaTechnique]:
         """Detect specific propaganda techniques in content."""
-        techniques = []
-        
-        technique_patterns = {
-            PropagandaTechnique.EMOTIONAL_MANIPULATION: [
-                "fear", "danger", "threat", "risk", "scary"
-            ],
-            PropagandaTechnique.FALSE_DICHOTOMY: [
-                "either", "or", "only choice", "no alternative"
-            ],
-            PropagandaTechnique.APPEAL_TO_AUTHORITY: [
-                "experts say", "studies show", "authorities confirm"
-            ]
-        }
-        
-        return techniques
+        return self._build_analysis(self.index.find_all(content))["techniques"]
 
     def _generate_gonzo_warning(self, patterns: List[Dict]) -> str:
         """Generate a Gonzo-style warning about detected narratives."""
@@ -116,10 +188,12 @@ class NarrativeDetector:
         
         return "\n\n".join(warnings)
 
-    def _matches_narrative(self, content: str, triggers: List[str]) -> bool:
-        """Check if content matches known narrative triggers."""
-        content = content.lower()
-        return any(trigger.lower() in content for trigger in triggers)
+    def _matches_narrative(self, content: str) -> Set[str]:
+        """Names of the known narratives whose triggers appear in the content."""
+        return {
+            category.split(":", 1)[1] for category in self.index.categories(content)
+            if category.startswith("narrative:")
+        }
 
     def get_historical_context(self, narrative_type: NarrativeType) -> str:
         """Provide historical context from 3030 about narrative types."""
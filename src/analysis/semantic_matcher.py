@@ -0,0 +1,111 @@
+import os
+import json
+import hashlib
+from typing import Dict, List, Optional, Protocol, Sequence
+import numpy as np
+from ..core.log_pipeline import get_logger
+
+logger = get_logger('narratives')
+
+class Embedder(Protocol):
+    async def get_embeddings(self, texts: List[str]) -> List[List[float]]: ...
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+class NarrativeCentroids:
+    """Embedding centroids for known narratives, cached on disk.
+
+    Each narrative's triggers and description are embedded once and averaged
+    into a unit-length centroid. Content is then classified with a single
+    matrix product against the centroid matrix. The cache is keyed by the
+    embedding model and the exact texts, so editing a narrative rebuilds it.
+    """
+
+    def __init__(self,
+                 embedder: Embedder,
+                 cache_path: Optional[str] = 'gonzo_narrative_centroids.npz',
+                 threshold: float = 0.8,
+                 thresholds: Optional[Dict[str, float]] = None):
+        self.embedder = embedder
+        self.cache_path = cache_path
+        self.threshold = threshold
+        self.thresholds = dict(thresholds or {})
+
+        self.names: List[str] = []
+        self.matrix: Optional[np.ndarray] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.matrix is not None
+
+    async def build(self, corpora: Dict[str, List[str]]) -> None:
+        """Compute (or load cached) centroids for ``{narrative: [texts]}``."""
+        key = self._cache_key(corpora)
+        if self._load(key):
+            return
+
+        names = list(corpora)
+        texts = [text for name in names for text in corpora[name]]
+        vectors = np.asarray(await self.embedder.get_embeddings(texts), dtype=np.float32)
+        if not vectors.any(axis=1).all():
+            # Zero vectors are the embedder's failure fallback; retry on the next build
+            logger.warning('Narrative embeddings unavailable; semantic matching disabled for now')
+            return
+        vectors = _normalize_rows(vectors)
+
+        centroids = []
+        start = 0
+        for name in names:
+            count = len(corpora[name])
+            centroids.append(vectors[start:start + count].mean(axis=0))
+            start += count
+
+        self.names = names
+        self.matrix = _normalize_rows(np.vstack(centroids))
+        self._save(key)
+
+    async def classify(self, texts: Sequence[str]) -> List[Dict[str, float]]:
+        """``{narrative: similarity}`` for every centroid each text clears the threshold of."""
+        if not texts or not self.ready:
+            return [{} for _ in texts]
+
+        vectors = _normalize_rows(np.asarray(await self.embedder.get_embeddings(list(texts)), dtype=np.float32))
+        similarities = vectors @ self.matrix.T
+        thresholds = np.array([self.thresholds.get(name, self.threshold) for name in self.names])
+
+        results = []
+        for row in similarities:
+            hits = np.nonzero(row >= thresholds)[0]
+            results.append({self.names[i]: float(row[i]) for i in hits})
+        return results
+
+    def _cache_key(self, corpora: Dict[str, List[str]]) -> str:
+        model = getattr(getattr(self.embedder, 'embeddings', None), 'model', type(self.embedder).__name__)
+        payload = json.dumps({'model': str(model), 'corpora': corpora}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _load(self, key: str) -> bool:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return False
+        try:
+            with np.load(self.cache_path, allow_pickle=False) as cached:
+                if str(cached['key']) != key:
+                    return False
+                self.names = [str(name) for name in cached['names']]
+                self.matrix = cached['matrix']
+            return True
+        except (OSError, KeyError, ValueError):
+            return False
+
+    def _save(self, key: str) -> None:
+        if not self.cache_path:
+            return
+        try:
+            tmp_path = f'{self.cache_path}.tmp.npz'
+            np.savez(tmp_path, key=np.array(key), names=np.array(self.names), matrix=self.matrix)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.error(f'Failed to cache narrative centroids: {e}')
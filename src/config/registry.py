@@ -0,0 +1,228 @@
+import os
+import copy
+import json
+import asyncio
+import hashlib
+import weakref
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from ..core.log_pipeline import get_logger
+
+logger = get_logger('registry')
+
+DEFAULT_DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+
+class RegistryValidationError(ValueError):
+    """Raised when a registry data file does not match its section schema."""
+
+def _require(condition: bool, section: str, message: str) -> None:
+    if not condition:
+        raise RegistryValidationError(f'{section}: {message}')
+
+def _is_str_list(value: Any) -> bool:
+    return isinstance(value, list) and bool(value) and all(isinstance(v, str) and v for v in value)
+
+def _validate_narratives(data: Any) -> None:
+    # Imported here: the detector module itself reads narratives from the registry
+    from ..analysis.narrative_detector import NarrativeType
+    narrative_types = {member.value for member in NarrativeType}
+
+    _require(isinstance(data, dict), 'narratives', 'expected an object')
+    narratives = data.get('known_narratives')
+    _require(isinstance(narratives, dict) and bool(narratives), 'narratives', 'known_narratives must be a non-empty object')
+    for name, details in narratives.items():
+        _require(isinstance(details, dict), 'narratives', f'{name} must be an object')
+        _require(_is_str_list(details.get('triggers')), 'narratives', f'{name}.triggers must be a non-empty list of strings')
+        for key in ('type', 'description', 'corporate_benefit', 'future_impact'):
+            _require(isinstance(details.get(key), str), 'narratives', f'{name}.{key} must be a string')
+        _require(details['type'] in narrative_types, 'narratives',
+                 f'{name}.type must be one of {", ".join(sorted(narrative_types))}')
+    tactics = data.get('megacorp_tactics', {})
+    _require(isinstance(tactics, dict) and all(_is_str_list(v) for v in tactics.values()),
+             'narratives', 'megacorp_tactics must map names to lists of strings')
+
+def _validate_search_categories(data: Any) -> None:
+    _require(isinstance(data, dict) and bool(data), 'search_categories', 'expected a non-empty object')
+    for name, config in data.items():
+        _require(isinstance(config, dict) and _is_str_list(config.get('queries')),
+                 'search_categories', f'{name}.queries must be a non-empty list of strings')
+        threshold = config.get('relevance_threshold')
+        _require(isinstance(threshold, (int, float)) and 0 <= threshold <= 1,
+                 'search_categories', f'{name}.relevance_threshold must be between 0 and 1')
+
+def _validate_discovery_patterns(data: Any) -> None:
+    _require(isinstance(data, dict) and bool(data) and all(_is_str_list(v) for v in data.values()),
+             'discovery_patterns', 'expected an object mapping categories to lists of strings')
+
+def _validate_topics(data: Any) -> None:
+    _require(_is_str_list(data), 'topics', 'expected a non-empty list of strings')
+
+SECTION_VALIDATORS: Dict[str, Callable[[Any], None]] = {
+    'narratives': _validate_narratives,
+    'search_categories': _validate_search_categories,
+    'discovery_patterns': _validate_discovery_patterns,
+    'topics': _validate_topics
+}
+
+@dataclass(frozen=True)
+class RegistrySnapshot:
+    """One consistent, validated set of registry sections."""
+    version: str
+    sections: Dict[str, Any]
+    file_versions: Dict[str, Any]
+    loaded_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+class ConfigRegistry:
+    """Keyword lists, narratives and topics loaded from versioned JSON data files.
+
+    Each ``<section>.json`` holds ``{"section", "version", "data"}``. All
+    files are validated together and swapped in as one snapshot, so readers
+    never see a half-applied update; an invalid edit is logged and the
+    previous snapshot stays live. ``version`` changes whenever any section's
+    content does, for caches to key on. Subscribers are called after each
+    swap to rebuild derived state such as compiled matchers, and are held
+    weakly so they do not keep their owners alive.
+    """
+
+    def __init__(self, data_dir: str = DEFAULT_DATA_DIR, poll_interval: float = 5.0):
+        self.data_dir = data_dir
+        self.poll_interval = poll_interval
+
+        self._snapshot: Optional[RegistrySnapshot] = None
+        self._mtimes: Dict[str, float] = {}
+        self._subscribers: List[Callable[[], Optional[Callable]]] = []
+        self._watcher: Optional[asyncio.Task] = None
+
+        self.reload()
+
+    @property
+    def version(self) -> str:
+        return self._snapshot.version
+
+    @property
+    def snapshot(self) -> RegistrySnapshot:
+        return self._snapshot
+
+    def get(self, section: str) -> Any:
+        """A private copy of a section's data."""
+        return copy.deepcopy(self._snapshot.sections[section])
+
+    def subscribe(self, callback: Callable[[RegistrySnapshot], None]) -> None:
+        """Call ``callback(snapshot)`` after every successful reload."""
+        if hasattr(callback, '__self__'):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback
+        self._subscribers.append(ref)
+
+    def reload(self) -> bool:
+        """Load the data files if any changed; returns True when a new snapshot was applied."""
+        mtimes = self._scan()
+        if self._snapshot is not None and mtimes == self._mtimes:
+            return False
+        try:
+            snapshot = self._load()
+        except (OSError, ValueError) as e:
+            if self._snapshot is None:
+                raise
+            return self._reject(mtimes, e)
+        return self._commit(mtimes, snapshot)
+
+    async def reload_async(self) -> bool:
+        """``reload`` with file IO off the event loop; subscribers still run on the loop."""
+        mtimes = await asyncio.to_thread(self._scan)
+        if mtimes == self._mtimes:
+            return False
+        try:
+            snapshot = await asyncio.to_thread(self._load)
+        except (OSError, ValueError) as e:
+            return self._reject(mtimes, e)
+        return self._commit(mtimes, snapshot)
+
+    def _reject(self, mtimes: Dict[str, float], error: Exception) -> bool:
+        # Remember the mtimes so a broken file is not re-parsed every poll
+        self._mtimes = mtimes
+        logger.error(f'Registry reload rejected, keeping version {self.version}: {error}',
+                     extra={'error_type': type(error).__name__})
+        return False
+
+    def _commit(self, mtimes: Dict[str, float], snapshot: RegistrySnapshot) -> bool:
+        self._mtimes = mtimes
+        if self._snapshot is not None and snapshot.version == self._snapshot.version:
+            return False
+        self._apply(snapshot)
+        return True
+
+    def start(self) -> None:
+        """Poll the data directory for changes in the background."""
+        if self._watcher is None:
+            self._watcher = asyncio.create_task(self._watch())
+
+    async def stop(self) -> None:
+        if self._watcher:
+            self._watcher.cancel()
+            await asyncio.gather(self._watcher, return_exceptions=True)
+            self._watcher = None
+
+    def _apply(self, snapshot: RegistrySnapshot) -> None:
+        self._snapshot = snapshot
+        logger.info(f'Registry version {snapshot.version} loaded', extra={'versions': snapshot.file_versions})
+
+        live = []
+        for ref in self._subscribers:
+            callback = ref()
+            if callback is None:
+                continue
+            live.append(ref)
+            try:
+                callback(snapshot)
+            except Exception as e:
+                logger.exception(f'Registry subscriber failed: {e}', extra={'error_type': type(e).__name__})
+        self._subscribers = live
+
+    def _scan(self) -> Dict[str, float]:
+        return {
+            name: os.stat(os.path.join(self.data_dir, name)).st_mtime
+            for name in os.listdir(self.data_dir) if name.endswith('.json')
+        }
+
+    def _load(self) -> RegistrySnapshot:
+        sections: Dict[str, Any] = {}
+        file_versions: Dict[str, Any] = {}
+        for name in sorted(os.listdir(self.data_dir)):
+            if not name.endswith('.json'):
+                continue
+            with open(os.path.join(self.data_dir, name)) as f:
+                document = json.load(f)
+            _require(isinstance(document, dict), name, 'expected a {"section", "version", "data"} object')
+            section = document.get('section', name[:-5])
+            validator = SECTION_VALIDATORS.get(section)
+            if validator:
+                validator(document.get('data'))
+            sections[section] = document.get('data')
+            file_versions[section] = document.get('version')
+
+        missing = set(SECTION_VALIDATORS) - set(sections)
+        if missing:
+            raise RegistryValidationError(f'Missing registry sections: {", ".join(sorted(missing))}')
+
+        digest = hashlib.sha256(json.dumps(sections, sort_keys=True).encode()).hexdigest()[:12]
+        return RegistrySnapshot(version=digest, sections=sections, file_versions=file_versions)
+
+    async def _watch(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self.reload_async()
+            except Exception as e:
+                logger.exception(f'Registry watch failed: {e}', extra={'error_type': type(e).__name__})
+
+_registry: Optional[ConfigRegistry] = None
+
+def get_registry() -> ConfigRegistry:
+    """Process-wide registry backed by the bundled data files."""
+    global _registry
+    if _registry is None:
+        _registry = ConfigRegistry()
+    return _registry
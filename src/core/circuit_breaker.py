@@ -0,0 +1,193 @@
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Dict, Iterable, Optional
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the dependency's circuit is open."""
+
+    def __init__(self, name: str, retry_in: float = 0.0):
+        super().__init__(f'Circuit for {name} is open (next probe in {retry_in:.1f}s)')
+        self.name = name
+        self.retry_in = retry_in
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker with exponential half-open probing.
+
+    CLOSED: calls flow; outcomes are tracked over a sliding time window and
+    the circuit opens once enough calls fail. OPEN: calls are rejected until
+    the probe interval elapses. HALF_OPEN: a single probe call is let through;
+    success closes the circuit, failure re-opens it with a doubled interval.
+    """
+
+    def __init__(self,
+                 name: str,
+                 failure_threshold: float = 0.5,
+                 min_calls: int = 5,
+                 window: float = 60.0,
+                 base_probe_interval: float = 5.0,
+                 max_probe_interval: float = 300.0,
+                 probe_timeout: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.min_calls = min_calls
+        self.window = window
+        self.base_probe_interval = base_probe_interval
+        self.max_probe_interval = max_probe_interval
+        self.probe_timeout = probe_timeout
+        self.clock = clock
+
+        self.state = CircuitState.CLOSED
+        self.probe_interval = base_probe_interval
+        self.opened_at: Optional[float] = None
+        self.probe_started_at: Optional[float] = None
+
+        self._outcomes = deque()  # (timestamp, failed)
+        self._failures_in_window = 0
+
+        self.metrics_counters = {
+            'successes': 0,
+            'failures': 0,
+            'rejections': 0,
+            'opens': 0,
+            'probes': 0
+        }
+
+    def allow_request(self) -> bool:
+        """Whether a call to the dependency should be attempted now"""
+        now = self.clock()
+        if self.state == CircuitState.CLOSED:
+            return True
+
+        if self.state == CircuitState.OPEN and now >= self.opened_at + self.probe_interval:
+            self.state = CircuitState.HALF_OPEN
+            self.probe_started_at = None
+
+        if self.state == CircuitState.HALF_OPEN:
+            # One probe at a time; a probe whose outcome never came back is abandoned
+            if self.probe_started_at is None or now - self.probe_started_at >= self.probe_timeout:
+                self.probe_started_at = now
+                self.metrics_counters['probes'] += 1
+                return True
+
+        self.metrics_counters['rejections'] += 1
+        return False
+
+    def is_available(self) -> bool:
+        """Whether ``allow_request`` would let a call through now, without claiming the probe"""
+        now = self.clock()
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN:
+            return now >= self.opened_at + self.probe_interval
+        return self.probe_started_at is None or now - self.probe_started_at >= self.probe_timeout
+
+    def record_success(self) -> None:
+        self.metrics_counters['successes'] += 1
+        if self.state != CircuitState.CLOSED:
+            self._close()
+            return
+        self._record(failed=False)
+
+    def record_failure(self) -> None:
+        self.metrics_counters['failures'] += 1
+        if self.state == CircuitState.HALF_OPEN:
+            self.probe_interval = min(self.max_probe_interval, self.probe_interval * 2)
+            self._open()
+            return
+        if self.state == CircuitState.OPEN:
+            return
+
+        self._record(failed=True)
+        calls = len(self._outcomes)
+        if calls >= self.min_calls and self._failures_in_window / calls >= self.failure_threshold:
+            self._open()
+
+    def trip(self) -> None:
+        """Force the circuit open, e.g. on an error that is fatal for the dependency"""
+        if self.state != CircuitState.OPEN:
+            self._open()
+
+    def reset(self) -> None:
+        self._close()
+
+    def seconds_until_probe(self) -> float:
+        if self.state != CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self.opened_at + self.probe_interval - self.clock())
+
+    def metrics(self) -> Dict:
+        self._prune(self.clock())
+        calls = len(self._outcomes)
+        return {
+            'state': self.state.value,
+            'failure_rate': self._failures_in_window / calls if calls else 0.0,
+            'calls_in_window': calls,
+            'probe_interval': self.probe_interval,
+            'next_probe_in': self.seconds_until_probe(),
+            **self.metrics_counters
+        }
+
+    def _record(self, failed: bool) -> None:
+        now = self.clock()
+        self._prune(now)
+        self._outcomes.append((now, failed))
+        if failed:
+            self._failures_in_window += 1
+
+    def _prune(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > self.window:
+            _, failed = self._outcomes.popleft()
+            if failed:
+                self._failures_in_window -= 1
+
+    def _open(self) -> None:
+        self.state = CircuitState.OPEN
+        self.opened_at = self.clock()
+        self.probe_started_at = None
+        self.metrics_counters['opens'] += 1
+
+    def _close(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.probe_interval = self.base_probe_interval
+        self.opened_at = None
+        self.probe_started_at = None
+        self._outcomes.clear()
+        self._failures_in_window = 0
+
+class CircuitBreakerRegistry:
+    """Named circuit breakers, one per external dependency"""
+
+    DEPENDENCIES = ('x_api', 'brave', 'llm', 'embeddings')
+
+    def __init__(self, names: Iterable[str] = DEPENDENCIES, **breaker_kwargs):
+        self.breaker_kwargs = breaker_kwargs
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        for name in names:
+            self.get(name)
+
+    def get(self, name: str) -> CircuitBreaker:
+        if name not in self.breakers:
+            self.breakers[name] = CircuitBreaker(name, **self.breaker_kwargs)
+        return self.breakers[name]
+
+    def seconds_until_probe(self) -> float:
+        """Shortest wait until any open circuit may be probed"""
+        waits = [b.seconds_until_probe() for b in self.breakers.values()
+                 if b.state == CircuitState.OPEN]
+        return min(waits) if waits else 0.0
+
+    def metrics(self) -> Dict:
+        return {name: breaker.metrics() for name, breaker in self.breakers.items()}
+
+# Shared registry so every component reports against the same breakers
+circuit_breakers = CircuitBreakerRegistry()
+
+def get_breaker(name: str) -> CircuitBreaker:
+    return circuit_breakers.get(name)
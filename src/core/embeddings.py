@@ -1,6 +1,10 @@
 from typing import List, Dict, Any
 import numpy as np
 from langchain.embeddings import OpenAIEmbeddings
+from .circuit_breaker import get_breaker
+from .log_pipeline import get_logger
+
+logger = get_logger('embeddings')
 
 class EmbeddingProcessor:
     def __init__(self):
@@ -8,11 +12,17 @@ class EmbeddingProcessor:
         
     async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
         """Get embeddings for a list of texts."""
+        breaker = get_breaker('embeddings')
+        if not breaker.allow_request():
+            return [[0.0] * 1536] * len(texts)  # Circuit open, skip the call
+            
         try:
             embeddings = await self.embeddings.aembed_documents(texts)
+            breaker.record_success()
             return embeddings
         except Exception as e:
-            print(f"Error getting embeddings: {e}")
+            breaker.record_failure()
+            logger.error(f'Error getting embeddings: {e}', extra={'error_type': type(e).__name__})
             return [[0.0] * 1536] * len(texts)  # Return zero embeddings as fallback
             
     def calculate_cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
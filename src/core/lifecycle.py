@@ -0,0 +1,146 @@
+import time
+import signal
+import asyncio
+import inspect
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set
+from .log_pipeline import get_logger
+
+logger = get_logger('lifecycle')
+
+Hook = Callable[[], Any]
+
+async def _call(hook: Hook) -> None:
+    result = hook()
+    if inspect.isawaitable(result):
+        await result
+
+@dataclass
+class Component:
+    name: str
+    start: Optional[Hook] = None
+    drain: Optional[Hook] = None
+    stop: Optional[Hook] = None
+    drain_timeout: float = 10.0
+    stop_timeout: float = 5.0
+
+class LifecycleManager:
+    """Starts registered components in order and shuts them down in reverse.
+
+    Register components dependencies first. Shutdown runs in three phases:
+    every ``drain`` hook (stop taking work, finish what is queued), then
+    every ``stop`` hook (flush state to disk, release resources), then any
+    task still pending on the loop is cancelled. Drains share the overall
+    ``deadline``, so one stuck queue cannot hold the process up; stop hooks
+    always run, each under its own timeout, so state is flushed even when
+    draining ran out of time. Hooks may be sync or async. Call ``shutdown``
+    from the task that owns the process: tasks calling it are spared, every
+    other task still running is cancelled.
+    """
+
+    def __init__(self, deadline: float = 30.0):
+        self.deadline = deadline
+        self.components: List[Component] = []
+        self.shutdown_requested = asyncio.Event()
+        self.ready = asyncio.Event()  # Set once every component has started
+        self._started: List[Component] = []
+        self._shutdown: Optional[asyncio.Task] = None
+        self._waiters: Set[asyncio.Task] = set()
+
+    def register(self,
+                 name: str,
+                 start: Optional[Hook] = None,
+                 drain: Optional[Hook] = None,
+                 stop: Optional[Hook] = None,
+                 drain_timeout: float = 10.0,
+                 stop_timeout: float = 5.0) -> Component:
+        component = Component(name, start, drain, stop, drain_timeout, stop_timeout)
+        self.components.append(component)
+        return component
+
+    async def start(self) -> None:
+        """Start every component; if one fails, stop those already running and re-raise."""
+        for component in self.components:
+            try:
+                if component.start:
+                    await _call(component.start)
+            except Exception as e:
+                logger.exception(f'{component.name} failed to start: {e}', extra={'error_type': type(e).__name__})
+                await self.shutdown()
+                raise
+            self._started.append(component)
+            logger.debug(f'{component.name} started')
+        self.ready.set()
+
+    def install_signal_handlers(self, signals=(signal.SIGINT, signal.SIGTERM)) -> None:
+        """Route termination signals to ``request_shutdown`` on the running loop."""
+        loop = asyncio.get_running_loop()
+        for sig in signals:
+            try:
+                loop.add_signal_handler(sig, self.request_shutdown)
+            except (NotImplementedError, RuntimeError):
+                # Platforms without loop signal support
+                signal.signal(sig, lambda *_: loop.call_soon_threadsafe(self.request_shutdown))
+
+    def request_shutdown(self) -> None:
+        if not self.shutdown_requested.is_set():
+            logger.info('Shutdown requested')
+            self.shutdown_requested.set()
+
+    async def wait_for_shutdown(self) -> None:
+        await self.shutdown_requested.wait()
+
+    async def shutdown(self) -> Dict:
+        """Drain, stop and clean up; concurrent callers share one shutdown."""
+        self.shutdown_requested.set()
+        self.ready.clear()
+        # Callers wait on the shutdown and must not be cancelled as leftovers
+        self._waiters.add(asyncio.current_task())
+        if self._shutdown is None:
+            self._shutdown = asyncio.ensure_future(self._run_shutdown())
+        return await asyncio.shield(self._shutdown)
+
+    async def _run_shutdown(self) -> Dict:
+        started = time.monotonic()
+        remaining = lambda: max(0.0, self.deadline - (time.monotonic() - started))
+        report: Dict[str, Any] = {}
+        components = list(reversed(self._started))
+
+        for phase in ('drain', 'stop'):
+            for component in components:
+                hook = getattr(component, phase)
+                if hook is None:
+                    continue
+                if phase == 'drain':
+                    timeout = min(component.drain_timeout, remaining())
+                else:
+                    timeout = component.stop_timeout
+                report.setdefault(component.name, {})[phase] = await self._run_hook(component.name, phase, hook, timeout)
+        self._started = []
+
+        report['cancelled'] = await self._cancel_leftovers(max(1.0, remaining()))
+        report['duration'] = round(time.monotonic() - started, 3)
+        logger.info('Shutdown complete', extra={'report': report})
+        return report
+
+    async def _run_hook(self, name: str, phase: str, hook: Hook, timeout: float) -> str:
+        try:
+            await asyncio.wait_for(_call(hook), timeout=timeout)
+            return 'ok'
+        except asyncio.TimeoutError:
+            logger.warning(f'{name} {phase} timed out after {timeout:.1f}s')
+            return 'timeout'
+        except Exception as e:
+            logger.exception(f'{name} {phase} failed: {e}', extra={'error_type': type(e).__name__})
+            return 'error'
+
+    async def _cancel_leftovers(self, timeout: float) -> int:
+        spared = self._waiters | {asyncio.current_task()}
+        leftovers = [task for task in asyncio.all_tasks() if task not in spared and not task.done()]
+        for task in leftovers:
+            task.cancel()
+        if leftovers:
+            await asyncio.wait(leftovers, timeout=timeout)
+            logger.info(f'Cancelled {len(leftovers)} leftover tasks',
+                        extra={'tasks': [task.get_name() for task in leftovers]})
+        return len(leftovers)
@@ -0,0 +1,124 @@
+import os
+import json
+import queue
+import atexit
+import logging
+import logging.handlers
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+# Attributes every LogRecord has; anything else was passed via ``extra``
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+class JsonFormatter(logging.Formatter):
+    """Render records as one JSON object per line.
+
+    Structured fields passed through ``extra`` (component, latency_ms,
+    tweet_id, error_type, ...) become top-level keys.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'component': _component(record.name),
+            'message': record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        elif record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+class _StructuredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps ``extra`` fields intact for the JSON writer"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(vars(record))
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+def _component(logger_name: str) -> str:
+    return logger_name[len('gonzo.'):] if logger_name.startswith('gonzo.') else logger_name
+
+def get_logger(component: str) -> logging.Logger:
+    """Logger for a Gonzo component, e.g. get_logger('x_api')"""
+    return logging.getLogger(f'gonzo.{component}')
+
+def set_component_level(component: str, level) -> None:
+    """Change one component's log level at runtime"""
+    get_logger(component).setLevel(level)
+
+def parse_component_levels(spec: str) -> Dict[str, str]:
+    """Parse 'x_api=DEBUG,brave=WARNING' into a component -> level mapping"""
+    levels = {}
+    for item in filter(None, (part.strip() for part in spec.split(','))):
+        component, _, level = item.partition('=')
+        levels[component.strip()] = level.strip().upper()
+    return levels
+
+def configure_logging(log_path: str = 'gonzo_x.log',
+                      level=logging.INFO,
+                      component_levels: Optional[Dict[str, str]] = None,
+                      max_bytes: int = 10 * 1024 * 1024,
+                      backup_count: int = 5,
+                      console_level=logging.WARNING) -> logging.handlers.QueueListener:
+    """Route all logging through a queue to a background writer thread.
+
+    Callers only pay for a queue put; a QueueListener thread formats records
+    as JSON and writes them to a rotating file (plus warnings to the console).
+    Safe to call more than once - later calls return the running listener.
+    Per-component levels can also be set with GONZO_LOG_LEVELS.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_path, maxBytes=max_bytes, backupCount=backup_count
+    )
+    file_handler.setFormatter(JsonFormatter())
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(console_level)
+    console_handler.setFormatter(logging.Formatter('%(levelname)s [%(name)s] %(message)s'))
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.addHandler(_StructuredQueueHandler(log_queue))
+    root.setLevel(level)
+
+    levels = parse_component_levels(os.getenv('GONZO_LOG_LEVELS', ''))
+    levels.update(component_levels or {})
+    for component, component_level in levels.items():
+        set_component_level(component, component_level)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(shutdown_logging)
+    return _listener
+
+def shutdown_logging() -> None:
+    """Flush queued records to disk and stop the writer thread"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, _StructuredQueueHandler):
+            root.removeHandler(handler)
+    _listener = None
@@ -2,19 +2,26 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 import asyncio
 
-from ..evolution.knowledge_system import KnowledgeSystem
-from ..evolution.pattern_recognition import PatternRecognition
-from ..evolution.learning_system import LearningSystem
+from .log_pipeline import get_logger
+from .startup import LazySubsystem, is_loaded
+
+logger = get_logger('orchestrator')
+
+SUBSYSTEMS = ("knowledge", "pattern_recognition", "learning")
 
 class GonzoOrchestrator:
+    # Core systems; their SDKs are imported and clients built on first use
+    knowledge = LazySubsystem("..evolution.knowledge_system", "KnowledgeSystem", __package__)
+    pattern_recognition = LazySubsystem("..evolution.pattern_recognition", "PatternRecognition", __package__)
+    learning = LazySubsystem("..evolution.learning_system", "LearningSystem", __package__)
+    
     def __init__(self):
-        # Core systems
-        self.knowledge = KnowledgeSystem()
-        self.pattern_recognition = PatternRecognition()
-        self.learning = LearningSystem()
+        # Restored state for subsystems not built yet, applied when they are
+        self._deferred_state: Dict[str, Dict] = {}
         
-        # Queue for evolution events
+        # Queue for evolution events, drained by a single long-lived consumer
         self.evolution_queue = asyncio.Queue()
+        self._evolution_worker: Optional[asyncio.Task] = None
         
         # State tracking
         self.current_state = {
@@ -55,13 +62,13 @@ class GonzoOrchestrator:
                 "response": response
             })
             
-            # 5. Process evolution queue
-            asyncio.create_task(self._process_evolution_queue())
+            # 5. Make sure the evolution consumer is running
+            self.start()
             
             return response
             
         except Exception as e:
-            print(f"Error in process_input: {str(e)}")
+            logger.exception(f'Error in process_input: {str(e)}', extra={'error_type': type(e).__name__})
             raise
 
     async def _generate_integrated_response(self,
@@ -87,38 +94,86 @@ class GonzoOrchestrator:
         
         return response
 
+    def start(self) -> None:
+        """Start the evolution consumer (requires a running event loop)."""
+        if self._evolution_worker is None or self._evolution_worker.done():
+            self._evolution_worker = asyncio.create_task(self._process_evolution_queue())
+
+    async def drain(self) -> None:
+        """Wait until every queued evolution event has been learned from."""
+        if self._evolution_worker is not None:
+            await self.evolution_queue.join()
+
+    async def stop(self) -> None:
+        """Cancel the evolution consumer; unprocessed events are dropped."""
+        if self._evolution_worker is not None:
+            self._evolution_worker.cancel()
+            await asyncio.gather(self._evolution_worker, return_exceptions=True)
+            self._evolution_worker = None
+
+    def snapshot_state(self) -> Dict:
+        """Metrics and the state of every subsystem, for ``SnapshotManager``."""
+        state = {
+            "system_metrics": self.system_metrics,
+            "pending_learnings": self.current_state["pending_learnings"]
+        }
+        for name in SUBSYSTEMS:
+            # Saving must not build a subsystem nothing has used yet
+            if is_loaded(self, name):
+                state[name] = getattr(self, name).snapshot_state()
+            else:
+                state[name] = self._deferred_state.get(name, {})
+        return state
+
+    def restore_state(self, state: Dict) -> None:
+        self.system_metrics.update(state.get("system_metrics", {}))
+        self.current_state["pending_learnings"] = list(state.get("pending_learnings", []))
+        for name in SUBSYSTEMS:
+            if is_loaded(self, name):
+                getattr(self, name).restore_state(state.get(name, {}))
+            else:
+                self._deferred_state[name] = state.get(name, {})
+
+    def _on_subsystem_loaded(self, name: str, subsystem: Any) -> None:
+        if name in self._deferred_state:
+            subsystem.restore_state(self._deferred_state.pop(name))
+
     async def _process_evolution_queue(self) -> None:
         """Process queued evolution events."""
         try:
             while True:
                 evolution_event = await self.evolution_queue.get()
-                
-                # Update knowledge
-                await self.knowledge.learn_from_interaction(
-                    evolution_event["input"],
-                    evolution_event["response"]
-                )
-                
-                # Update pattern recognition
-                await self.pattern_recognition.evolve_understanding({
-                    "type": evolution_event["input"].get("type"),
-                    "patterns": evolution_event["patterns_found"],
-                    "success": evolution_event["response"].get("success")
-                })
-                
-                # Update learning system
-                await self.learning.learn_from_interaction(evolution_event)
-                
-                # Update metrics
-                self._update_metrics("evolution_processed")
-                
-                # Mark task as done
-                self.evolution_queue.task_done()
+                try:
+                    await self._evolve(evolution_event)
+                except Exception as e:
+                    # One bad event must not stop learning from the rest
+                    logger.exception(f'Error in evolution queue processing: {str(e)}', extra={'error_type': type(e).__name__})
+                finally:
+                    self.evolution_queue.task_done()
                 
         except asyncio.CancelledError:
-            print("Evolution queue processing cancelled")
-        except Exception as e:
-            print(f"Error in evolution queue processing: {str(e)}")
+            logger.info('Evolution queue processing cancelled')
+            raise
+
+    async def _evolve(self, evolution_event: Dict) -> None:
+        # Update knowledge
+        await self.knowledge.learn_from_interaction(
+            evolution_event["input"],
+            evolution_event["response"]
+        )
+        
+        # Update pattern recognition
+        await self.pattern_recognition.evolve_understanding({
+            "type": evolution_event["input"].get("type"),
+            "patterns": evolution_event["patterns_found"],
+            "success": evolution_event["response"].get("success")
+        })
+        
+        # Update learning system
+        await self.learning.learn_from_interaction(evolution_event)
+        
+        # Update metrics
+        self._update_metrics("evolution_processed")
 
     async def _craft_response(self, context: Dict) -> str:
         """Craft a response using Gonzo's personality and learned patterns."""
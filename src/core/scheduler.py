@@ -0,0 +1,207 @@
+import time
+import random
+import asyncio
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional
+from .log_pipeline import get_logger
+
+logger = get_logger('scheduler')
+
+class MissedRunPolicy(Enum):
+    """What to do when a job's slot passed while it was running or the process was stalled."""
+    SKIP = "skip"            # Drop missed slots and wait for the next one on the grid
+    COALESCE = "coalesce"    # Run once now, then restart the cadence from there
+    CATCH_UP = "catch_up"    # Run every missed slot back to back
+
+@dataclass
+class JobStats:
+    runs: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    missed: int = 0
+    total_duration: float = 0.0
+    last_duration: Optional[float] = None
+    last_error: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        return {
+            'runs': self.runs,
+            'failures': self.failures,
+            'timeouts': self.timeouts,
+            'missed': self.missed,
+            'avg_duration_ms': round(self.total_duration / self.runs * 1000, 1) if self.runs else None,
+            'last_duration_ms': round(self.last_duration * 1000, 1) if self.last_duration is not None else None,
+            'last_error': self.last_error
+        }
+
+@dataclass
+class Job:
+    """A periodic coroutine.
+
+    ``func`` may return a number of seconds to override the delay until its
+    next run, for workloads that know their own cadence (backoff, recovery
+    probes); otherwise it runs every ``interval`` seconds.
+    """
+    name: str
+    func: Callable[[], Awaitable[Any]]
+    interval: float
+    jitter: float = 0.0
+    missed: MissedRunPolicy = MissedRunPolicy.COALESCE
+    timeout: Optional[float] = None
+    next_run: float = 0.0
+    last_run_at: Optional[float] = None  # wall-clock time, so it means something after a restart
+    triggered: bool = False
+    stats: JobStats = field(default_factory=JobStats)
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+    wake: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+class JobScheduler:
+    """Runs independent periodic jobs, each on its own task and cadence.
+
+    A slow or failing job never delays another. Runs of one job never
+    overlap; when a run overruns its next slot the job's
+    ``MissedRunPolicy`` decides what happens. ``jitter`` adds up to that
+    many seconds to each wait so jobs sharing an interval spread out.
+
+    As a snapshot component it keeps each job's last run time, so a restart
+    does not reset long intervals: a daily job last run 23 hours ago runs in
+    an hour, not a day after the restart.
+    """
+
+    def __init__(self,
+                 clock: Callable[[], float] = time.monotonic,
+                 wall_clock: Callable[[], float] = time.time):
+        self.clock = clock
+        self.wall_clock = wall_clock
+        self.jobs: Dict[str, Job] = {}
+        self._started = False
+
+    def add_job(self,
+                name: str,
+                func: Callable[[], Awaitable[Any]],
+                interval: float,
+                jitter: float = 0.0,
+                missed: MissedRunPolicy = MissedRunPolicy.COALESCE,
+                run_immediately: bool = True,
+                timeout: Optional[float] = None) -> Job:
+        if name in self.jobs:
+            raise ValueError(f'Job {name!r} already scheduled')
+        job = Job(name, func, interval, jitter, missed, timeout)
+        job.next_run = self.clock() + (0.0 if run_immediately else interval)
+        self.jobs[name] = job
+        if self._started:
+            job.task = asyncio.create_task(self._run_job(job))
+        return job
+
+    async def remove_job(self, name: str) -> None:
+        job = self.jobs.pop(name, None)
+        if job and job.task:
+            job.task.cancel()
+            await asyncio.gather(job.task, return_exceptions=True)
+
+    def trigger(self, name: str) -> None:
+        """Run a job as soon as its current run, if any, finishes; its regular slots are unchanged."""
+        job = self.jobs[name]
+        job.triggered = True
+        job.wake.set()
+
+    def start(self) -> None:
+        self._started = True
+        for job in self.jobs.values():
+            if job.task is None:
+                job.task = asyncio.create_task(self._run_job(job))
+
+    async def stop(self) -> None:
+        """Cancel every job, including runs in progress."""
+        self._started = False
+        tasks = [job.task for job in self.jobs.values() if job.task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for job in self.jobs.values():
+            job.task = None
+
+    def stats(self) -> Dict[str, Dict]:
+        now = self.clock()
+        return {
+            name: {**job.stats.to_dict(), 'next_run_in': max(0.0, job.next_run - now)}
+            for name, job in self.jobs.items()
+        }
+
+    def snapshot_state(self) -> Dict[str, Any]:
+        return {'last_run_at': {
+            name: job.last_run_at for name, job in self.jobs.items() if job.last_run_at is not None
+        }}
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Bring each job's next run forward to one interval after its saved last run."""
+        now, wall_now = self.clock(), self.wall_clock()
+        for name, last_run_at in state.get('last_run_at', {}).items():
+            job = self.jobs.get(name)
+            if job is None:
+                continue
+            job.last_run_at = last_run_at
+            # Saved history only moves a run earlier; jobs that run at start still do
+            remaining = max(0.0, last_run_at + job.interval - wall_now)
+            job.next_run = min(job.next_run, now + remaining)
+
+    async def _run_job(self, job: Job) -> None:
+        while True:
+            delay = job.next_run - self.clock()
+            if delay > 0 and not job.triggered:
+                job.wake.clear()
+                try:
+                    await asyncio.wait_for(job.wake.wait(), timeout=delay + random.uniform(0, job.jitter))
+                except asyncio.TimeoutError:
+                    pass
+                if not job.triggered and job.next_run > self.clock():
+                    continue
+
+            early = job.triggered and job.next_run > self.clock()
+            job.triggered = False
+            slot = job.next_run
+            override = await self._execute(job)
+            now = self.clock()
+            if isinstance(override, (int, float)) and not isinstance(override, bool):
+                job.next_run = now + max(0.0, override)
+            elif not early:
+                job.next_run = self._next_slot(job, slot, now)
+
+    async def _execute(self, job: Job) -> Any:
+        started = self.clock()
+        try:
+            if job.timeout:
+                return await asyncio.wait_for(job.func(), timeout=job.timeout)
+            return await job.func()
+        except asyncio.TimeoutError:
+            job.stats.timeouts += 1
+            job.stats.last_error = f'Timed out after {job.timeout}s'
+            logger.warning(f'Job {job.name} timed out after {job.timeout}s')
+        except Exception as e:
+            job.stats.failures += 1
+            job.stats.last_error = str(e)
+            logger.exception(f'Job {job.name} failed: {e}', extra={'error_type': type(e).__name__})
+        finally:
+            duration = self.clock() - started
+            job.last_run_at = self.wall_clock()
+            job.stats.runs += 1
+            job.stats.total_duration += duration
+            job.stats.last_duration = duration
+            logger.debug(f'Job {job.name} ran', extra={'latency_ms': round(duration * 1000, 1)})
+        return None
+
+    def _next_slot(self, job: Job, slot: float, now: float) -> float:
+        due = slot + job.interval
+        if due > now:
+            return due
+
+        missed = int((now - due) // job.interval) + 1
+        if job.missed is MissedRunPolicy.CATCH_UP:
+            return due
+        if job.missed is MissedRunPolicy.SKIP:
+            job.stats.missed += missed
+            return due + missed * job.interval
+        # COALESCE: every missed slot collapses into one run now
+        job.stats.missed += missed - 1
+        return now
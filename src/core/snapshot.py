@@ -0,0 +1,133 @@
+import os
+import json
+import time
+import zlib
+import struct
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+from .log_pipeline import get_logger
+
+logger = get_logger('snapshot')
+
+# Header: magic, format version, CRC32 of the compressed payload
+SNAPSHOT_MAGIC = b'GZSN'
+SNAPSHOT_VERSION = 1
+_HEADER = struct.Struct('>4sHI')
+
+class SnapshotError(ValueError):
+    """A snapshot that cannot be read: wrong magic or version, or corrupt."""
+
+def _encode_default(value: Any) -> Any:
+    if isinstance(value, (set, frozenset)):
+        return {'__set__': sorted(value, key=str)}
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    # Stringifying would restore as a different type; fail the save instead
+    raise TypeError(f'Cannot snapshot value of type {type(value).__name__}')
+
+def _decode_hook(value: Dict) -> Any:
+    if len(value) == 1:
+        if '__set__' in value:
+            return set(value['__set__'])
+        if '__datetime__' in value:
+            return datetime.fromisoformat(value['__datetime__'])
+    return value
+
+def encode_snapshot(state: Dict[str, Any]) -> bytes:
+    """Serialize ``state`` to the versioned binary format; sets and datetimes round-trip."""
+    payload = zlib.compress(
+        json.dumps(state, default=_encode_default, separators=(',', ':')).encode('utf-8'), 6
+    )
+    return _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, zlib.crc32(payload)) + payload
+
+def decode_snapshot(data: bytes) -> Dict[str, Any]:
+    if len(data) < _HEADER.size:
+        raise SnapshotError('Snapshot is truncated')
+    magic, version, crc = _HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError('Not a snapshot file')
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f'Unsupported snapshot version {version}')
+    payload = data[_HEADER.size:]
+    if zlib.crc32(payload) != crc:
+        raise SnapshotError('Snapshot checksum mismatch')
+    try:
+        return json.loads(zlib.decompress(payload).decode('utf-8'), object_hook=_decode_hook)
+    except (zlib.error, ValueError) as e:
+        raise SnapshotError(f'Snapshot payload unreadable: {e}') from e
+
+class SnapshotManager:
+    """Saves and restores in-memory state of registered components as one file.
+
+    Components expose ``snapshot_state() -> dict`` and
+    ``restore_state(dict)``. Saves are atomic, so a crash mid-write leaves the
+    previous snapshot in place. On restore a missing, corrupt or
+    other-version file means a cold start, and a component that fails to
+    restore is logged and left with its fresh state without affecting the rest.
+    """
+
+    def __init__(self, path: str = 'gonzo_state.snapshot', clock: Callable[[], float] = time.monotonic):
+        self.path = path
+        self.clock = clock
+        self.components: Dict[str, Any] = {}
+        self.metrics = {
+            'saves': 0,
+            'failures': 0,
+            'last_size': None,
+            'last_save_ms': None,
+            'last_restore_ms': None,
+            'restored': []
+        }
+
+    def register(self, name: str, component: Any) -> None:
+        self.components[name] = component
+
+    def save(self) -> Optional[int]:
+        """Write a snapshot of every component; returns its size in bytes, or None on failure."""
+        started = self.clock()
+        try:
+            state = {name: component.snapshot_state() for name, component in self.components.items()}
+            data = encode_snapshot({'saved_at': datetime.now(), 'components': state})
+            tmp_path = f'{self.path}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except (OSError, TypeError, ValueError) as e:
+            self.metrics['failures'] += 1
+            logger.error(f'Failed to save snapshot: {e}', extra={'error_type': type(e).__name__})
+            return None
+
+        self.metrics['saves'] += 1
+        self.metrics['last_size'] = len(data)
+        self.metrics['last_save_ms'] = round((self.clock() - started) * 1000, 1)
+        logger.debug('Snapshot saved', extra={'size': len(data), 'latency_ms': self.metrics['last_save_ms']})
+        return len(data)
+
+    def restore(self) -> Dict[str, bool]:
+        """Restore every component found in the snapshot; returns which ones succeeded."""
+        started = self.clock()
+        try:
+            with open(self.path, 'rb') as f:
+                snapshot = decode_snapshot(f.read())
+        except FileNotFoundError:
+            return {}
+        except (OSError, SnapshotError) as e:
+            logger.warning(f'Ignoring unreadable snapshot: {e}', extra={'error_type': type(e).__name__})
+            return {}
+
+        results = {}
+        saved = snapshot.get('components', {})
+        for name, component in self.components.items():
+            if name not in saved:
+                continue
+            try:
+                component.restore_state(saved[name])
+                results[name] = True
+            except Exception as e:
+                logger.exception(f'Failed to restore {name} from snapshot: {e}', extra={'error_type': type(e).__name__})
+                results[name] = False
+
+        self.metrics['restored'] = [name for name, ok in results.items() if ok]
+        self.metrics['last_restore_ms'] = round((self.clock() - started) * 1000, 1)
+        logger.info(f'Restored state saved at {snapshot.get("saved_at")}', extra={'components': results})
+        return results
@@ -0,0 +1,88 @@
+import time
+import importlib
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+from .log_pipeline import get_logger
+
+logger = get_logger('startup')
+
+class StartupProfiler:
+    """Records how long each component took to import and to construct.
+
+    ``measure`` times one phase of one component; ``mark_ready`` records
+    time from process start to readiness. Components built lazily after
+    readiness are still recorded, flagged ``deferred``.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.started_at = clock()
+        self.ready_at: Optional[float] = None
+        self.components: Dict[str, Dict[str, Any]] = {}
+
+    @contextmanager
+    def measure(self, component: str, phase: str) -> Iterator[None]:
+        started = self.clock()
+        try:
+            yield
+        finally:
+            record = self.components.setdefault(component, {'deferred': self.ready_at is not None})
+            record[f'{phase}_ms'] = round((self.clock() - started) * 1000, 1)
+
+    def mark_ready(self) -> float:
+        """Record readiness; returns seconds since the profiler was created."""
+        if self.ready_at is None:
+            self.ready_at = self.clock()
+            logger.info(f'Ready in {self.ready_at - self.started_at:.2f}s', extra={'startup': self.report()})
+        return self.ready_at - self.started_at
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            'time_to_ready_ms': round((self.ready_at - self.started_at) * 1000, 1) if self.ready_at is not None else None,
+            'components': {name: dict(record) for name, record in self.components.items()}
+        }
+
+_profiler: Optional[StartupProfiler] = None
+
+def get_profiler() -> StartupProfiler:
+    """Process-wide profiler, started on first use."""
+    global _profiler
+    if _profiler is None:
+        _profiler = StartupProfiler()
+    return _profiler
+
+class LazySubsystem:
+    """Class attribute that imports and constructs a subsystem on first access.
+
+    ``module`` may be relative to ``package``. The instance is cached in the
+    owner's ``__dict__``, so later lookups are plain attribute reads. An
+    owner defining ``_on_subsystem_loaded(name, subsystem)`` is told about
+    each one as it is built.
+    """
+
+    def __init__(self, module: str, cls: str, package: Optional[str] = None):
+        self.module = module
+        self.cls = cls
+        self.package = package
+        self.name = cls
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, owner: type) -> Any:
+        if obj is None:
+            return self
+        profiler = get_profiler()
+        with profiler.measure(self.cls, 'import'):
+            factory = getattr(importlib.import_module(self.module, self.package), self.cls)
+        with profiler.measure(self.cls, 'init'):
+            subsystem = factory()
+        obj.__dict__[self.name] = subsystem
+        hook = getattr(obj, '_on_subsystem_loaded', None)
+        if hook:
+            hook(self.name, subsystem)
+        return subsystem
+
+def is_loaded(obj: Any, name: str) -> bool:
+    """Whether the ``LazySubsystem`` attribute ``name`` has been built on ``obj``."""
+    return name in vars(obj)
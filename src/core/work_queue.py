@@ -0,0 +1,173 @@
+import time
+import heapq
+import asyncio
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from .log_pipeline import get_logger
+
+logger = get_logger('work_queue')
+
+Handler = Callable[[Any], Awaitable[Any]]
+
+@dataclass
+class WorkItem:
+    kind: str
+    payload: Any
+    priority: float
+    enqueued_at: float
+    seq: int = 0
+
+@dataclass(order=True)
+class _Entry:
+    key: Tuple[float, int]
+    item: WorkItem = field(compare=False)
+
+class WorkQueue:
+    """Priority queue of mixed work drained by a bounded pool of workers.
+
+    Items of each kind wait in their own heap, and each kind has a handler
+    and a concurrency cap. A free worker takes the highest-priority item
+    among the kinds below their cap. Waiting items gain ``aging_rate``
+    priority per second so low-priority work is never starved. Aging is
+    the same for everyone, so ordering by ``priority - aging_rate *
+    enqueued_at`` is fixed at insert time and the heaps never re-sort.
+    """
+
+    def __init__(self,
+                 max_workers: int = 4,
+                 aging_rate: float = 1.0 / 60,
+                 max_size: int = 1000,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_workers = max_workers
+        self.aging_rate = aging_rate
+        self.max_size = max_size
+        self.clock = clock
+
+        self._handlers: Dict[str, Handler] = {}
+        self._caps: Dict[str, int] = {}
+        self._heaps: Dict[str, List[_Entry]] = defaultdict(list)
+        self._running: Counter = Counter()
+        self._in_flight: Dict[int, WorkItem] = {}
+        self._seq = 0
+
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._workers: List[asyncio.Task] = []
+
+        self.stats = {'enqueued': 0, 'completed': 0, 'failed': 0, 'dropped': 0}
+
+    def register(self, kind: str, handler: Handler, max_concurrent: Optional[int] = None) -> None:
+        """Handle items of ``kind`` with ``handler``, at most ``max_concurrent`` at once."""
+        self._handlers[kind] = handler
+        self._caps[kind] = max_concurrent or self.max_workers
+
+    def put(self, kind: str, payload: Any, priority: float) -> bool:
+        """Queue an item; higher priority runs sooner. Returns False if it was dropped."""
+        if kind not in self._handlers:
+            raise ValueError(f'No handler registered for {kind!r}')
+
+        now = self.clock()
+        item = WorkItem(kind, payload, priority, now, self._seq)
+        self._seq += 1
+
+        entry = _Entry((-(priority - self.aging_rate * now), item.seq), item)
+        if len(self) >= self.max_size:
+            # Full: the least urgent item, possibly the new one, is dropped
+            heap, lowest = max(((h, max(h)) for h in self._heaps.values() if h), key=lambda pair: pair[1])
+            self.stats['dropped'] += 1
+            if lowest < entry:
+                return False
+            heap.remove(lowest)
+            heapq.heapify(heap)
+
+        heapq.heappush(self._heaps[kind], entry)
+        self.stats['enqueued'] += 1
+        self._idle.clear()
+        self._wakeup.set()
+        return True
+
+    def dump(self) -> List[Dict]:
+        """Queued and in-flight items, most urgent first, for ``load`` after a restart."""
+        now = self.clock()
+        entries = sorted(entry for heap in self._heaps.values() for entry in heap)
+        items = list(self._in_flight.values()) + [entry.item for entry in entries]
+        return [
+            {
+                'kind': item.kind,
+                'payload': item.payload,
+                # Aging earned so far carries over
+                'priority': item.priority + self.aging_rate * (now - item.enqueued_at)
+            }
+            for item in items
+        ]
+
+    def load(self, items: List[Dict]) -> int:
+        """Re-queue items from ``dump``; returns how many were accepted."""
+        return sum(
+            self.put(item['kind'], item['payload'], item['priority'])
+            for item in items if item.get('kind') in self._handlers
+        )
+
+    def __len__(self) -> int:
+        return sum(len(heap) for heap in self._heaps.values())
+
+    def start(self) -> None:
+        """Spawn the worker pool."""
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.max_workers)]
+
+    async def join(self) -> None:
+        """Wait until every queued item has been handled."""
+        await self._idle.wait()
+
+    async def stop(self) -> None:
+        """Cancel the workers; ``dump`` first to keep what is still queued."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def metrics(self) -> Dict:
+        return {
+            'queued': {kind: len(heap) for kind, heap in self._heaps.items() if heap},
+            'running': {kind: count for kind, count in self._running.items() if count},
+            **self.stats
+        }
+
+    def _take(self) -> Optional[WorkItem]:
+        best = None
+        for kind, heap in self._heaps.items():
+            if heap and self._running[kind] < self._caps[kind] and (best is None or heap[0] < best[0]):
+                best = heap
+        if best is None:
+            return None
+        item = heapq.heappop(best).item
+        self._running[item.kind] += 1
+        self._in_flight[item.seq] = item
+        return item
+
+    async def _worker(self) -> None:
+        while True:
+            item = self._take()
+            if item is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            waited = self.clock() - item.enqueued_at
+            try:
+                await self._handlers[item.kind](item.payload)
+                self.stats['completed'] += 1
+            except Exception as e:
+                self.stats['failed'] += 1
+                logger.exception(f'{item.kind} work item failed: {e}', extra={'error_type': type(e).__name__})
+            finally:
+                self._running[item.kind] -= 1
+                del self._in_flight[item.seq]
+                logger.debug(f'{item.kind} work item done', extra={'waited_s': round(waited, 1)})
+                # A finished item frees a cap slot another worker may be waiting on
+                self._wakeup.set()
+                if not len(self) and not sum(self._running.values()):
+                    self._idle.set()
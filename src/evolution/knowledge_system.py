@@ -5,6 +5,9 @@ from openai import OpenAI
 from langchain_chroma import Chroma
 from langchain.schema import Document
 from langchain.memory import ConversationBufferMemory
+from ..core.log_pipeline import get_logger
+
+logger = get_logger('knowledge')
 
 class KnowledgeSystem:
     def __init__(self):
@@ -85,7 +88,7 @@ class KnowledgeSystem:
             await self._prune_outdated_knowledge()
             
         except Exception as e:
-            print(f"Error in learn_from_interaction: {str(e)}")
+            logger.error(f'Error in learn_from_interaction: {str(e)}', extra={'error_type': type(e).__name__})
     
     async def get_relevant_knowledge(self, 
                                    context: Dict,
@@ -115,7 +118,7 @@ class KnowledgeSystem:
             return confident_knowledge
             
         except Exception as e:
-            print(f"Error in get_relevant_knowledge: {str(e)}")
+            logger.error(f'Error in get_relevant_knowledge: {str(e)}', extra={'error_type': type(e).__name__})
             return {}
 
     async def _update_patterns(self, interaction: Dict) -> None:
@@ -154,6 +157,19 @@ class KnowledgeSystem:
             )
             self.confidence_scores["predictions"][prediction_id] = new_confidence
 
+    def snapshot_state(self) -> Dict:
+        return {
+            "confidence_scores": self.confidence_scores,
+            "observed_patterns": self.observed_patterns
+        }
+
+    def restore_state(self, state: Dict) -> None:
+        for kind, scores in state.get("confidence_scores", {}).items():
+            self.confidence_scores.setdefault(kind, {}).update(scores)
+        for kind, patterns in state.get("observed_patterns", {}).items():
+            if kind in self.observed_patterns:
+                self.observed_patterns[kind].update(patterns)
+
     def _calculate_new_confidence(self,
                                 current: float,
                                 engagement: float,
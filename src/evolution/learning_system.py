@@ -48,6 +48,18 @@ class LearningSystem:
         # Check for evolution triggers
         await self._check_evolution_triggers()
     
+    def snapshot_state(self) -> Dict:
+        return {
+            "learning_metrics": self.learning_metrics,
+            "evolution_history": self.evolution_history,
+            "current_evolution_stage": self.current_evolution_stage
+        }
+
+    def restore_state(self, state: Dict) -> None:
+        self.learning_metrics.update(state.get("learning_metrics", {}))
+        self.evolution_history = list(state.get("evolution_history", []))
+        self.current_evolution_stage = state.get("current_evolution_stage", len(self.evolution_history))
+    
     async def _check_evolution_triggers(self) -> None:
         """Check if conditions are met for system evolution."""
         total_interactions = self.learning_metrics["total_interactions"]
@@ -3,6 +3,10 @@ from datetime import datetime
 from langchain_anthropic import ChatAnthropic
 from langchain.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnablePassthrough
+from ..core.circuit_breaker import get_breaker, CircuitOpenError
+from ..core.log_pipeline import get_logger
+
+logger = get_logger('patterns')
 
 class PatternRecognition:
     def __init__(self):
@@ -25,23 +29,33 @@ class PatternRecognition:
             }
         }
         
-        # Initialize analysis chains
-        self.analysis_chains = {
-            "general": self._create_analysis_chain(),
-            "manipulation": self._create_manipulation_chain(),
-            "corporate_tactics": self._create_tactics_chain(),
-            "resistance": self._create_resistance_chain()
+        # Analysis chains are built the first time each type is analyzed
+        self._chain_factories = {
+            "general": self._create_analysis_chain,
+            "manipulation": self._create_manipulation_chain,
+            "corporate_tactics": self._create_tactics_chain,
+            "resistance": self._create_resistance_chain
         }
+        self.analysis_chains = {}
 
     async def analyze_pattern(self, content: str, pattern_type: str = "general") -> Dict:
         """Analyze content for patterns of specified type."""
-        chain = self.analysis_chains.get(pattern_type, self.analysis_chains["general"])
+        chain = self._get_chain(pattern_type)
         pattern_data = self.pattern_types.get(pattern_type, self.pattern_types["manipulation"])
         
-        analysis = await chain.ainvoke({
-            "content": content,
-            "known_patterns": list(pattern_data["confirmed_patterns"])
-        })
+        breaker = get_breaker('llm')
+        if not breaker.allow_request():
+            raise CircuitOpenError('llm', breaker.seconds_until_probe())
+        
+        try:
+            analysis = await chain.ainvoke({
+                "content": content,
+                "known_patterns": list(pattern_data["confirmed_patterns"])
+            })
+        except Exception:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
         
         # Update pattern database with new findings
         await self._update_patterns(pattern_type, analysis)
@@ -87,7 +101,14 @@ class PatternRecognition:
                         evolution_tracking[pattern]["last_update"] = datetime.now().isoformat()
             
         except Exception as e:
-            print(f"Error in evolve_understanding: {str(e)}")
+            logger.error(f'Error in evolve_understanding: {str(e)}', extra={'error_type': type(e).__name__})
+
+    def _get_chain(self, pattern_type: str):
+        if pattern_type not in self._chain_factories:
+            pattern_type = "general"
+        if pattern_type not in self.analysis_chains:
+            self.analysis_chains[pattern_type] = self._chain_factories[pattern_type]()
+        return self.analysis_chains[pattern_type]
 
     def _create_analysis_chain(self):
         """Create general pattern analysis chain."""
@@ -156,6 +177,19 @@ Assess effectiveness and suggest improvements."""
             if self._pattern_frequency(pattern) > 3:
                 self.pattern_types[pattern_type]["confirmed_patterns"].add(pattern)
 
+    def snapshot_state(self) -> Dict:
+        return {"pattern_types": self.pattern_types}
+
+    def restore_state(self, state: Dict) -> None:
+        """Merge saved patterns into the known pattern types; unknown types are dropped."""
+        for pattern_type, saved in state.get("pattern_types", {}).items():
+            current = self.pattern_types.get(pattern_type)
+            if current is None:
+                continue
+            for key, value in saved.items():
+                if key in current:
+                    current[key].update(value)
+
     def _pattern_frequency(self, pattern: str) -> int:
         """Track how often a pattern has been observed."""
         frequency = 0
@@ -1,10 +1,15 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from src.core.log_pipeline import get_logger
+from src.intelligence.brave_client import BraveClient, get_brave_client
+
+logger = get_logger('brave')
 
 class BraveSearcher:
-    def __init__(self):
+    def __init__(self, client: Optional[BraveClient] = None):
+        self.client = client or get_brave_client()
         self.last_search_time = None
 
-    def search_topics(self, topics: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    async def search_topics(self, topics: List[str]) -> Dict[str, List[Dict[str, Any]]]:
         """Search for multiple topics using Brave search.
 
         Args:
@@ -16,14 +21,14 @@ class BraveSearcher:
         results = {}
         for topic in topics:
             try:
-                search_results = self._search_topic(topic)
+                search_results = await self._search_topic(topic)
                 results[topic] = search_results
             except Exception as e:
-                print(f'Error searching topic {topic}: {str(e)}')
+                logger.error(f'Error searching topic {topic}: {str(e)}', extra={'error_type': type(e).__name__})
                 results[topic] = []
         return results
 
-    def _search_topic(self, topic: str) -> List[Dict[str, Any]]:
+    async def _search_topic(self, topic: str) -> List[Dict[str, Any]]:
         """Search for a single topic using Brave search.
 
         Args:
@@ -36,18 +41,18 @@ class BraveSearcher:
             # Add your search query modifiers here
             query = f'"{topic}" news articles recent developments'
             
-            # Use the provided brave_web_search function
-            response = brave_web_search(
-                query=query,
-                count=10  # Adjust as needed
+            response = await self.client.search(
+                query,
+                count=10,  # Adjust as needed
+                workload='monitoring'
             )
             
             # Process and return the results
-            if not response or 'web' not in response:
+            if not response or 'results' not in response:
                 return []
                 
             processed_results = []
-            for result in response.get('web', []):
+            for result in response.get('results', []):
                 processed_results.append({
                     'title': result.get('title', ''),
                     'url': result.get('url', ''),
@@ -58,5 +63,5 @@ class BraveSearcher:
             return processed_results
             
         except Exception as e:
-            print(f'Error in _search_topic for {topic}: {str(e)}')
+            logger.error(f'Error in _search_topic for {topic}: {str(e)}', extra={'error_type': type(e).__name__})
             return []
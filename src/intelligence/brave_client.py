@@ -0,0 +1,257 @@
+import os
+import time
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+import aiohttp
+from ..core.circuit_breaker import CircuitOpenError, get_breaker
+from ..core.log_pipeline import get_logger
+from .brave_quota import QuotaManager
+
+logger = get_logger('brave')
+
+BRAVE_API_URL = 'https://api.search.brave.com/res/v1/web/search'
+
+# Optional in-process replacement for HTTP: params -> (status, JSON body)
+Transport = Callable[[Dict], Awaitable[Tuple[int, Any]]]
+
+# Reserved shares of the Brave quota for the shared client
+DEFAULT_QUOTA_SHARES = {
+    'monitoring': 0.4,   # Topic monitoring loop
+    'responder': 0.4     # Intel for mention responses
+}
+
+class BraveSearchError(Exception):
+    """Raised when the Brave API answers with an error status."""
+
+    def __init__(self, status: int, message: str = ''):
+        super().__init__(f'Brave search failed with status {status}: {message}')
+        self.status = status
+
+class TTLCache:
+    """Bounded LRU cache whose entries also expire after ``ttl`` seconds.
+
+    Every entry shares the same TTL, so insertion order is expiry order:
+    expired entries are dropped from the front of a second ordered index,
+    keeping both expiry and eviction O(1) amortized.
+    """
+
+    def __init__(self, max_size: int = 512, ttl: float = 3600.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()       # LRU order
+        self._expiry: "OrderedDict[Hashable, float]" = OrderedDict()     # insertion order
+        self.stats = {'evictions': 0, 'expirations': 0}
+
+    def get(self, key: Hashable, max_age: Optional[float] = None) -> Optional[Any]:
+        """Cached value, or None; ``max_age`` also rejects entries stored longer ago than that"""
+        self._purge_expired()
+        if key not in self._entries:
+            return None
+        if max_age is not None and self.clock() - (self._expiry[key] - self.ttl) > max_age:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._expiry.pop(key, None)
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        self._expiry[key] = self.clock() + self.ttl
+        self._purge_expired()
+
+        while len(self._entries) > self.max_size:
+            oldest, _ = self._entries.popitem(last=False)
+            del self._expiry[oldest]
+            self.stats['evictions'] += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _purge_expired(self) -> None:
+        now = self.clock()
+        while self._expiry:
+            key, expires_at = next(iter(self._expiry.items()))
+            if expires_at > now:
+                break
+            self._expiry.popitem(last=False)
+            del self._entries[key]
+            self.stats['expirations'] += 1
+
+class BraveClient:
+    """Single async entry point for Brave web search.
+
+    Responses are cached in a bounded LRU+TTL cache, concurrent identical
+    queries share one in-flight request, and HTTP connections are pooled
+    in one aiohttp session. Only requests that reach the network are
+    charged to ``quota``. Results are normalized to
+    ``{'query': ..., 'results': [...]}``.
+
+    Point ``base_url`` (or ``BRAVE_API_URL``) at a stand-in server, or pass a
+    ``transport`` to skip HTTP entirely, e.g. ``src.testing.fake_brave``.
+    """
+
+    def __init__(self,
+                 api_key: Optional[str] = None,
+                 base_url: Optional[str] = None,
+                 cache_size: int = 512,
+                 cache_ttl: float = 3600.0,
+                 max_connections: int = 10,
+                 timeout: float = 15.0,
+                 quota: Optional[QuotaManager] = None,
+                 transport: Optional[Transport] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.api_key = api_key or os.getenv('BRAVE_API_KEY')
+        self.base_url = base_url or os.getenv('BRAVE_API_URL', BRAVE_API_URL)
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.quota = quota
+        self.transport = transport
+
+        self.cache = TTLCache(cache_size, cache_ttl, clock)
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.stats = {'requests': 0, 'hits': 0, 'misses': 0, 'coalesced': 0, 'errors': 0}
+
+    async def search(self,
+                     query: str,
+                     count: int = 10,
+                     workload: str = 'default',
+                     max_age: Optional[float] = None,
+                     **params) -> Dict:
+        """Search Brave, serving repeats from cache and joining identical in-flight queries.
+
+        ``workload`` names the quota share a network request is charged to.
+        ``max_age`` limits how old a cached response may be; 0 always fetches
+        (the fresh response is still cached for other callers).
+        """
+        key = (query, count, tuple(sorted(params.items())))
+        self.stats['requests'] += 1
+
+        cached = self.cache.get(key, max_age)
+        if cached is not None:
+            self.stats['hits'] += 1
+            return self._copy(cached)
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats['coalesced'] += 1
+        else:
+            self.stats['misses'] += 1
+            task = asyncio.ensure_future(self._fetch(key, query, count, workload, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one cancelled caller does not abort the request for the others
+        return self._copy(await asyncio.shield(task))
+
+    def metrics(self) -> Dict:
+        lookups = self.stats['hits'] + self.stats['misses'] + self.stats['coalesced']
+        return {
+            'hit_rate': (self.stats['hits'] + self.stats['coalesced']) / lookups if lookups else 0.0,
+            'cache_size': len(self.cache),
+            'in_flight': len(self._inflight),
+            'quota': self.quota.metrics() if self.quota else None,
+            **self.cache.stats,
+            **self.stats
+        }
+
+    async def close(self) -> None:
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _fetch(self, key: Tuple, query: str, count: int, workload: str, params: Dict) -> Dict:
+        # Only a request that will be sent is charged to the quota
+        breaker = get_breaker('brave')
+        if not breaker.allow_request():
+            raise CircuitOpenError('brave', breaker.seconds_until_probe())
+
+        if self.quota:
+            await self.quota.acquire(workload)
+
+        started = time.monotonic()
+        try:
+            status, data = await self._request({'q': query, 'count': count, **params})
+            if status == 429 or status >= 500:
+                breaker.record_failure()
+                raise BraveSearchError(status, str(data))
+            breaker.record_success()
+            if status >= 400:
+                raise BraveSearchError(status, str(data))
+        except BraveSearchError:
+            self.stats['errors'] += 1
+            raise
+        except Exception as e:
+            self.stats['errors'] += 1
+            breaker.record_failure()
+            logger.error(f'Brave request failed: {e}', extra={'error_type': type(e).__name__})
+            raise
+
+        logger.debug('Brave search complete', extra={
+            'query': query, 'latency_ms': round((time.monotonic() - started) * 1000, 1)
+        })
+        result = self._normalize(query, data)
+        self.cache.set(key, result)
+        return result
+
+    async def _request(self, params: Dict) -> Tuple[int, Any]:
+        if self.transport:
+            return await self.transport(params)
+
+        session = self._get_session()
+        async with session.get(
+            self.base_url,
+            params=params,
+            headers={
+                'Accept': 'application/json',
+                'X-Subscription-Token': self.api_key or ''
+            }
+        ) as response:
+            if response.status >= 400:
+                return response.status, await response.text()
+            return response.status, await response.json()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        # Sessions are bound to the loop that created them
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session_loop = loop
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    @staticmethod
+    def _copy(result: Dict) -> Dict:
+        """Give each caller its own copy; the cached response is shared by everyone"""
+        return {**result, 'results': [dict(item) for item in result['results']]}
+
+    def _normalize(self, query: str, data: Dict) -> Dict:
+        results = []
+        for item in (data.get('web') or {}).get('results', []):
+            results.append({
+                'title': item.get('title', ''),
+                'url': item.get('url', ''),
+                'description': item.get('description', ''),
+                'age': item.get('age', ''),
+                'published_time': item.get('page_age', ''),
+                'type': item.get('type'),
+                'score': item.get('score')
+            })
+        return {'query': query, 'results': results}
+
+_client: Optional[BraveClient] = None
+
+def get_brave_client() -> BraveClient:
+    """Process-wide Brave client shared by every search consumer."""
+    global _client
+    if _client is None:
+        _client = BraveClient(quota=QuotaManager(shares=DEFAULT_QUOTA_SHARES))
+    return _client
@@ -1,75 +1,95 @@
 from typing import Dict, List, Optional
 from datetime import datetime
 import asyncio
+from ..core.log_pipeline import get_logger
+from .search_executor import SearchExecutor
+from .brave_client import BraveClient, get_brave_client
+from .dedup import NearDuplicateDetector
+from ..analysis.keyword_matcher import KeywordMatcher
+from ..config.registry import ConfigRegistry, RegistrySnapshot, get_registry
+
+logger = get_logger('brave')
+
+# Key indicators that increase relevance
+RELEVANCE_MATCHER = KeywordMatcher(
+    {
+        "high": [
+            "privacy", "surveillance", "control", "regulation",
+            "corporate", "monopoly", "resistance", "freedom"
+        ],
+        "medium": [
+            "blockchain", "cryptocurrency", "defi", "web3",
+            "decentralized", "governance"
+        ],
+        "low": [
+            "technology", "digital", "future", "development"
+        ]
+    },
+    weights={"high": 0.3, "medium": 0.2, "low": 0.1}
+)
 
 class BraveIntelligence:
-    def __init__(self):
-        self.search_categories = {
-            "crypto": {
-                "queries": [
-                    "cryptocurrency regulation news",
-                    "defi governance proposals",
-                    "crypto privacy developments",
-                    "blockchain censorship resistance",
-                    "web3 corporate adoption risks"
-                ],
-                "relevance_threshold": 0.7
-            },
-            "corporate_control": {
-                "queries": [
-                    "big tech surveillance",
-                    "corporate data collection",
-                    "privacy violation news",
-                    "digital rights erosion",
-                    "tech company merger monopoly"
-                ],
-                "relevance_threshold": 0.8
-            },
-            "resistance": {
-                "queries": [
-                    "decentralization movement",
-                    "privacy tech advancement",
-                    "anti-surveillance tools",
-                    "digital freedom projects",
-                    "data sovereignty initiatives"
-                ],
-                "relevance_threshold": 0.6
-            }
-        }
+    def __init__(self,
+                 executor: Optional[SearchExecutor] = None,
+                 client: Optional[BraveClient] = None,
+                 registry: Optional[ConfigRegistry] = None):
+        self.client = client or get_brave_client()
+        self.registry = registry or get_registry()
+        self._on_registry_change(self.registry.snapshot)
+        self.registry.subscribe(self._on_registry_change)
+
+        # Queries from every category share one concurrency limit and minute budget
+        self.executor = executor or SearchExecutor(
+            self._execute_brave_search,
+            max_concurrent=5,
+            per_minute=30
+        )
+
+    def _on_registry_change(self, snapshot: RegistrySnapshot) -> None:
+        self.search_categories = snapshot.sections["search_categories"]
+        self.registry_version = snapshot.version
 
     async def gather_intel(self) -> Dict:
         """Gather intelligence from Brave Search across all categories."""
-        intel_results = {}
+        # A reload mid-run must not change the categories under this pass
+        search_categories = self.search_categories
+        intel_results = {category: [] for category in search_categories}
+        # The same story comes back from several queries; each pass is a full
+        # snapshot, so stories from earlier passes are kept (the launcher
+        # drops findings it has already acted on)
+        dedup = NearDuplicateDetector()
+        queries = [
+            (category, query)
+            for category, config in search_categories.items()
+            for query in config["queries"]
+        ]
         
-        for category, config in self.search_categories.items():
-            category_results = []
-            for query in config["queries"]:
-                results = await self._execute_brave_search(query)
-                filtered_results = self._filter_results(
-                    results, 
-                    config["relevance_threshold"]
-                )
-                category_results.extend(filtered_results)
-            intel_results[category] = category_results
+        # Aggregate each category as its searches complete
+        async for category, results in self.executor.stream(queries):
+            intel_results[category].extend(dedup.filter(self._filter_results(
+                results,
+                search_categories[category]["relevance_threshold"]
+            )))
         
+        logger.info('Brave intel gathered', extra={'dedup': dedup.metrics()})
         return self._analyze_intel(intel_results)
 
-    async def _execute_brave_search(self, query: str) -> Dict:
+    async def _execute_brave_search(self, query: str) -> List[Dict]:
         """Execute a search using Brave's API."""
         try:
-            # Use the brave_web_search function
             results = await self._brave_web_search(query)
             return self._parse_search_results(results)
         except Exception as e:
-            print(f"Error in Brave search: {e}")
-            return {"results": [], "error": str(e)}
+            logger.error(f'Error in Brave search: {e}', extra={'error_type': type(e).__name__})
+            return []
 
     async def _brave_web_search(self, query: str) -> Dict:
         """Wrapper for Brave search API call."""
-        return await self._call_brave_api({
-            "query": query,
-            "count": 10  # Limit to top 10 results per query
-        })
+        return await self.client.search(
+            query,
+            count=10,  # Limit to top 10 results per query
+            workload='responder'
+        )
 
     def _parse_search_results(self, raw_results: Dict) -> List[Dict]:
         """Parse and structure the raw search results."""
@@ -86,36 +106,10 @@ class BraveIntelligence:
 
     def _calculate_initial_relevance(self, result: Dict) -> float:
         """Calculate initial relevance score for a search result."""
-        score = 0.0
-        content = (f"{result.get('title', '')} {result.get('description', '')}").lower()
-        
-        # Key indicators that increase relevance
-        indicators = {
-            "high": [
-                "privacy", "surveillance", "control", "regulation",
-                "corporate", "monopoly", "resistance", "freedom"
-            ],
-            "medium": [
-                "blockchain", "cryptocurrency", "defi", "web3",
-                "decentralized", "governance"
-            ],
-            "low": [
-                "technology", "digital", "future", "development"
-            ]
-        }
+        content = f"{result.get('title', '')} {result.get('description', '')}"
         
-        # Calculate score based on indicators
-        for indicator in indicators["high"]:
-            if indicator in content:
-                score += 0.3
-        for indicator in indicators["medium"]:
-            if indicator in content:
-                score += 0.2
-        for indicator in indicators["low"]:
-            if indicator in content:
-                score += 0.1
-                
-        return min(1.0, score)
+        # Each high/medium/low indicator present adds its weight
+        return min(1.0, RELEVANCE_MATCHER.keyword_score(content))
 
     def _filter_results(self, results: List[Dict], threshold: float) -> List[Dict]:
         """Filter results based on relevance threshold."""
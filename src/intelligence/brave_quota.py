@@ -0,0 +1,162 @@
+import os
+import json
+import time
+import asyncio
+from collections import deque
+from datetime import date
+from typing import Callable, Deque, Dict, Optional
+from ..core.log_pipeline import get_logger
+
+logger = get_logger('brave')
+
+WINDOW = 60.0
+
+class QuotaExceededError(Exception):
+    """Raised when a workload has used up its share of the daily search budget."""
+
+class QuotaManager:
+    """Per-minute and daily Brave search quota with reserved workload shares.
+
+    The per-minute limit is a sliding-window log of call times, so a caller
+    that hits the limit sleeps exactly until the oldest call leaves the
+    window. Daily usage is persisted per workload. ``allocate`` reserves a
+    fraction of both budgets for a workload; whatever is not reserved forms
+    a pool any workload may draw from once its own reservation is used.
+    """
+
+    def __init__(self,
+                 per_minute: int = 10,
+                 daily: int = 1000,
+                 shares: Optional[Dict[str, float]] = None,
+                 state_path: Optional[str] = 'gonzo_brave_quota.json',
+                 clock: Callable[[], float] = time.monotonic):
+        self.per_minute = per_minute
+        self.daily = daily
+        self.state_path = state_path
+        self.clock = clock
+
+        self.shares: Dict[str, float] = {}
+        self._window: Dict[str, Deque[float]] = {}
+        self.day = date.today()
+        self.daily_used: Dict[str, int] = {}
+        self.stats = {'granted': 0, 'waits': 0, 'wait_seconds': 0.0, 'rejected': 0}
+
+        for workload, share in (shares or {}).items():
+            self.allocate(workload, share)
+        self._load_state()
+
+    def allocate(self, workload: str, share: float) -> None:
+        """Reserve ``share`` (0-1) of the minute and daily budgets for a workload."""
+        others = sum(s for w, s in self.shares.items() if w != workload)
+        if share < 0 or others + share > 1:
+            raise ValueError(f'Quota shares must stay within 0-1 (requested {share} for {workload})')
+        self.shares[workload] = share
+
+    async def acquire(self, workload: str = 'default') -> None:
+        """Wait for a per-minute slot, then charge one search to the workload."""
+        while True:
+            self._roll_day()
+            if not self._fits(self.daily_used, self.daily, workload):
+                self.stats['rejected'] += 1
+                raise QuotaExceededError(f'Daily Brave budget exhausted for {workload}')
+
+            now = self.clock()
+            self._expire(now)
+            counts = {w: len(log) for w, log in self._window.items()}
+            if self._fits(counts, self.per_minute, workload):
+                self._window.setdefault(workload, deque()).append(now)
+                self.daily_used[workload] = self.daily_used.get(workload, 0) + 1
+                self.stats['granted'] += 1
+                self._save_state()
+                return
+
+            wait = self.wait_time(workload)
+            self.stats['waits'] += 1
+            self.stats['wait_seconds'] += wait
+            await asyncio.sleep(wait)
+
+    def wait_time(self, workload: str = 'default') -> float:
+        """Seconds until the workload could get a per-minute slot."""
+        now = self.clock()
+        self._expire(now)
+        counts = {w: len(log) for w, log in self._window.items()}
+        if self._fits(counts, self.per_minute, workload):
+            return 0.0
+
+        # A slot frees when an entry counted against the shared pool expires,
+        # or when one of this workload's own reserved calls does
+        candidates = [
+            log[0] for w, log in self._window.items()
+            if log and len(log) > self._reserved(w, self.per_minute)
+        ]
+        own = self._window.get(workload)
+        if own and self._reserved(workload, self.per_minute):
+            candidates.append(own[0])
+        if not candidates:
+            return WINDOW
+        return max(0.0, min(candidates) + WINDOW - now)
+
+    def remaining_today(self, workload: str = 'default') -> int:
+        self._roll_day()
+        reserved_left = max(0, self._reserved(workload, self.daily) - self.daily_used.get(workload, 0))
+        return reserved_left + self._pool_left(self.daily_used, self.daily)
+
+    def metrics(self) -> Dict:
+        self._roll_day()
+        self._expire(self.clock())
+        return {
+            'minute_used': sum(len(log) for log in self._window.values()),
+            'per_minute': self.per_minute,
+            'daily_used': dict(self.daily_used),
+            'daily': self.daily,
+            'shares': dict(self.shares),
+            **self.stats
+        }
+
+    def _reserved(self, workload: str, limit: int) -> int:
+        return int(self.shares.get(workload, 0.0) * limit)
+
+    def _pool_left(self, counts: Dict[str, int], limit: int) -> int:
+        pool = limit - sum(self._reserved(w, limit) for w in self.shares)
+        pool_used = sum(max(0, n - self._reserved(w, limit)) for w, n in counts.items())
+        return pool - pool_used
+
+    def _fits(self, counts: Dict[str, int], limit: int, workload: str) -> bool:
+        if counts.get(workload, 0) < self._reserved(workload, limit):
+            return True
+        return self._pool_left(counts, limit) > 0
+
+    def _expire(self, now: float) -> None:
+        for log in self._window.values():
+            while log and now - log[0] >= WINDOW:
+                log.popleft()
+
+    def _roll_day(self) -> None:
+        today = date.today()
+        if today != self.day:
+            self.day = today
+            self.daily_used = {}
+            self._save_state()
+
+    def _save_state(self) -> None:
+        """Persist daily usage so the budget survives a restart"""
+        if not self.state_path:
+            return
+        try:
+            tmp_path = f'{self.state_path}.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump({'day': self.day.isoformat(), 'daily_used': self.daily_used}, f)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            logger.error(f'Failed to save Brave quota state: {e}')
+
+    def _load_state(self) -> None:
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+            if state.get('day') == self.day.isoformat():
+                self.daily_used = {w: int(n) for w, n in state.get('daily_used', {}).items()}
+        except (OSError, ValueError) as e:
+            logger.error(f'Failed to load Brave quota state: {e}')
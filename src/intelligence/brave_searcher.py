@@ -1,54 +1,108 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional
+import time
 import asyncio
+from ..core.log_pipeline import get_logger
+from .brave_client import BraveClient, get_brave_client
+from .seen_store import SeenURLStore
+from ..analysis.keyword_matcher import KeywordMatcher
+from ..config.registry import ConfigRegistry, RegistrySnapshot, get_registry
+
+logger = get_logger('brave')
+
+SIGNIFICANCE_MATCHER = KeywordMatcher(
+    {
+        # Breaking news and urgency indicators
+        'urgency': ['breaking', 'urgent', 'alert', 'just in', 'developing'],
+        # Impact indicators
+        'impact': ['announced', 'reveals', 'major', 'significant', 'breakthrough',
+                   'investigation', 'exclusive', 'report finds'],
+        # Risk or warning indicators
+        'risk': ['warning', 'risk', 'threat', 'danger', 'critical', 'urgent',
+                 'vulnerability', 'exploit', 'breach', 'violation']
+    },
+    weights={'urgency': 0.2, 'impact': 0.15, 'risk': 0.1}
+)
 
 class BraveSearcher:
-    def __init__(self):
-        self.last_search_time = None
-        self.topics = [
-            'corporate manipulation',
-            'AI regulation',
-            'privacy rights',
-            'decentralization',
-            'digital resistance',
-            'surveillance state',
-            'corporate oligarchy',
-            'tech monopolies',
-            'narrative control',
-            'data exploitation'
-        ]
-        # Prevent too frequent searches
-        self.min_search_interval = 300  # 5 minutes
+    def __init__(self,
+                 client: Optional[BraveClient] = None,
+                 db_path: str = 'gonzo_seen.db',
+                 clock: Callable[[], float] = time.monotonic,
+                 registry: Optional[ConfigRegistry] = None):
+        self.client = client or get_brave_client()
+        self.clock = clock
+        # Each topic is searched on its own interval: halved when it produces
+        # new findings, stretched when it goes quiet
+        self.min_search_interval = 300   # 5 minutes
+        self.max_search_interval = 3600  # 1 hour
+        self.topic_intervals: Dict[str, float] = {}
+        self.next_search_at: Dict[str, float] = {}
+
+        self.registry = registry or get_registry()
+        self._on_registry_change(self.registry.snapshot)
+        self.registry.subscribe(self._on_registry_change)
+
+        # URLs already emitted per topic, so each finding is only reported once
+        self.seen = SeenURLStore(db_path)
+
+    def _on_registry_change(self, snapshot: RegistrySnapshot) -> None:
+        topics = list(snapshot.sections['topics'])
+        # Topics that survive a reload keep their learned schedule; new ones are due now
+        self.topic_intervals = {
+            topic: self.topic_intervals.get(topic, self.min_search_interval) for topic in topics
+        }
+        self.next_search_at = {topic: self.next_search_at.get(topic, 0.0) for topic in topics}
+        self.topics = topics
+        self.registry_version = snapshot.version
 
     async def monitor_topics(self) -> List[Dict[str, Any]]:
         """Monitor topics for significant developments.
 
+        Only topics whose interval has elapsed are searched, concurrently.
+
         Returns:
-            List of significant findings.
+            List of significant findings not reported before.
         """
         try:
-            # Respect minimum search interval
-            if self.last_search_time and \
-               (asyncio.get_event_loop().time() - self.last_search_time) < self.min_search_interval:
+            now = self.clock()
+            due = [topic for topic in self.topics if self.next_search_at.get(topic, 0.0) <= now]
+            if not due:
                 return []
 
+            results = await asyncio.gather(
+                *(self._search_topic(topic) for topic in due),
+                return_exceptions=True
+            )
+
             all_findings = []
-            for topic in self.topics:
-                try:
-                    findings = await self._search_topic(topic)
-                    if findings:
-                        all_findings.extend(findings)
-                    # Small delay between searches to prevent rapid-fire API calls
-                    await asyncio.sleep(1)
-                except Exception as e:
-                    print(f'Error searching topic {topic}: {str(e)}')
-
-            self.last_search_time = asyncio.get_event_loop().time()
+            for topic, findings in zip(due, results):
+                if isinstance(findings, Exception):
+                    logger.error(f'Error searching topic {topic}: {str(findings)}',
+                                 extra={'error_type': type(findings).__name__})
+                    findings = []
+                self._reschedule(topic, bool(findings))
+                all_findings.extend(findings)
             return all_findings
 
         except Exception as e:
-            print(f'Error in monitor_topics: {str(e)}')
+            logger.error(f'Error in monitor_topics: {str(e)}', extra={'error_type': type(e).__name__})
             return []
 
+    def seconds_until_next_search(self) -> float:
+        """Time until the next topic is due."""
+        return max(0.0, min(self.next_search_at.values(), default=0.0) - self.clock())
+
+    def _reschedule(self, topic: str, changed: bool) -> None:
+        if topic not in self.next_search_at:
+            return  # Dropped by a registry reload while it was being searched
+        interval = self.topic_intervals.get(topic, self.min_search_interval)
+        if changed:
+            interval = max(self.min_search_interval, interval / 2)
+        else:
+            interval = min(self.max_search_interval, interval * 1.5)
+        self.topic_intervals[topic] = interval
+        self.next_search_at[topic] = self.clock() + interval
+
     async def _search_topic(self, topic: str) -> List[Dict[str, Any]]:
         """Search for a single topic using Brave search.
 
@@ -59,19 +113,24 @@ class BraveSearcher:
             List of significant findings for the topic.
         """
         try:
-            # Use the provided brave_web_search function
             query = f'"{topic}" (news OR article OR report) when:7d'  # Last 7 days only
-            response = await brave_web_search(
-                query=query,
-                count=5  # Limit to 5 results per topic to avoid overwhelming
+            response = await self.client.search(
+                query,
+                count=5,  # Limit to 5 results per topic to avoid overwhelming
+                workload='monitoring',
+                # A topic is only due again after min_search_interval, so a cached
+                # response would hide anything published since the last search
+                max_age=0
             )
             
-            if not response or not response.get('web', []):
+            if not response or not response.get('results', []):
                 return []
                 
-            # Process results
+            # Process results not reported before
             findings = []
-            for result in response.get('web', []):
+            for result in response.get('results', []):
+                if not self.seen.is_new(topic, result.get('url', '')):
+                    continue
                 finding = {
                     'title': result.get('title', '').strip(),
                     'url': result.get('url', '').strip(),
@@ -85,10 +144,15 @@ class BraveSearcher:
                 
             # Sort by significance and return top findings
             findings.sort(key=lambda x: x['significance'], reverse=True)
-            return [f for f in findings[:2] if f['significance'] > 0.6]  # Only return high significance items
+            top = [f for f in findings[:2] if f['significance'] > 0.6]  # Only return high significance items
+            
+            # Significant findings that missed the cut stay unseen for the next cycle
+            low = [f for f in findings if f['significance'] <= 0.6]
+            self.seen.mark_seen(topic, [f['url'] for f in top + low])
+            return top
             
         except Exception as e:
-            print(f'Error in _search_topic for {topic}: {str(e)}')
+            logger.error(f'Error in _search_topic for {topic}: {str(e)}', extra={'error_type': type(e).__name__})
             return []
     
     def _calculate_significance(self, result: Dict[str, Any]) -> float:
@@ -118,24 +182,8 @@ class BraveSearcher:
             except:
                 pass
                 
-        # Check title and description for significance indicators
-        text = (result.get('title', '') + ' ' + result.get('description', '')).lower()
-        
-        # Breaking news and urgency indicators
-        urgency_terms = ['breaking', 'urgent', 'alert', 'just in', 'developing']
-        if any(term in text for term in urgency_terms):
-            score += 0.2
-            
-        # Impact indicators
-        impact_terms = ['announced', 'reveals', 'major', 'significant', 'breakthrough', 
-                       'investigation', 'exclusive', 'report finds']
-        if any(term in text for term in impact_terms):
-            score += 0.15
-            
-        # Risk or warning indicators
-        risk_terms = ['warning', 'risk', 'threat', 'danger', 'critical', 'urgent',
-                     'vulnerability', 'exploit', 'breach', 'violation']
-        if any(term in text for term in risk_terms):
-            score += 0.1
+        # Breaking news, impact and risk indicators each count once
+        text = result.get('title', '') + ' ' + result.get('description', '')
+        score += SIGNIFICANCE_MATCHER.category_score(text)
 
         return min(score, 1.0)  # Cap at 1.0
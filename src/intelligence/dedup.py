@@ -0,0 +1,185 @@
+import re
+import time
+import hashlib
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Tuple
+import numpy as np
+from .seen_store import normalize_url
+
+_TOKEN = re.compile(r'[a-z0-9]+')
+
+def _features(text: str) -> List[str]:
+    # Words plus adjacent word pairs, so word order counts for something
+    words = _TOKEN.findall(text.lower())
+    return words + [f'{a} {b}' for a, b in zip(words, words[1:])]
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+class MinHasher:
+    """MinHash signatures over word shingles; matching positions estimate Jaccard similarity."""
+
+    def __init__(self, num_perm: int = 64, seed: int = 3030):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = rng.integers(1, _MERSENNE_PRIME, num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _MERSENNE_PRIME, num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """Signature of the text, or None when it has no words to compare on."""
+        features = set(_features(text))
+        if not features:
+            return None
+        hashes = np.array([
+            int.from_bytes(hashlib.blake2b(f.encode(), digest_size=4).digest(), 'little')
+            for f in features
+        ], dtype=np.uint64)
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=0)
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures."""
+    return float(np.mean(a == b))
+
+@dataclass
+class DuplicateCluster:
+    """One story and every copy of it seen inside the window."""
+    id: int
+    signature: Optional[np.ndarray]
+    canonical: Dict
+    first_seen: float
+    last_seen: float
+    urls: Set[str] = field(default_factory=set)
+    count: int = 1
+
+class NearDuplicateDetector:
+    """Streaming near-duplicate detection over title + description.
+
+    Each item gets a MinHash signature, split into ``bands`` chunks that key
+    an LSH index, so only items agreeing on a whole band are compared;
+    pairs above roughly ``(1 / bands) ** (1 / rows)`` similarity almost
+    always collide. Candidates must then reach ``threshold`` estimated
+    Jaccard similarity. The first item of a cluster is its canonical
+    finding; later copies, or items with the same normalized URL, only bump
+    the cluster. Clusters not seen for ``window`` seconds are evicted.
+    """
+
+    def __init__(self,
+                 threshold: float = 0.6,
+                 num_perm: int = 64,
+                 bands: int = 16,
+                 window: float = 86400,
+                 clock: Callable[[], float] = time.monotonic):
+        if num_perm % bands:
+            raise ValueError('num_perm must be a multiple of bands')
+        self.threshold = threshold
+        self.bands = bands
+        self.window = window
+        self.clock = clock
+
+        self.hasher = MinHasher(num_perm)
+        self._rows = num_perm // bands
+        self._clusters: 'OrderedDict[int, DuplicateCluster]' = OrderedDict()  # least recently seen first
+        self._buckets: Dict[Tuple[int, bytes], Set[int]] = defaultdict(set)
+        self._by_url: Dict[str, int] = {}
+        self._next_id = 0
+
+        self.stats = {'seen': 0, 'duplicates': 0, 'evicted': 0}
+
+    def add(self, item: Dict) -> Tuple[Optional[DuplicateCluster], bool]:
+        """Record an item; returns its cluster and whether it is the canonical (first) copy."""
+        now = self.clock()
+        self._evict(now)
+        self.stats['seen'] += 1
+
+        url = normalize_url(item['url']) if item.get('url') else None
+        text = f"{item.get('title', '')} {item.get('description', '')}"
+        signature = self.hasher.signature(text)
+
+        cluster_id = self._by_url.get(url) if url else None
+        if cluster_id is None and signature is not None:
+            cluster_id = self._nearest(signature)
+
+        if cluster_id is not None:
+            cluster = self._clusters[cluster_id]
+            cluster.count += 1
+            cluster.last_seen = now
+            if url:
+                cluster.urls.add(url)
+                self._by_url[url] = cluster.id
+            self._clusters.move_to_end(cluster.id)
+            self.stats['duplicates'] += 1
+            return cluster, False
+
+        if signature is None and url is None:
+            # Nothing to compare on; pass it through untracked
+            return None, True
+
+        cluster = DuplicateCluster(
+            id=self._next_id,
+            signature=signature,
+            canonical=item,
+            first_seen=now,
+            last_seen=now,
+            urls={url} if url else set()
+        )
+        self._next_id += 1
+        self._clusters[cluster.id] = cluster
+        if url:
+            self._by_url[url] = cluster.id
+        if signature is not None:
+            for key in self._band_keys(signature):
+                self._buckets[key].add(cluster.id)
+        return cluster, True
+
+    def filter(self, items: List[Dict]) -> List[Dict]:
+        """Keep only items that start a new cluster, in order."""
+        return [item for item in items if self.add(item)[1]]
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Share of items seen that were duplicates of an earlier one."""
+        return self.stats['duplicates'] / self.stats['seen'] if self.stats['seen'] else 0.0
+
+    def clusters(self) -> List[DuplicateCluster]:
+        return list(self._clusters.values())
+
+    def metrics(self) -> Dict:
+        return {'dedup_ratio': self.dedup_ratio, 'clusters': len(self._clusters), **self.stats}
+
+    def _nearest(self, signature: np.ndarray) -> Optional[int]:
+        candidates = set()
+        for key in self._band_keys(signature):
+            candidates |= self._buckets.get(key, set())
+
+        best, best_similarity = None, self.threshold
+        for cluster_id in candidates:
+            score = similarity(signature, self._clusters[cluster_id].signature)
+            if score >= best_similarity:
+                best, best_similarity = cluster_id, score
+        return best
+
+    def _band_keys(self, signature: np.ndarray) -> List[Tuple[int, bytes]]:
+        return [
+            (band, signature[band * self._rows:(band + 1) * self._rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+    def _evict(self, now: float) -> None:
+        while self._clusters:
+            cluster = next(iter(self._clusters.values()))
+            if now - cluster.last_seen < self.window:
+                return
+            del self._clusters[cluster.id]
+            if cluster.signature is not None:
+                for key in self._band_keys(cluster.signature):
+                    bucket = self._buckets.get(key)
+                    if bucket is not None:
+                        bucket.discard(cluster.id)
+                        if not bucket:
+                            del self._buckets[key]
+            for url in cluster.urls:
+                if self._by_url.get(url) == cluster.id:
+                    del self._by_url[url]
+            self.stats['evicted'] += 1
@@ -1,62 +1,156 @@
-from typing import Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
+import time
 import asyncio
+from ..analysis.keyword_matcher import KeywordMatcher
+from ..config.registry import ConfigRegistry, RegistrySnapshot, get_registry
+from ..core.log_pipeline import get_logger
+from .brave_client import BraveClient, get_brave_client
+
+logger = get_logger('gatherer')
 
 class InformationGatherer:
-    def __init__(self):
+    def __init__(self,
+                 registry: Optional[ConfigRegistry] = None,
+                 x_client=None,
+                 brave_client: Optional[BraveClient] = None,
+                 clock: Callable[[], float] = time.monotonic):
         self.sources = {
             "twitter": {
                 "priority": "high",
                 "check_interval": 300,  # 5 minutes
+                "timeout": 30,
                 "topics": ["crypto", "defi", "web3", "privacy", "censorship", "corporate_control"]
             },
             "brave_search": {
                 "priority": "medium",
                 "check_interval": 1800,  # 30 minutes
+                "timeout": 30,
                 "topics": ["crypto news", "corporate manipulation", "privacy violations", "censorship events"]
             }
         }
         
-        self.discovery_patterns = {
-            "manipulation": [
-                "regulation", "compliance", "institutional adoption",
-                "centralized control", "user data", "surveillance"
-            ],
-            "resistance": [
-                "decentralization", "privacy tech", "censorship resistance",
-                "community governance", "open source", "data sovereignty"
-            ]
+        # Each source is polled by its own coroutine, only once its interval is due
+        self.pollers: Dict[str, Callable[[Dict], Awaitable[List[Dict]]]] = {
+            "twitter": self._monitor_twitter,
+            "brave_search": self._search_brave
         }
-
-    async def gather_intelligence(self) -> Dict:
-        """Gather intelligence from all sources."""
-        twitter_data = await self._monitor_twitter()
-        brave_data = await self._search_brave()
+        self.clock = clock
+        self.last_polled: Dict[str, float] = {}
+        self.source_status: Dict[str, Dict[str, Any]] = {}
+        
+        # The X client needs credentials, so it is only created on first poll
+        self.x_client = x_client
+        self.brave_client = brave_client or get_brave_client()
         
-        return self._analyze_intelligence({
-            "twitter": twitter_data,
-            "brave": brave_data
+        self.registry = registry or get_registry()
+        self._on_registry_change(self.registry.snapshot)
+        self.registry.subscribe(self._on_registry_change)
+
+    def _on_registry_change(self, snapshot: RegistrySnapshot) -> None:
+        discovery_patterns = snapshot.sections["discovery_patterns"]
+        pattern_matcher = KeywordMatcher(discovery_patterns, weights={
+            category: 0.2 for category in discovery_patterns
         })
+        self.discovery_patterns, self.pattern_matcher = discovery_patterns, pattern_matcher
+        self.registry_version = snapshot.version
+
+    async def gather_intelligence(self, force: bool = False) -> Dict:
+        """Gather intelligence from every source whose check interval is due.
+
+        Due sources are polled concurrently, each under its own timeout, so a
+        round takes as long as the slowest source. Results are filtered as
+        each source completes; a source that fails or times out is reported
+        in ``sources`` and the others are still returned.
+        """
+        now = self.clock()
+        due = [name for name in self.sources if force or self._is_due(name, now)]
+        
+        relevant: Dict[str, List[Dict]] = {}
+        polls = [asyncio.ensure_future(self._poll(name)) for name in due]
+        try:
+            for next_done in asyncio.as_completed(polls):
+                name, items = await next_done
+                relevant[name] = self._filter_relevant(items)
+        finally:
+            for poll in polls:
+                poll.cancel()
+        
+        analysis = self._analyze_intelligence(relevant)
+        analysis["sources"] = {
+            name: self.source_status.get(name, {}) if name in due else {"status": "skipped"}
+            for name in self.sources
+        }
+        return analysis
 
-    async def _monitor_twitter(self) -> List[Dict]:
-        """Monitor Twitter for relevant discussions and events."""
-        # Implementation for Twitter monitoring
-        pass
+    def seconds_until_next_poll(self) -> float:
+        """Time until the next source is due."""
+        now = self.clock()
+        return max(0.0, min(
+            self.last_polled.get(name, float("-inf")) + config["check_interval"] - now
+            for name, config in self.sources.items()
+        ))
 
-    async def _search_brave(self) -> List[Dict]:
-        """Search Brave for relevant news and information."""
-        relevant_info = []
+    def _is_due(self, name: str, now: float) -> bool:
+        last = self.last_polled.get(name)
+        return last is None or now - last >= self.sources[name]["check_interval"]
+
+    async def _poll(self, name: str) -> Tuple[str, List[Dict]]:
+        """Run one source under its timeout; failures yield no items instead of raising."""
+        config = self.sources[name]
+        started = self.clock()
+        # Stamped up front so a failing source still waits out its interval
+        self.last_polled[name] = started
+        
+        items: List[Dict] = []
+        try:
+            items = await asyncio.wait_for(self.pollers[name](config), timeout=config["timeout"]) or []
+            status = "ok"
+        except asyncio.TimeoutError:
+            status = "timeout"
+            logger.warning(f"Source {name} timed out after {config['timeout']}s")
+        except Exception as e:
+            status = "error"
+            logger.error(f"Source {name} failed: {e}", extra={"error_type": type(e).__name__})
         
-        for topic in self.sources["brave_search"]["topics"]:
-            results = await self._brave_search(topic)
-            relevant_info.extend(self._filter_relevant(results))
+        self.source_status[name] = {
+            "status": status,
+            "items": len(items),
+            "latency_ms": round((self.clock() - started) * 1000, 1),
+            "polled_at": datetime.now().isoformat()
+        }
+        return name, items
+
+    async def _monitor_twitter(self, config: Dict) -> List[Dict]:
+        """Search recent posts on the monitored topics."""
+        if self.x_client is None:
+            from ..social.x_api_client import XAPIClient
+            self.x_client = XAPIClient()
         
-        return relevant_info
+        # One OR query instead of a search per topic keeps within the search rate limit
+        query = "(" + " OR ".join(topic.replace("_", " ") for topic in config["topics"]) + ") -is:retweet"
+        return await asyncio.to_thread(
+            self.x_client.search_recent,
+            query,
+            since_minutes=max(1, config["check_interval"] // 60),
+            max_results=50
+        )
 
-    async def _brave_search(self, query: str) -> Dict:
-        """Perform a Brave search with the given query."""
-        # Implementation for Brave search API call
-        pass
+    async def _search_brave(self, config: Dict) -> List[Dict]:
+        """Search Brave for every topic concurrently, keeping whichever searches succeed."""
+        responses = await asyncio.gather(
+            *(self.brave_client.search(topic, count=10, workload="monitoring") for topic in config["topics"]),
+            return_exceptions=True
+        )
+        
+        results = []
+        for topic, response in zip(config["topics"], responses):
+            if isinstance(response, Exception):
+                logger.error(f"Brave search failed for {topic!r}: {response}",
+                             extra={"error_type": type(response).__name__})
+                continue
+            results.extend(response.get("results", []))
+        return results
 
     def _filter_relevant(self, results: List[Dict]) -> List[Dict]:
         """Filter search results for relevance."""
@@ -75,49 +169,60 @@ class InformationGatherer:
 
     def _calculate_relevance(self, result: Dict) -> float:
         """Calculate relevance score for a piece of information."""
-        score = 0.0
-        content = str(result).lower()
-        
-        # Check for manipulation patterns
-        for pattern in self.discovery_patterns["manipulation"]:
-            if pattern in content:
-                score += 0.2
-        
-        # Check for resistance patterns
-        for pattern in self.discovery_patterns["resistance"]:
-            if pattern in content:
-                score += 0.2
+        # Manipulation and resistance patterns each add their weight
+        score = self.pattern_matcher.keyword_score(
+            str(result), categories=["manipulation", "resistance"]
+        )
         
         # Cap at 1.0
         return min(1.0, score)
 
     def _identify_patterns(self, result: Dict) -> List[str]:
         """Identify relevant patterns in the information."""
-        patterns = []
-        content = str(result).lower()
-        
-        # Check all patterns
-        for category, pattern_list in self.discovery_patterns.items():
-            for pattern in pattern_list:
-                if pattern in content:
-                    patterns.append(f"{category}:{pattern}")
-        
-        return patterns
+        return [
+            f"{hit.category}:{hit.keyword}"
+            for hit in self.pattern_matcher.match(str(result))
+        ]
 
     def _analyze_intelligence(self, data: Dict) -> Dict:
         """Analyze gathered intelligence for actionable insights."""
-        twitter_insights = self._analyze_source(data["twitter"], "twitter")
-        brave_insights = self._analyze_source(data["brave"], "brave")
+        insights = {source: self._analyze_source(items, source) for source, items in data.items()}
         
         return {
-            "insights": {
-                "twitter": twitter_insights,
-                "brave": brave_insights
-            },
-            "action_items": self._generate_action_items(twitter_insights, brave_insights),
-            "warnings": self._identify_warnings(twitter_insights, brave_insights)
+            "insights": insights,
+            "action_items": self._generate_action_items(*insights.values()),
+            "warnings": self._identify_warnings(*insights.values())
+        }
+
+    def _analyze_source(self, items: List[Dict], source: str) -> Dict:
+        """Summarize one source's relevant items by the pattern categories they matched."""
+        patterns: Dict[str, int] = {}
+        categories: Dict[str, int] = {}
+        for item in items:
+            for pattern in item["patterns_matched"]:
+                patterns[pattern] = patterns.get(pattern, 0) + 1
+            for category in {pattern.split(":", 1)[0] for pattern in item["patterns_matched"]}:
+                categories[category] = categories.get(category, 0) + 1
+        
+        return {
+            "source": source,
+            "count": len(items),
+            "top_relevance": max((item["relevance"] for item in items), default=0.0),
+            "categories": categories,
+            "patterns": patterns,
+            "items": items
         }
 
+    def _identify_warnings(self, *insights) -> List[Dict]:
+        """List manipulation patterns seen in each source, most frequent first."""
+        warnings = [
+            {"source": insight["source"], "pattern": pattern, "count": count}
+            for insight in insights
+            for pattern, count in insight["patterns"].items()
+            if pattern.startswith("manipulation:")
+        ]
+        return sorted(warnings, key=lambda warning: -warning["count"])
+
     def _generate_action_items(self, *insights) -> List[Dict]:
         """Generate action items from analyzed intelligence."""
         actions = []
@@ -138,10 +243,10 @@ class InformationGatherer:
 
     def _requires_immediate_action(self, insight: Dict) -> bool:
         """Determine if insight requires immediate action."""
-        # Implementation for urgency detection
-        pass
+        # Manipulation in an item that hit the relevance cap is worth calling out now
+        return bool(insight["categories"].get("manipulation")) and insight["top_relevance"] >= 1.0
 
     def _is_educational_opportunity(self, insight: Dict) -> bool:
         """Determine if insight presents educational opportunity."""
-        # Implementation for educational value assessment
-        pass
\ No newline at end of file
+        # Resistance patterns give something constructive to explain
+        return bool(insight["categories"].get("resistance"))
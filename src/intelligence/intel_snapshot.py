@@ -0,0 +1,136 @@
+import time
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional
+from ..core.log_pipeline import get_logger
+
+logger = get_logger('intel_snapshot')
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists into read-only equivalents."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+@dataclass(frozen=True)
+class IntelSnapshot:
+    """An immutable, versioned view of gathered intel shared by every reader."""
+    version: int
+    data: Mapping
+    created_at: float
+    generated_at: str
+
+    def age(self, now: float) -> float:
+        return now - self.created_at
+
+class IntelSnapshotService:
+    """Serves the latest intel snapshot, refreshing on a schedule or when stale.
+
+    Readers get the current snapshot from memory. Once it is older than
+    ``ttl`` the stale copy is still served while one background refresh
+    runs (stale-while-revalidate); beyond ``max_stale`` readers wait for
+    fresh data. Concurrent refreshes collapse into a single fetch.
+    """
+
+    def __init__(self,
+                 fetch: Callable[[], Awaitable[Dict]],
+                 ttl: float = 300.0,
+                 max_stale: float = 1800.0,
+                 refresh_interval: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.fetch = fetch
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.refresh_interval = refresh_interval or ttl
+        self.clock = clock
+
+        self._snapshot: Optional[IntelSnapshot] = None
+        self._refreshing: Optional[asyncio.Task] = None
+        self._scheduler: Optional[asyncio.Task] = None
+
+        self.stats = {'fresh_reads': 0, 'stale_reads': 0, 'refreshes': 0, 'refresh_failures': 0}
+
+    @property
+    def snapshot(self) -> Optional[IntelSnapshot]:
+        return self._snapshot
+
+    async def get(self) -> IntelSnapshot:
+        """Current snapshot, revalidating in the background once it goes stale."""
+        snapshot = self._snapshot
+        if snapshot is not None:
+            age = snapshot.age(self.clock())
+            if age < self.ttl:
+                self.stats['fresh_reads'] += 1
+                return snapshot
+            if age < self.max_stale:
+                self.stats['stale_reads'] += 1
+                self._start_refresh()
+                return snapshot
+        return await self.refresh()
+
+    async def refresh(self) -> IntelSnapshot:
+        """Fetch new intel, joining a refresh that is already in flight."""
+        task = self._start_refresh()
+        # Shield so a cancelled reader does not abort the shared fetch
+        await asyncio.shield(task)
+        if self._snapshot is None:
+            raise RuntimeError('Intel snapshot unavailable')
+        return self._snapshot
+
+    def start(self) -> None:
+        """Refresh on a fixed schedule in the background."""
+        if self._scheduler is None:
+            self._scheduler = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        for task in (self._scheduler, self._refreshing):
+            if task:
+                task.cancel()
+        await asyncio.gather(*(t for t in (self._scheduler, self._refreshing) if t),
+                             return_exceptions=True)
+        self._scheduler = None
+        self._refreshing = None
+
+    def metrics(self) -> Dict:
+        snapshot = self._snapshot
+        return {
+            'version': snapshot.version if snapshot else 0,
+            'age': snapshot.age(self.clock()) if snapshot else None,
+            'refreshing': self._refreshing is not None,
+            **self.stats
+        }
+
+    def _start_refresh(self) -> asyncio.Task:
+        if self._refreshing is None:
+            self._refreshing = asyncio.create_task(self._do_refresh())
+        return self._refreshing
+
+    async def _do_refresh(self) -> None:
+        try:
+            data = await self.fetch()
+            version = self._snapshot.version + 1 if self._snapshot else 1
+            # Swap in a whole new snapshot; readers holding the old one are unaffected
+            self._snapshot = IntelSnapshot(
+                version=version,
+                data=_freeze(data),
+                created_at=self.clock(),
+                generated_at=datetime.now().isoformat()
+            )
+            self.stats['refreshes'] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Keep serving the previous snapshot
+            self.stats['refresh_failures'] += 1
+            logger.error(f'Intel refresh failed: {e}', extra={'error_type': type(e).__name__})
+        finally:
+            self._refreshing = None
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.shield(self._start_refresh())
+            await asyncio.sleep(self.refresh_interval)
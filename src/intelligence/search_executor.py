@@ -0,0 +1,76 @@
+import time
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Hashable, Iterable, Tuple
+from ..core.log_pipeline import get_logger
+
+logger = get_logger('brave')
+
+class SearchExecutor:
+    """Runs search calls concurrently under a shared concurrency limit and per-minute budget.
+
+    ``stream`` fires every query at once and yields ``(tag, result)`` pairs
+    as they complete, so callers can aggregate without waiting on the
+    slowest request.
+    """
+
+    def __init__(self,
+                 search: Callable[[str], Awaitable[Any]],
+                 max_concurrent: int = 5,
+                 per_minute: int = 30,
+                 clock: Callable[[], float] = time.monotonic):
+        self.search = search
+        self.per_minute = per_minute
+        self.clock = clock
+
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._budget_lock = asyncio.Lock()
+        self._started: Deque[float] = deque()
+
+        self.stats = {'executed': 0, 'failed': 0, 'budget_waits': 0}
+
+    async def run(self, query: str) -> Any:
+        """Execute one query once budget and a concurrency slot are available."""
+        await self._reserve_budget()
+        async with self._semaphore:
+            try:
+                result = await self.search(query)
+                self.stats['executed'] += 1
+                return result
+            except Exception as e:
+                self.stats['failed'] += 1
+                logger.error(f'Search failed for {query!r}: {e}', extra={'error_type': type(e).__name__})
+                return []
+
+    async def stream(self, queries: Iterable[Tuple[Hashable, str]]) -> AsyncIterator[Tuple[Hashable, Any]]:
+        """Run tagged queries concurrently, yielding results in completion order."""
+        async def tagged(tag, query):
+            return tag, await self.run(query)
+
+        tasks = [asyncio.ensure_future(tagged(tag, query)) for tag, query in queries]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def metrics(self) -> Dict:
+        self._expire(self.clock())
+        return {'budget_used': len(self._started), 'per_minute': self.per_minute, **self.stats}
+
+    async def _reserve_budget(self) -> None:
+        async with self._budget_lock:
+            while True:
+                now = self.clock()
+                self._expire(now)
+                if len(self._started) < self.per_minute:
+                    self._started.append(now)
+                    return
+                # Sleep exactly until the oldest call leaves the window
+                self.stats['budget_waits'] += 1
+                await asyncio.sleep(self._started[0] + 60 - now)
+
+    def _expire(self, now: float) -> None:
+        while self._started and now - self._started[0] >= 60:
+            self._started.popleft()
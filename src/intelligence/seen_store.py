@@ -0,0 +1,97 @@
+import math
+import time
+import sqlite3
+import hashlib
+from typing import Iterable
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a URL so trivially different links compare equal."""
+    parts = urlsplit(url.strip())
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query) if not k.startswith('utm_')])
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ''))
+
+class BloomFilter:
+    """Fixed-size Bloom filter sized for ``capacity`` items at ``error_rate``."""
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+    def _positions(self, key: str) -> Iterable[int]:
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+class SeenURLStore:
+    """Per-topic record of URLs already emitted, persisted in SQLite.
+
+    A Bloom filter answers most lookups in memory: a miss means the URL is
+    definitely new, and only filter hits are confirmed against the database.
+    """
+
+    def __init__(self,
+                 db_path: str = 'gonzo_seen.db',
+                 capacity: int = 100000,
+                 error_rate: float = 0.001):
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute(
+            '''CREATE TABLE IF NOT EXISTS seen_urls (
+                topic TEXT NOT NULL,
+                url TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                PRIMARY KEY (topic, url)
+            )'''
+        )
+        self.conn.commit()
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._rebuild_filter()
+
+    def is_new(self, topic: str, url: str) -> bool:
+        url = normalize_url(url)
+        if self._key(topic, url) not in self.bloom:
+            return True
+        row = self.conn.execute(
+            'SELECT 1 FROM seen_urls WHERE topic = ? AND url = ?', (topic, url)
+        ).fetchone()
+        return row is None
+
+    def mark_seen(self, topic: str, urls: Iterable[str]) -> None:
+        rows = [(topic, normalize_url(url), time.time()) for url in urls if url]
+        if not rows:
+            return
+        for _, url, _ in rows:
+            self.bloom.add(self._key(topic, url))
+        self.conn.executemany('INSERT OR IGNORE INTO seen_urls VALUES (?, ?, ?)', rows)
+        self.conn.commit()
+
+    def prune(self, max_age_days: float = 30) -> int:
+        """Forget URLs older than ``max_age_days``; the filter is rebuilt from what remains."""
+        cutoff = time.time() - max_age_days * 86400
+        removed = self.conn.execute('DELETE FROM seen_urls WHERE first_seen < ?', (cutoff,)).rowcount
+        self.conn.commit()
+        self._rebuild_filter()
+        return removed
+
+    def _rebuild_filter(self) -> None:
+        # Swapped in only when full, so lookups never see a partial filter
+        bloom = BloomFilter(self.capacity, self.error_rate)
+        for topic, url in self.conn.execute('SELECT topic, url FROM seen_urls'):
+            bloom.add(self._key(topic, url))
+        self.bloom = bloom
+
+    def _key(self, topic: str, url: str) -> str:
+        return f'{topic}\x00{url}'
@@ -1,51 +1,74 @@
 import asyncio
 import random
 from datetime import datetime, timedelta
-from social.x_integration import XIntegration
-from social.content_generator import ContentType
-from social.x_engagement_system import EngagementPriority
+from src.social.x_integration import XIntegration
+from src.social.content_generator import ContentType
+from src.social.x_engagement_system import EngagementPriority
+from src.core.log_pipeline import configure_logging, get_logger
+from src.core.scheduler import JobScheduler, MissedRunPolicy
+
+logger = get_logger('runner')
 
 class GonzoRunner:
     def __init__(self):
         self.x_system = XIntegration()
         self.running = False
+        self.stopped = asyncio.Event()
+        
+        self.scheduler = JobScheduler()
+        self.scheduler.add_job('engagement_cycle', self._engagement_job, interval=14400)
+        self.scheduler.add_job('outbox_compaction', self._compact_outbox, interval=86400,
+                               missed=MissedRunPolicy.SKIP, run_immediately=False)
         
     async def start(self):
         """Start Gonzo's operations"""
         print("🚨 Initializing Gonzo-3030...")
         self.running = True
+        self.x_system.start()
+        self.scheduler.start()
         
         try:
-            while self.running:
-                if self.x_system.safety_manager.is_operational():
-                    # Check daily limits
-                    stats = self.x_system.get_system_status()['stats']
-                    daily_limits = self.x_system.engagement_system.daily_limits
-                    
-                    if stats['posts'] < sum(daily_limits.values()):
-                        await self._run_cycle()
-                        
-                        # Dynamic sleep based on priority and engagement
-                        priority = await self._assess_current_priority()
-                        sleep_seconds = self._get_priority_wait_time(priority)
-                        
-                        print(f"Priority: {priority}. Waiting {sleep_seconds//60} minutes until next check...")
-                        await asyncio.sleep(sleep_seconds)
-                    else:
-                        print("Daily limits reached. Waiting for next day...")
-                        await asyncio.sleep(3600)  # Check again in an hour
-                else:
-                    print("⚠️ System in emergency shutdown. Waiting 1 hour...")
-                    await asyncio.sleep(3600)
-                    
-        except KeyboardInterrupt:
+            await self.stopped.wait()
+            
+        except (KeyboardInterrupt, asyncio.CancelledError):
             print("\n🛑 Shutting down Gonzo-3030...")
             self.running = False
-            
-        except Exception as e:
-            print(f"❌ Error in main loop: {str(e)}")
-            self.x_system.safety_manager.log_api_error('RUNTIME_ERROR', str(e))
-            raise
+        
+        finally:
+            await self.scheduler.stop()
+            await self.x_system.stop()
+    
+    def stop(self):
+        """Stop the scheduler loop"""
+        self.running = False
+        self.stopped.set()
+    
+    async def _engagement_job(self) -> float:
+        """Run one cycle, then wait as long as the current priority calls for"""
+        if not self.x_system.safety_manager.is_operational():
+            wait_time = max(1, self.x_system.safety_manager.seconds_until_recovery_probe())
+            print(f"⚠️ System in emergency shutdown. Probing again in {wait_time:.0f}s...")
+            return wait_time
+        
+        # Check daily limits
+        stats = self.x_system.get_system_status()['stats']
+        daily_limits = self.x_system.engagement_system.daily_limits
+        if stats['posts'] >= sum(daily_limits.values()):
+            print("Daily limits reached. Waiting for next day...")
+            return 3600  # Check again in an hour
+        
+        await self._run_cycle()
+        
+        # Dynamic wait based on priority and engagement
+        priority = await self._assess_current_priority()
+        sleep_seconds = self._get_priority_wait_time(priority)
+        print(f"Priority: {priority}. Waiting {sleep_seconds//60} minutes until next check...")
+        return sleep_seconds
+    
+    async def _compact_outbox(self) -> None:
+        # On the loop: the outbox connection is shared with the publisher
+        purged = self.x_system.post_queue.purge()
+        logger.info(f'Purged {purged} finished posts', extra={'jobs': self.scheduler.stats()})
     
     async def _run_cycle(self):
         """Run one cycle of Gonzo's operations"""
@@ -72,6 +95,7 @@ class GonzoRunner:
                 
         except Exception as e:
             print(f"❌ Error in cycle: {str(e)}")
+            logger.exception(f'Error in cycle: {str(e)}', extra={'error_type': type(e).__name__})
             self.x_system.safety_manager.log_api_error('CYCLE_ERROR', str(e))
     
     async def _assess_current_priority(self) -> str:
@@ -97,5 +121,6 @@ if __name__ == "__main__":
     Press Ctrl+C to shutdown
     """)
     
+    configure_logging()
     runner = GonzoRunner()
     asyncio.run(runner.start())
\ No newline at end of file
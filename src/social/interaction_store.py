@@ -0,0 +1,234 @@
+import json
+import sqlite3
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime, date
+from typing import Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+@dataclass
+class UserAggregate:
+    """Running per-user interaction aggregates plus a ring of recent interactions."""
+    user_id: str
+    interactions: int = 0
+    engagement_sum: float = 0.0
+    engagement_count: int = 0
+    sentiment_sum: float = 0.0
+    sentiment_count: int = 0
+    last_seen: Optional[str] = None
+    tier: str = "standard"
+    reports: int = 0
+    recent: Deque[Dict] = field(default_factory=deque)
+
+    @property
+    def avg_engagement(self) -> float:
+        return self.engagement_sum / self.engagement_count if self.engagement_count else 0.0
+
+    @property
+    def avg_sentiment(self) -> float:
+        return self.sentiment_sum / self.sentiment_count if self.sentiment_count else 0.0
+
+class UserInteractionStore:
+    """Bounded, SQLite-backed store of per-user interactions and daily response counts.
+
+    Hot users are kept in an LRU cache capped at ``max_cached_users``; everyone
+    else lives only on disk, so memory does not grow with the follower base.
+    The day's response total is a running counter rather than a sum over users.
+    """
+
+    # Interaction types that count against a user as report/abuse signals
+    REPORT_TYPES = {"report", "abuse", "block", "spam"}
+
+    def __init__(self,
+                 db_path: str = 'gonzo_interactions.db',
+                 recent_per_user: int = 20,
+                 max_cached_users: int = 10000):
+        self.recent_per_user = recent_per_user
+        self.max_cached_users = max_cached_users
+
+        self._cache: "OrderedDict[str, UserAggregate]" = OrderedDict()
+
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute(
+            '''CREATE TABLE IF NOT EXISTS user_aggregates (
+                user_id TEXT PRIMARY KEY,
+                interactions INTEGER NOT NULL,
+                engagement_sum REAL NOT NULL,
+                engagement_count INTEGER NOT NULL,
+                sentiment_sum REAL NOT NULL,
+                sentiment_count INTEGER NOT NULL,
+                last_seen TEXT,
+                tier TEXT NOT NULL,
+                recent TEXT NOT NULL,
+                reports INTEGER NOT NULL DEFAULT 0
+            )'''
+        )
+        self.conn.execute(
+            '''CREATE TABLE IF NOT EXISTS daily_responses (
+                day TEXT NOT NULL,
+                user_id TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (day, user_id)
+            )'''
+        )
+        self.conn.commit()
+
+        self.current_day = date.today()
+        self.daily_counts: Dict[str, int] = {}
+        self.total_today = 0
+        self._load_daily_counts()
+
+    # Interactions
+
+    def record_interaction(self, interaction: Dict) -> UserAggregate:
+        """Fold one interaction into the user's aggregates."""
+        aggregate = self.get(interaction["user_id"])
+        aggregate.interactions += 1
+        aggregate.last_seen = datetime.now().isoformat()
+
+        engagement = interaction.get("engagement_score")
+        if engagement is not None:
+            aggregate.engagement_sum += engagement
+            aggregate.engagement_count += 1
+
+        sentiment = interaction.get("sentiment")
+        if isinstance(sentiment, (int, float)):
+            aggregate.sentiment_sum += sentiment
+            aggregate.sentiment_count += 1
+
+        if interaction.get("type") in self.REPORT_TYPES:
+            aggregate.reports += 1
+
+        aggregate.recent.append({
+            "timestamp": aggregate.last_seen,
+            "type": interaction.get("type"),
+            "sentiment": sentiment,
+            "engagement_score": engagement
+        })
+
+        self._save(aggregate)
+        return aggregate
+
+    def get(self, user_id: str) -> UserAggregate:
+        """Aggregates for a user, from the LRU cache or disk."""
+        aggregate = self._cache.get(user_id)
+        if aggregate is not None:
+            self._cache.move_to_end(user_id)
+            return aggregate
+
+        row = self.conn.execute(
+            'SELECT interactions, engagement_sum, engagement_count, sentiment_sum, '
+            'sentiment_count, last_seen, tier, reports, recent FROM user_aggregates WHERE user_id = ?',
+            (user_id,)
+        ).fetchone()
+        if row:
+            aggregate = self._from_row((user_id,) + row)
+        else:
+            aggregate = UserAggregate(user_id, recent=deque(maxlen=self.recent_per_user))
+
+        self._cache[user_id] = aggregate
+        if len(self._cache) > self.max_cached_users:
+            self._cache.popitem(last=False)
+        return aggregate
+
+    def get_tier(self, user_id: str) -> str:
+        return self.get(user_id).tier
+
+    def get_recent(self, user_id: str) -> List[Dict]:
+        return list(self.get(user_id).recent)
+
+    def set_tiers(self, tiers: Sequence[Tuple[str, str]]) -> None:
+        """Persist tier assignments as ``(user_id, tier)`` pairs."""
+        if not tiers:
+            return
+        for user_id, tier in tiers:
+            if user_id in self._cache:
+                self._cache[user_id].tier = tier
+        self.conn.executemany(
+            'UPDATE user_aggregates SET tier = ? WHERE user_id = ?',
+            [(tier, user_id) for user_id, tier in tiers]
+        )
+        self.conn.commit()
+
+    def iter_aggregates(self, batch_size: int = 500) -> Iterator[List[UserAggregate]]:
+        """Yield every stored user's aggregates in batches, for bulk jobs."""
+        last_id = ''
+        while True:
+            rows = self.conn.execute(
+                'SELECT user_id, interactions, engagement_sum, engagement_count, sentiment_sum, '
+                'sentiment_count, last_seen, tier, reports, recent FROM user_aggregates '
+                'WHERE user_id > ? ORDER BY user_id LIMIT ?',
+                (last_id, batch_size)
+            ).fetchall()
+            if not rows:
+                return
+            # Prefer cached copies, which may hold the freshest state
+            yield [self._cache.get(row[0]) or self._from_row(row) for row in rows]
+            last_id = rows[-1][0]
+
+    def _from_row(self, row: Sequence) -> UserAggregate:
+        return UserAggregate(
+            row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8],
+            deque(json.loads(row[9]), maxlen=self.recent_per_user)
+        )
+
+    def _save(self, aggregate: UserAggregate) -> None:
+        self.conn.execute(
+            'INSERT OR REPLACE INTO user_aggregates (user_id, interactions, engagement_sum, '
+            'engagement_count, sentiment_sum, sentiment_count, last_seen, tier, recent, reports) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (aggregate.user_id, aggregate.interactions, aggregate.engagement_sum,
+             aggregate.engagement_count, aggregate.sentiment_sum, aggregate.sentiment_count,
+             aggregate.last_seen, aggregate.tier, json.dumps(list(aggregate.recent)),
+             aggregate.reports)
+        )
+        self.conn.commit()
+
+    # Daily response counts
+
+    def record_response(self, user_id: str) -> None:
+        self._roll_day()
+        self.daily_counts[user_id] = self.daily_counts.get(user_id, 0) + 1
+        self.total_today += 1
+        self.conn.execute(
+            'INSERT OR REPLACE INTO daily_responses VALUES (?, ?, ?)',
+            (self.current_day.isoformat(), user_id, self.daily_counts[user_id])
+        )
+        self.conn.commit()
+
+    def release_response(self, user_id: str) -> None:
+        """Undo a ``record_response`` for a reserved response that was never sent"""
+        self._roll_day()
+        if not self.daily_counts.get(user_id):
+            return
+        self.daily_counts[user_id] -= 1
+        self.total_today -= 1
+        self.conn.execute(
+            'INSERT OR REPLACE INTO daily_responses VALUES (?, ?, ?)',
+            (self.current_day.isoformat(), user_id, self.daily_counts[user_id])
+        )
+        self.conn.commit()
+
+    def responses_today(self, user_id: str) -> int:
+        self._roll_day()
+        return self.daily_counts.get(user_id, 0)
+
+    def total_responses_today(self) -> int:
+        self._roll_day()
+        return self.total_today
+
+    def _roll_day(self) -> None:
+        today = date.today()
+        if today != self.current_day:
+            self.current_day = today
+            self.daily_counts = {}
+            self.total_today = 0
+            self.conn.execute('DELETE FROM daily_responses WHERE day < ?', (today.isoformat(),))
+            self.conn.commit()
+
+    def _load_daily_counts(self) -> None:
+        rows = self.conn.execute(
+            'SELECT user_id, count FROM daily_responses WHERE day = ?',
+            (self.current_day.isoformat(),)
+        ).fetchall()
+        self.daily_counts = dict(rows)
+        self.total_today = sum(self.daily_counts.values())
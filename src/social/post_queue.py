@@ -0,0 +1,369 @@
+import json
+import time
+import random
+import hashlib
+import sqlite3
+import asyncio
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, List, Optional, Union
+
+class PostLane(Enum):
+    """Priority lanes, drained lowest value first"""
+    OWNER_REPLY = 0
+    CRITICAL = 1
+    STANDARD = 2
+
+class PostStatus(Enum):
+    PENDING = "pending"
+    IN_FLIGHT = "in_flight"
+    DONE = "done"
+    DEAD = "dead"
+
+@dataclass
+class OutboundPost:
+    """A single queued post or thread."""
+    idempotency_key: str
+    kind: str                   # 'post' or 'thread'
+    content: Union[str, List[str]]
+    lane: PostLane = PostLane.STANDARD
+    post_type: str = 'post'     # SafetyManager stat bucket: post, reply or thread
+    reply_to: Optional[str] = None
+    status: PostStatus = PostStatus.PENDING
+    attempts: int = 0
+    scheduled_at: float = field(default_factory=time.time)
+    last_error: Optional[str] = None
+    result: Optional[Dict] = None
+    created_at: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict:
+        return {
+            'idempotency_key': self.idempotency_key,
+            'kind': self.kind,
+            'lane': self.lane.name,
+            'status': self.status.value,
+            'attempts': self.attempts,
+            'scheduled_at': self.scheduled_at,
+            'last_error': self.last_error
+        }
+
+def make_idempotency_key(kind: str,
+                         content: Union[str, List[str]],
+                         post_type: str = 'post',
+                         reply_to: Optional[str] = None) -> str:
+    """Derive an idempotency key from the post's content hash and its target"""
+    body = content if isinstance(content, str) else '\x1e'.join(str(c) for c in content)
+    # The same reply text to two different tweets is two posts
+    return hashlib.sha256(
+        f'{kind}\x1f{post_type}\x1f{reply_to or ""}\x1f{body}'.encode('utf-8')
+    ).hexdigest()[:32]
+
+class PostQueue:
+    """SQLite-backed outbound queue with priority lanes and retry scheduling"""
+
+    def __init__(self,
+                 db_path: str = 'gonzo_outbox.db',
+                 base_backoff: float = 30.0,
+                 max_backoff: float = 3600.0,
+                 max_attempts: int = 6):
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.max_attempts = max_attempts
+
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute(
+            '''CREATE TABLE IF NOT EXISTS outbound_posts (
+                idempotency_key TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                content TEXT NOT NULL,
+                lane INTEGER NOT NULL,
+                post_type TEXT NOT NULL,
+                reply_to TEXT,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                scheduled_at REAL NOT NULL,
+                last_error TEXT,
+                result TEXT,
+                created_at REAL NOT NULL
+            )'''
+        )
+        self.conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_outbound_due '
+            'ON outbound_posts (status, lane, scheduled_at)'
+        )
+        self.conn.commit()
+
+        # Status counts are counted once here and kept up to date on every
+        # transition, so stats() does not scan the whole outbox
+        self._counts = {status.value: 0 for status in PostStatus}
+        for status, count in self.conn.execute(
+            'SELECT status, COUNT(*) FROM outbound_posts GROUP BY status'
+        ):
+            self._counts[status] = count
+
+    def enqueue(self,
+                kind: str,
+                content: Union[str, List[str]],
+                lane: PostLane = PostLane.STANDARD,
+                post_type: str = 'post',
+                reply_to: Optional[str] = None,
+                scheduled_at: Optional[float] = None) -> OutboundPost:
+        """Queue a post. Re-enqueueing identical content returns the existing entry."""
+        key = make_idempotency_key(kind, content, post_type, reply_to)
+        existing = self.get(key)
+        if existing is not None:
+            return existing
+
+        post = OutboundPost(
+            idempotency_key=key,
+            kind=kind,
+            content=content,
+            lane=lane,
+            post_type=post_type,
+            reply_to=reply_to,
+            scheduled_at=scheduled_at if scheduled_at is not None else time.time()
+        )
+        self._save(post)
+        return post
+
+    def get(self, key: str) -> Optional[OutboundPost]:
+        row = self.conn.execute(
+            'SELECT * FROM outbound_posts WHERE idempotency_key = ?', (key,)
+        ).fetchone()
+        return self._from_row(row) if row else None
+
+    def claim_next(self, now: Optional[float] = None) -> Optional[OutboundPost]:
+        """Take the highest-priority due post and mark it in flight"""
+        now = time.time() if now is None else now
+        row = self.conn.execute(
+            'SELECT * FROM outbound_posts WHERE status = ? AND scheduled_at <= ? '
+            'ORDER BY lane, scheduled_at LIMIT 1',
+            (PostStatus.PENDING.value, now)
+        ).fetchone()
+        if not row:
+            return None
+
+        post = self._from_row(row)
+        post.status = PostStatus.IN_FLIGHT
+        post.attempts += 1
+        self._save(post, PostStatus.PENDING)
+        return post
+
+    def next_due_in(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the next pending post is due, or None if the queue is empty"""
+        now = time.time() if now is None else now
+        row = self.conn.execute(
+            'SELECT MIN(scheduled_at) FROM outbound_posts WHERE status = ?',
+            (PostStatus.PENDING.value,)
+        ).fetchone()
+        if row[0] is None:
+            return None
+        return max(0.0, row[0] - now)
+
+    def mark_done(self, post: OutboundPost, result: Optional[Dict] = None) -> None:
+        previous = post.status
+        post.status = PostStatus.DONE
+        post.result = result
+        post.last_error = None
+        self._save(post, previous)
+
+    def mark_failed(self, post: OutboundPost, error: str, now: Optional[float] = None) -> None:
+        """Reschedule with exponential backoff, or give up after max_attempts"""
+        now = time.time() if now is None else now
+        previous = post.status
+        post.last_error = error
+        if post.attempts >= self.max_attempts:
+            post.status = PostStatus.DEAD
+        else:
+            post.status = PostStatus.PENDING
+            post.scheduled_at = now + self._backoff(post.attempts)
+        self._save(post, previous)
+
+    def release(self, post: OutboundPost) -> None:
+        """Hand a claimed post back untouched, e.g. when a publisher is cancelled"""
+        previous = post.status
+        post.status = PostStatus.PENDING
+        post.attempts = max(0, post.attempts - 1)
+        self._save(post, previous)
+
+    def requeue_in_flight(self) -> int:
+        """Return posts orphaned mid-flight by a crash to the pending state"""
+        cursor = self.conn.execute(
+            'UPDATE outbound_posts SET status = ? WHERE status = ?',
+            (PostStatus.PENDING.value, PostStatus.IN_FLIGHT.value)
+        )
+        self.conn.commit()
+        self._counts[PostStatus.IN_FLIGHT.value] -= cursor.rowcount
+        self._counts[PostStatus.PENDING.value] += cursor.rowcount
+        return cursor.rowcount
+
+    def purge(self, max_age_days: float = 7) -> int:
+        """Delete finished posts older than ``max_age_days``; identical content can then be queued again."""
+        cutoff = time.time() - max_age_days * 86400
+        removed = 0
+        for status in (PostStatus.DONE, PostStatus.DEAD):
+            cursor = self.conn.execute(
+                'DELETE FROM outbound_posts WHERE status = ? AND created_at < ?',
+                (status.value, cutoff)
+            )
+            self._counts[status.value] -= cursor.rowcount
+            removed += cursor.rowcount
+        self.conn.commit()
+        return removed
+
+    def stats(self) -> Dict:
+        return dict(self._counts)
+
+    def _backoff(self, attempts: int) -> float:
+        delay = min(self.max_backoff, self.base_backoff * (2 ** max(0, attempts - 1)))
+        return delay * random.uniform(1.0, 1.2)
+
+    def _save(self, post: OutboundPost, previous: Optional[PostStatus] = None) -> None:
+        """Write ``post``; ``previous`` is its stored status, or None for a new entry."""
+        self.conn.execute(
+            'INSERT OR REPLACE INTO outbound_posts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (post.idempotency_key, post.kind, json.dumps(post.content), post.lane.value,
+             post.post_type, post.reply_to, post.status.value, post.attempts,
+             post.scheduled_at, post.last_error,
+             json.dumps(post.result) if post.result is not None else None,
+             post.created_at)
+        )
+        self.conn.commit()
+        if previous is not None:
+            self._counts[previous.value] -= 1
+        self._counts[post.status.value] += 1
+
+    def _from_row(self, row) -> OutboundPost:
+        return OutboundPost(
+            idempotency_key=row[0],
+            kind=row[1],
+            content=json.loads(row[2]),
+            lane=PostLane(row[3]),
+            post_type=row[4],
+            reply_to=row[5],
+            status=PostStatus(row[6]),
+            attempts=row[7],
+            scheduled_at=row[8],
+            last_error=row[9],
+            result=json.loads(row[10]) if row[10] else None,
+            created_at=row[11]
+        )
+
+class PostPublisher:
+    """Bounded pool of async workers draining the PostQueue"""
+
+    def __init__(self, queue: PostQueue, api_client, safety_manager,
+                 workers: int = 2, idle_poll: float = 30.0):
+        self.queue = queue
+        self.api_client = api_client
+        self.safety_manager = safety_manager
+        self.workers = workers
+        self.idle_poll = idle_poll
+
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+        self._running = False
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self.queue.requeue_in_flight()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def drain(self) -> None:
+        """Let in-flight publishes finish, then let the workers exit"""
+        self._running = False
+        self._wakeup.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def stop(self) -> None:
+        self._running = False
+        self._wakeup.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self) -> None:
+        """Wake idle workers after something was enqueued"""
+        self._wakeup.set()
+
+    async def _worker(self) -> None:
+        while self._running:
+            if not self.safety_manager.check_rate_limit():
+                await self._idle(self.idle_poll)
+                continue
+
+            post = self.queue.claim_next()
+            if post is None:
+                await self._idle(self.queue.next_due_in())
+                continue
+
+            if not self.safety_manager.is_operational():
+                # X API circuit is open; hand the post back until it can be probed
+                self.queue.release(post)
+                await self._idle(max(1.0, self.safety_manager.seconds_until_recovery_probe()))
+                continue
+
+            await self.publish(post)
+
+    async def _idle(self, timeout: Optional[float]) -> None:
+        timeout = self.idle_poll if timeout is None else min(timeout, self.idle_poll)
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def publish(self, post: OutboundPost) -> None:
+        """Publish one claimed post and record the outcome in the queue"""
+        try:
+            if post.kind == 'thread':
+                result = await self.api_client.create_thread(
+                    post.content, thread_id=post.idempotency_key
+                )
+                for _ in range((result or {}).get('posted', 0)):
+                    self.safety_manager.record_post('thread')
+                if not result or result['status'] != 'complete':
+                    raise RuntimeError((result or {}).get('last_error') or 'Thread incomplete')
+            else:
+                call = asyncio.ensure_future(asyncio.to_thread(
+                    self.api_client.create_post, post.content, post.reply_to
+                ))
+                try:
+                    result = await asyncio.shield(call)
+                except asyncio.CancelledError:
+                    # The request may already be on the wire and the thread cannot be
+                    # interrupted; record how it ended rather than queue it again blind
+                    await self._settle(post, call)
+                    raise
+                self._record_single(post, result)
+                return
+
+            self.queue.mark_done(post, result)
+
+        except asyncio.CancelledError:
+            if post.status == PostStatus.IN_FLIGHT:
+                self.queue.release(post)
+            raise
+        except Exception as e:
+            self._record_failure(post, e)
+
+    def _record_single(self, post: OutboundPost, result: Optional[Dict]) -> None:
+        if not result:
+            raise RuntimeError('Post rejected by X API')
+        self.safety_manager.record_post(post.post_type)
+        self.queue.mark_done(post, result)
+
+    def _record_failure(self, post: OutboundPost, error: Exception) -> None:
+        self.safety_manager.log_api_error('POSTING_ERROR', str(error))
+        self.queue.mark_failed(post, str(error))
+
+    async def _settle(self, post: OutboundPost, call: asyncio.Future) -> None:
+        """Wait for a cancelled publish's thread and record its real outcome"""
+        try:
+            self._record_single(post, await call)
+        except Exception as e:
+            self._record_failure(post, e)
@@ -0,0 +1,75 @@
+import time
+from typing import Dict, Optional
+
+class MinuteBucketCounter:
+    """Sliding-window event counter backed by a ring of per-minute buckets.
+
+    Keeps running totals for the last hour and the last day so recording an
+    event and querying either window are O(1), independent of history size.
+    """
+
+    DAY_MINUTES = 1440
+    HOUR_MINUTES = 60
+
+    def __init__(self):
+        self.buckets = [0] * self.DAY_MINUTES
+        self.current_minute: Optional[int] = None
+        self.hour_total = 0
+        self.day_total = 0
+
+    def _minute(self, now: Optional[float]) -> int:
+        return int((time.time() if now is None else now) // 60)
+
+    def _advance(self, minute: int) -> None:
+        """Move the window forward, expiring buckets that fell out of it"""
+        if self.current_minute is None or minute - self.current_minute >= self.DAY_MINUTES:
+            self.buckets = [0] * self.DAY_MINUTES
+            self.hour_total = 0
+            self.day_total = 0
+            self.current_minute = minute
+            return
+
+        while self.current_minute < minute:
+            self.current_minute += 1
+            # Bucket leaving the hour window is still inside the day window
+            self.hour_total -= self.buckets[(self.current_minute - self.HOUR_MINUTES) % self.DAY_MINUTES]
+            slot = self.current_minute % self.DAY_MINUTES
+            self.day_total -= self.buckets[slot]
+            self.buckets[slot] = 0
+
+    def add(self, count: int = 1, now: Optional[float] = None) -> None:
+        minute = self._minute(now)
+        self._advance(minute)
+        self.buckets[minute % self.DAY_MINUTES] += count
+        self.hour_total += count
+        self.day_total += count
+
+    def last_hour(self, now: Optional[float] = None) -> int:
+        self._advance(self._minute(now))
+        return self.hour_total
+
+    def last_day(self, now: Optional[float] = None) -> int:
+        self._advance(self._minute(now))
+        return self.day_total
+
+    def to_dict(self) -> Dict:
+        """Compact form: only non-empty buckets are stored"""
+        return {
+            'current_minute': self.current_minute,
+            'buckets': {str(i): c for i, c in enumerate(self.buckets) if c}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'MinuteBucketCounter':
+        counter = cls()
+        counter.current_minute = data.get('current_minute')
+        if counter.current_minute is None:
+            return counter
+        for slot, count in data.get('buckets', {}).items():
+            counter.buckets[int(slot)] = count
+        counter.day_total = sum(counter.buckets)
+        counter.hour_total = sum(
+            counter.buckets[(counter.current_minute - i) % cls.DAY_MINUTES]
+            for i in range(cls.HOUR_MINUTES)
+        )
+        return counter
@@ -2,17 +2,12 @@ from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import random
 import asyncio
-from enum import Enum
-
-class UserTier(Enum):
-    OWNER = "owner"              # @0xIvanb - immediate priority
-    TRUSTED = "trusted"          # Known allies
-    RESISTANCE = "resistance"    # Active community members
-    STANDARD = "standard"        # Regular users
-    SUSPICIOUS = "suspicious"    # Potential MegaCorp agents
+from .response_scheduler import ResponseScheduler
+from .interaction_store import UserInteractionStore
+from .tier_engine import TierEngine, UserTier
 
 class ResponseManager:
-    def __init__(self):
+    def __init__(self, db_path: str = 'gonzo_interactions.db', trusted_users: Optional[List[str]] = None):
         self.owner_handle = "0xIvanb"  # Priority handling for owner
         
         self.daily_limits = {
@@ -37,9 +32,15 @@ class ResponseManager:
             UserTier.SUSPICIOUS: 0.1
         }
         
-        self.interaction_history = {}
-        self.daily_counts = {}
+        # Per-user aggregates, recent interactions and daily response counts
+        self.interactions = UserInteractionStore(db_path)
+        # Tier assignments are cached and only recomputed after new interactions
+        self.tiers = TierEngine(self.interactions, allowlist=trusted_users or [])
         self.last_response_time = {}
+        
+        # Delayed responses are dispatched by the scheduler instead of sleeping inline
+        self.scheduler = ResponseScheduler()
+        self.on_response = None  # async callback(mention, response) for scheduled responses
 
     async def handle_mention(self, mention: Dict) -> Optional[Dict]:
         """Process a mention and determine if/how to respond."""
@@ -55,14 +56,50 @@ class ResponseManager:
             return None
         
         # Get user tier and apply rules
-        user_tier = self._get_user_tier(username)
+        user_tier = self._get_user_tier(user_id)
         if not self._should_respond(user_tier):
             return None
         
-        # Apply appropriate delay
-        await self._apply_delay(user_tier)
+        # Reserve the slot now so a burst of delayed mentions cannot all pass the limits
+        self.interactions.record_response(user_id)
+        
+        # Schedule delayed tiers rather than blocking the mention pipeline
+        delay = self._calculate_response_delay(user_tier)
+        if delay > 0:
+            await self.scheduler.schedule(
+                delay,
+                lambda: self._dispatch_response(mention, user_tier),
+                name=f"mention:{mention.get('id', user_id)}"
+            )
+            return {
+                "priority": "scheduled",
+                "response_type": user_tier.value,
+                "content": None,
+                "delay": delay
+            }
         
-        return await self._generate_response(mention, user_tier)
+        return await self._generate_reserved(mention, user_tier)
+
+    async def _dispatch_response(self, mention: Dict, tier: UserTier) -> None:
+        """Generate a scheduled response once it is due and hand it to the consumer."""
+        response = await self._generate_reserved(mention, tier)
+        if response and self.on_response:
+            await self.on_response(mention, response)
+
+    async def _generate_reserved(self, mention: Dict, tier: UserTier) -> Optional[Dict]:
+        """Generate a response whose slot is already counted; give the slot back if none comes."""
+        try:
+            response = await self._generate_response(mention, tier)
+        except Exception:
+            self.interactions.release_response(mention["user_id"])
+            raise
+        if not response:
+            self.interactions.release_response(mention["user_id"])
+        return response
+
+    def get_scheduler_metrics(self) -> Dict:
+        """Queue depth and dispatch lateness of delayed responses."""
+        return self.scheduler.metrics()
 
     async def _generate_owner_response(self, mention: Dict) -> Dict:
         """Generate priority response for owner."""
@@ -82,39 +119,26 @@ class ResponseManager:
         ]
         return random.choice(owner_responses)
 
-    def _get_user_tier(self, username: str) -> UserTier:
-        """Determine user's tier based on history and patterns."""
-        # Implementation for user tier determination
-        return UserTier.STANDARD
+    def _get_user_tier(self, user_id: str) -> UserTier:
+        """Look up the user's cached tier, re-scored only after new interactions."""
+        return self.tiers.get_tier(user_id)
+
+    def retier_users(self) -> Dict[str, int]:
+        """Batch job: re-score every known user, returning counts per tier."""
+        return self.tiers.retier_all()
 
     def _should_respond(self, tier: UserTier) -> bool:
         """Determine if we should respond based on probabilities."""
         return random.random() < self.response_probabilities[tier]
 
-    async def _apply_delay(self, tier: UserTier) -> None:
-        """Apply appropriate delay based on user tier."""
-        delay = self.cooldowns[tier]
-        if delay > 0:
-            # Add some randomness to seem more natural
-            jitter = random.uniform(0.8, 1.2)
-            await asyncio.sleep(delay * jitter)
-
     def _check_limits(self, user_id: str) -> bool:
         """Check if within rate limits."""
-        current_date = datetime.now().date()
-        
-        # Reset daily counts if new day
-        if current_date != getattr(self, 'last_reset_date', None):
-            self.daily_counts = {}
-            self.last_reset_date = current_date
-        
         # Check total daily limit
-        total_responses = sum(self.daily_counts.values())
-        if total_responses >= self.daily_limits["total_responses"]:
+        if self.interactions.total_responses_today() >= self.daily_limits["total_responses"]:
             return False
         
         # Check per-user limit
-        user_responses = self.daily_counts.get(user_id, 0)
+        user_responses = self.interactions.responses_today(user_id)
         if user_responses >= self.daily_limits["per_user"]:
             return False
         
@@ -122,16 +146,8 @@ class ResponseManager:
 
     def update_interaction_history(self, interaction: Dict) -> None:
         """Update interaction history for learning."""
-        user_id = interaction["user_id"]
-        if user_id not in self.interaction_history:
-            self.interaction_history[user_id] = []
-        
-        self.interaction_history[user_id].append({
-            "timestamp": datetime.now(),
-            "type": interaction["type"],
-            "sentiment": interaction.get("sentiment"),
-            "engagement_score": interaction.get("engagement_score")
-        })
+        self.interactions.record_interaction(interaction)
+        self.tiers.mark_dirty(interaction["user_id"])
 
     def _calculate_response_delay(self, tier: UserTier) -> int:
         """Calculate appropriate delay for response."""
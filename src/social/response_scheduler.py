@@ -0,0 +1,105 @@
+import time
+import heapq
+import asyncio
+import itertools
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List
+from ..core.log_pipeline import get_logger
+
+logger = get_logger('response_scheduler')
+
+@dataclass(order=True)
+class ScheduledResponse:
+    """A response job waiting for its due time."""
+    due_at: float
+    seq: int
+    job: Callable[[], Awaitable] = field(compare=False)
+    name: str = field(compare=False, default='')
+
+class ResponseScheduler:
+    """Min-heap of delayed response jobs dispatched by a bounded worker pool.
+
+    ``schedule`` returns immediately; workers sleep until the earliest job is
+    due, so a long delay for one user never holds up anyone else.
+    """
+
+    def __init__(self, workers: int = 4, clock: Callable[[], float] = time.monotonic):
+        self.workers = workers
+        self.clock = clock
+
+        self._heap: List[ScheduledResponse] = []
+        self._seq = itertools.count()
+        self._changed = asyncio.Condition()
+        self._tasks: List[asyncio.Task] = []
+
+        self.stats = {
+            'scheduled': 0,
+            'dispatched': 0,
+            'failed': 0,
+            'in_flight': 0,
+            'max_lateness': 0.0,
+            'total_lateness': 0.0
+        }
+
+    def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def schedule(self, delay: float, job: Callable[[], Awaitable], name: str = '') -> ScheduledResponse:
+        """Queue ``job`` to run after ``delay`` seconds"""
+        item = ScheduledResponse(self.clock() + max(0.0, delay), next(self._seq), job, name)
+        async with self._changed:
+            heapq.heappush(self._heap, item)
+            self.stats['scheduled'] += 1
+            self._changed.notify()
+        self.start()
+        return item
+
+    def metrics(self) -> Dict:
+        dispatched = self.stats['dispatched'] + self.stats['failed']
+        return {
+            'queue_depth': len(self._heap),
+            'next_due_in': max(0.0, self._heap[0].due_at - self.clock()) if self._heap else None,
+            'avg_lateness': self.stats['total_lateness'] / dispatched if dispatched else 0.0,
+            **self.stats
+        }
+
+    async def _next_due(self) -> ScheduledResponse:
+        async with self._changed:
+            while True:
+                if self._heap:
+                    wait = self._heap[0].due_at - self.clock()
+                    if wait <= 0:
+                        return heapq.heappop(self._heap)
+                else:
+                    wait = None
+                try:
+                    # Wake early if an earlier job is scheduled in the meantime
+                    await asyncio.wait_for(self._changed.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _worker(self) -> None:
+        while True:
+            item = await self._next_due()
+            lateness = max(0.0, self.clock() - item.due_at)
+            self.stats['max_lateness'] = max(self.stats['max_lateness'], lateness)
+            self.stats['total_lateness'] += lateness
+            self.stats['in_flight'] += 1
+            try:
+                await item.job()
+                self.stats['dispatched'] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats['failed'] += 1
+                logger.exception(f'Scheduled response {item.name} failed: {e}',
+                                 extra={'error_type': type(e).__name__})
+            finally:
+                self.stats['in_flight'] -= 1
@@ -1,77 +1,165 @@
 import os
 import json
-import logging
-from datetime import datetime, timedelta
+from datetime import datetime, date
 from typing import Dict, List, Optional
+from .rate_window import MinuteBucketCounter
+from ..core.circuit_breaker import CircuitBreakerRegistry, CircuitState, circuit_breakers
+from ..core.log_pipeline import get_logger
+
+logger = get_logger('safety')
 
 class SafetyManager:
-    def __init__(self):
-        logging.basicConfig(
-            filename='gonzo_x.log',
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
-        
-        self.post_history = []
+    # Errors that mean the X API is unusable until a probe succeeds
+    CIRCUIT_TRIPPING_ERRORS = ['AUTHENTICATION_FAILED', 'RATE_LIMIT_EXCEEDED', 'API_UNAVAILABLE']
+
+    def __init__(self,
+                 state_path: str = 'gonzo_safety_state.json',
+                 breakers: Optional[CircuitBreakerRegistry] = None):
+        self.state_path = state_path
+        self.post_counter = MinuteBucketCounter()
         self.max_posts_per_hour = 5
         self.max_posts_per_day = 20
-        self.emergency_shutdown = False
-        
-        self.daily_stats = {
+
+        # Per-dependency circuit breakers (X API, Brave, LLM, embeddings)
+        self.breakers = breakers or circuit_breakers
+
+        self.stats_date = date.today()
+        self.daily_stats = self._empty_stats()
+
+        self._load_state()
+
+    def _empty_stats(self) -> Dict:
+        return {
             'posts': 0,
             'threads': 0,
             'replies': 0,
             'api_errors': 0,
             'rate_limits_hit': 0
         }
-    
+
+    def _roll_day(self) -> None:
+        """Reset daily stats when the calendar day changes"""
+        today = date.today()
+        if today != self.stats_date:
+            self.stats_date = today
+            self.daily_stats = self._empty_stats()
+            self._save_state()
+
     def check_rate_limit(self) -> bool:
         """Check if we're within API rate limits"""
-        now = datetime.now()
-        self.post_history = [ts for ts in self.post_history 
-                           if now - ts < timedelta(days=1)]
-        
-        hour_ago = now - timedelta(hours=1)
-        posts_last_hour = sum(1 for ts in self.post_history 
-                            if ts > hour_ago)
-        posts_today = len(self.post_history)
-        
+        posts_last_hour = self.post_counter.last_hour()
+        posts_today = self.post_counter.last_day()
+
         within_limits = (posts_last_hour < self.max_posts_per_hour and
                         posts_today < self.max_posts_per_day)
-        
+
         if not within_limits:
-            logging.warning(f'Rate limit exceeded: {posts_last_hour}/hr, {posts_today}/day')
+            logger.warning(f'Rate limit exceeded: {posts_last_hour}/hr, {posts_today}/day',
+                           extra={'error_type': 'RATE_LIMIT_EXCEEDED'})
+            self._roll_day()
             self.daily_stats['rate_limits_hit'] += 1
-        
+
         return within_limits
-    
+
     def record_post(self, post_type: str = 'post'):
-        self.post_history.append(datetime.now())
+        self._roll_day()
+        self.post_counter.add()
         self.daily_stats['posts'] += 1
-        
+
         if post_type == 'thread':
             self.daily_stats['threads'] += 1
         elif post_type == 'reply':
             self.daily_stats['replies'] += 1
-    
+
+        self._save_state()
+
     def log_api_error(self, error_type: str, details: str):
-        logging.error(f'API ERROR - {error_type}: {details}')
+        logger.error(f'API ERROR - {error_type}: {details}', extra={'error_type': error_type})
+        self._roll_day()
         self.daily_stats['api_errors'] += 1
-        
-        if error_type in ['AUTHENTICATION_FAILED', 'RATE_LIMIT_EXCEEDED', 'API_UNAVAILABLE']:
+        self._save_state()
+
+        if error_type in self.CIRCUIT_TRIPPING_ERRORS:
             self.trigger_emergency_shutdown()
-    
-    def trigger_emergency_shutdown(self):
-        self.emergency_shutdown = True
-        logging.critical('EMERGENCY SHUTDOWN ACTIVATED: Technical issue detected')
-    
-    def resume_operations(self):
-        if self.emergency_shutdown:
-            self.emergency_shutdown = False
-            logging.info('Technical issues resolved - Operations resumed')
-    
+
+    @property
+    def emergency_shutdown(self) -> bool:
+        return self.breakers.get('x_api').state == CircuitState.OPEN
+
+    def trigger_emergency_shutdown(self, dependency: str = 'x_api'):
+        """Open the dependency's circuit; it is probed again automatically"""
+        breaker = self.breakers.get(dependency)
+        breaker.trip()
+        logger.critical(
+            f'EMERGENCY SHUTDOWN ACTIVATED: {dependency} circuit open, '
+            f'probing in {breaker.seconds_until_probe():.0f}s',
+            extra={'dependency': dependency}
+        )
+
+    def resume_operations(self, dependency: str = 'x_api'):
+        breaker = self.breakers.get(dependency)
+        if breaker.state != CircuitState.CLOSED:
+            breaker.reset()
+            logger.info(f'Technical issues resolved - {dependency} operations resumed',
+                        extra={'dependency': dependency})
+
+    def record_dependency_result(self, dependency: str, success: bool) -> None:
+        """Feed a call outcome into the dependency's circuit breaker"""
+        breaker = self.breakers.get(dependency)
+        was_closed = breaker.state == CircuitState.CLOSED
+        if success:
+            breaker.record_success()
+            if not was_closed:
+                logger.info(f'{dependency} circuit closed - dependency recovered',
+                            extra={'dependency': dependency})
+        else:
+            breaker.record_failure()
+            if was_closed and breaker.state == CircuitState.OPEN:
+                logger.critical(f'{dependency} circuit opened after repeated failures',
+                                extra={'dependency': dependency})
+
+    def seconds_until_recovery_probe(self) -> float:
+        """How long until the X API circuit may be probed again"""
+        return self.breakers.get('x_api').seconds_until_probe()
+
     def get_technical_stats(self) -> Dict:
-        return self.daily_stats.copy()
-    
+        self._roll_day()
+        stats = self.daily_stats.copy()
+        stats['posts_last_hour'] = self.post_counter.last_hour()
+        stats['posts_last_day'] = self.post_counter.last_day()
+        return stats
+
     def is_operational(self) -> bool:
-        return not self.emergency_shutdown
\ No newline at end of file
+        """Whether X API work may proceed. A read-only check: the half-open probe
+        slot is only claimed by the API client right before a real call."""
+        return self.breakers.get('x_api').is_available()
+
+    def get_circuit_metrics(self) -> Dict:
+        return self.breakers.metrics()
+
+    def _save_state(self) -> None:
+        """Persist counters so limits survive a restart"""
+        state = {
+            'stats_date': self.stats_date.isoformat(),
+            'daily_stats': self.daily_stats,
+            'post_counter': self.post_counter.to_dict()
+        }
+        try:
+            tmp_path = f'{self.state_path}.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            logger.error(f'Failed to save safety state: {e}')
+
+    def _load_state(self) -> None:
+        if not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+            self.post_counter = MinuteBucketCounter.from_dict(state.get('post_counter', {}))
+            if state.get('stats_date') == self.stats_date.isoformat():
+                self.daily_stats.update(state.get('daily_stats', {}))
+        except (OSError, ValueError) as e:
+            logger.error(f'Failed to load safety state: {e}')
@@ -0,0 +1,139 @@
+import json
+import hashlib
+import sqlite3
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Dict, List, Optional
+
+class ThreadStatus(Enum):
+    PENDING = "pending"
+    PARTIAL = "partial"
+    COMPLETE = "complete"
+
+@dataclass
+class ThreadJob:
+    """Progress record for a single thread being published."""
+    thread_id: str
+    posts: List[str]
+    tweet_ids: List[str] = field(default_factory=list)
+    next_index: int = 0
+    status: ThreadStatus = ThreadStatus.PENDING
+    last_error: Optional[str] = None
+    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    @property
+    def is_complete(self) -> bool:
+        return self.next_index >= len(self.posts)
+
+    @property
+    def last_tweet_id(self) -> Optional[str]:
+        return self.tweet_ids[-1] if self.tweet_ids else None
+
+    def to_dict(self) -> Dict:
+        return {
+            'thread_id': self.thread_id,
+            'status': self.status.value,
+            'tweet_ids': list(self.tweet_ids),
+            'next_index': self.next_index,
+            'total': len(self.posts),
+            'last_error': self.last_error
+        }
+
+def make_thread_id(posts: List[str]) -> str:
+    """Derive a stable thread ID from the thread's content"""
+    digest = hashlib.sha256('\x1e'.join(str(p) for p in posts).encode('utf-8'))
+    return digest.hexdigest()[:32]
+
+class ThreadJobStore:
+    """SQLite-backed store recording per-thread publishing progress"""
+
+    def __init__(self, db_path: str = 'gonzo_threads.db'):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute(
+            '''CREATE TABLE IF NOT EXISTS thread_jobs (
+                thread_id TEXT PRIMARY KEY,
+                posts TEXT NOT NULL,
+                tweet_ids TEXT NOT NULL,
+                next_index INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                last_error TEXT,
+                updated_at TEXT NOT NULL
+            )'''
+        )
+        self.conn.commit()
+
+    def get(self, thread_id: str) -> Optional[ThreadJob]:
+        row = self.conn.execute(
+            'SELECT thread_id, posts, tweet_ids, next_index, status, last_error, updated_at '
+            'FROM thread_jobs WHERE thread_id = ?',
+            (thread_id,)
+        ).fetchone()
+        if not row:
+            return None
+        return ThreadJob(
+            thread_id=row[0],
+            posts=json.loads(row[1]),
+            tweet_ids=json.loads(row[2]),
+            next_index=row[3],
+            status=ThreadStatus(row[4]),
+            last_error=row[5],
+            updated_at=row[6]
+        )
+
+    def get_or_create(self, thread_id: str, posts: List[str]) -> ThreadJob:
+        job = self.get(thread_id)
+        if job is None:
+            job = ThreadJob(thread_id=thread_id, posts=[str(p) for p in posts])
+            self.save(job)
+        return job
+
+    def save(self, job: ThreadJob) -> None:
+        job.updated_at = datetime.now().isoformat()
+        self.conn.execute(
+            'INSERT OR REPLACE INTO thread_jobs '
+            '(thread_id, posts, tweet_ids, next_index, status, last_error, updated_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (job.thread_id, json.dumps(job.posts), json.dumps(job.tweet_ids),
+             job.next_index, job.status.value, job.last_error, job.updated_at)
+        )
+        self.conn.commit()
+
+    def unfinished(self) -> List[ThreadJob]:
+        """Threads that were started but not completed"""
+        rows = self.conn.execute(
+            'SELECT thread_id FROM thread_jobs WHERE status != ?',
+            (ThreadStatus.COMPLETE.value,)
+        ).fetchall()
+        return [self.get(row[0]) for row in rows]
+
+    def delete(self, thread_id: str) -> None:
+        self.conn.execute('DELETE FROM thread_jobs WHERE thread_id = ?', (thread_id,))
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+class ThreadLocks:
+    """Per-thread asyncio locks so a thread is never published twice concurrently"""
+
+    def __init__(self):
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._holders: Dict[str, int] = {}
+
+    @asynccontextmanager
+    async def hold(self, thread_id: str):
+        if thread_id not in self._locks:
+            self._locks[thread_id] = asyncio.Lock()
+        self._holders[thread_id] = self._holders.get(thread_id, 0) + 1
+        try:
+            async with self._locks[thread_id]:
+                yield
+        finally:
+            self._holders[thread_id] -= 1
+            if not self._holders[thread_id]:
+                del self._holders[thread_id]
+                del self._locks[thread_id]
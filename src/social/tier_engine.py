@@ -0,0 +1,120 @@
+import time
+import math
+from collections import OrderedDict
+from enum import Enum
+from typing import Callable, Dict, Iterable, Set, Tuple
+from .interaction_store import UserInteractionStore, UserAggregate
+
+class UserTier(Enum):
+    OWNER = "owner"              # @0xIvanb - immediate priority
+    TRUSTED = "trusted"          # Known allies
+    RESISTANCE = "resistance"    # Active community members
+    STANDARD = "standard"        # Regular users
+    SUSPICIOUS = "suspicious"    # Potential MegaCorp agents
+
+class TierEngine:
+    """Scores users from their interaction aggregates and caches the resulting tier.
+
+    A user's tier is recomputed only when new interactions arrive (the user
+    is marked dirty) or the cached assignment outlives its TTL. Each
+    recompute reads one precomputed aggregate, so lookups stay O(1);
+    ``retier_all`` re-scores everyone as a batch job.
+    """
+
+    def __init__(self,
+                 store: UserInteractionStore,
+                 owner_ids: Iterable[str] = (),
+                 allowlist: Iterable[str] = (),
+                 ttl: float = 3600.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.store = store
+        self.owner_ids: Set[str] = set(owner_ids)
+        self.allowlist: Set[str] = set(allowlist)
+        self.ttl = ttl
+        self.clock = clock
+
+        self.thresholds = {
+            "trusted_score": 0.75,
+            "trusted_min_interactions": 20,
+            "resistance_score": 0.55,
+            "resistance_min_interactions": 5,
+            "suspicious_sentiment": -0.5,
+            "suspicious_min_samples": 3,
+            "suspicious_reports": 3,
+            "suspicious_report_ratio": 0.2
+        }
+
+        self._cache: "OrderedDict[str, Tuple[UserTier, float]]" = OrderedDict()
+        self._dirty: Set[str] = set()
+        self.stats = {"hits": 0, "recomputes": 0}
+
+    def mark_dirty(self, user_id: str) -> None:
+        """Flag a user for re-scoring after a new interaction."""
+        self._dirty.add(user_id)
+
+    def get_tier(self, user_id: str) -> UserTier:
+        cached = self._cache.get(user_id)
+        if cached and user_id not in self._dirty and cached[1] > self.clock():
+            self.stats["hits"] += 1
+            self._cache.move_to_end(user_id)
+            return cached[0]
+        return self._recompute(self.store.get(user_id))
+
+    def score(self, aggregate: UserAggregate) -> float:
+        """Blend engagement, sentiment and activity into a 0-1 score."""
+        sentiment = (aggregate.avg_sentiment + 1) / 2 if aggregate.sentiment_count else 0.5
+        activity = min(1.0, math.log1p(aggregate.interactions) / math.log1p(50))
+        return 0.5 * aggregate.avg_engagement + 0.3 * sentiment + 0.2 * activity
+
+    def classify(self, aggregate: UserAggregate) -> UserTier:
+        t = self.thresholds
+        if aggregate.user_id in self.owner_ids:
+            return UserTier.OWNER
+        if aggregate.user_id in self.allowlist:
+            return UserTier.TRUSTED
+
+        # Report/abuse signals and hostile sentiment outweigh engagement
+        if aggregate.reports >= t["suspicious_reports"] or (
+            aggregate.interactions and
+            aggregate.reports / aggregate.interactions >= t["suspicious_report_ratio"]
+        ):
+            return UserTier.SUSPICIOUS
+        if (aggregate.sentiment_count >= t["suspicious_min_samples"] and
+                aggregate.avg_sentiment < t["suspicious_sentiment"]):
+            return UserTier.SUSPICIOUS
+
+        score = self.score(aggregate)
+        if score >= t["trusted_score"] and aggregate.interactions >= t["trusted_min_interactions"]:
+            return UserTier.TRUSTED
+        if score >= t["resistance_score"] and aggregate.interactions >= t["resistance_min_interactions"]:
+            return UserTier.RESISTANCE
+        return UserTier.STANDARD
+
+    def retier_all(self, batch_size: int = 500) -> Dict[str, int]:
+        """Batch job: re-score every known user and persist the new tiers."""
+        counts = {tier.value: 0 for tier in UserTier}
+        for batch in self.store.iter_aggregates(batch_size):
+            updates = []
+            for aggregate in batch:
+                tier = self._remember(aggregate.user_id, self.classify(aggregate))
+                counts[tier.value] += 1
+                if tier.value != aggregate.tier:
+                    updates.append((aggregate.user_id, tier.value))
+            self.store.set_tiers(updates)
+        return counts
+
+    def _recompute(self, aggregate: UserAggregate) -> UserTier:
+        self.stats["recomputes"] += 1
+        tier = self._remember(aggregate.user_id, self.classify(aggregate))
+        if tier.value != aggregate.tier:
+            self.store.set_tiers([(aggregate.user_id, tier.value)])
+        return tier
+
+    def _remember(self, user_id: str, tier: UserTier) -> UserTier:
+        self._cache[user_id] = (tier, self.clock() + self.ttl)
+        self._cache.move_to_end(user_id)
+        self._dirty.discard(user_id)
+        if len(self._cache) > self.store.max_cached_users:
+            # Drop the least recently used assignment; it is recomputed on next lookup
+            self._cache.popitem(last=False)
+        return tier
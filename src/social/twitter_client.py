@@ -4,6 +4,9 @@ from datetime import datetime
 import asyncio
 
 from ..config.settings import Config
+from ..core.log_pipeline import get_logger
+
+logger = get_logger('twitter')
 
 class TwitterClient:
     def __init__(self, config: Config):
@@ -36,7 +39,7 @@ class TwitterClient:
             self.last_tweet_time = datetime.now()
             return response.data
         except Exception as e:
-            print(f"Error posting tweet: {e}")
+            logger.error(f'Error posting tweet: {e}', extra={'error_type': type(e).__name__})
             raise
     
     async def post_thread(self, tweets: List[str]) -> List[Dict]:
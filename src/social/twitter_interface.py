@@ -1,6 +1,7 @@
 from typing import List, Dict, Optional
 from datetime import datetime
 import asyncio
+from ..core.scheduler import Job, JobScheduler
 
 class TwitterInterface:
     def __init__(self):
@@ -69,8 +70,11 @@ class TwitterInterface:
             proposal_description="Proposal to enhance resistance capabilities against MegaCorp influence"
         )
 
-    async def schedule_regular_updates(self):
+    def schedule_regular_updates(self, scheduler: JobScheduler) -> Job:
         """Schedule regular tweet updates including token information."""
-        while True:
-            # Implementation for scheduled tweets
-            await asyncio.sleep(7200)  # 2 hours
+        return scheduler.add_job('regular_updates', self.post_regular_update, interval=7200, jitter=300)  # 2 hours
+
+    async def post_regular_update(self):
+        """Post one scheduled update."""
+        # Implementation for scheduled tweets
+        pass
@@ -3,11 +3,25 @@ from datetime import datetime
 import asyncio
 
 from ..intelligence.brave_intelligence import BraveIntelligence
+from ..intelligence.intel_snapshot import IntelSnapshotService
 from ..core.response_crafter import ResponseCrafter, ResponseTone
+from ..analysis.keyword_matcher import KeywordMatcher
+
+WARNING_MATCHER = KeywordMatcher({
+    "warning": [
+        "corporate control",
+        "privacy violation",
+        "centralization",
+        "surveillance",
+        "regulatory capture"
+    ]
+})
 
 class TwitterResponder:
-    def __init__(self):
+    def __init__(self, intel_snapshots: Optional[IntelSnapshotService] = None):
         self.brave_intel = BraveIntelligence()
+        # Responders read a shared snapshot instead of searching per mention
+        self.intel_snapshots = intel_snapshots or IntelSnapshotService(self.brave_intel.gather_intel)
         self.response_crafter = ResponseCrafter()
         
         self.response_contexts = {
@@ -33,8 +47,8 @@ class TwitterResponder:
 
     async def generate_response(self, trigger: Dict) -> Dict:
         """Generate a response with supporting evidence."""
-        # Gather relevant intelligence
-        intel = await self.brave_intel.gather_intel()
+        # Read the current intelligence snapshot
+        intel = (await self.intel_snapshots.get()).data
         
         # Determine response context
         context = self._determine_context(trigger, intel)
@@ -65,16 +79,8 @@ class TwitterResponder:
 
     def _is_warning_trigger(self, trigger: Dict, intel: Dict) -> bool:
         """Check if trigger requires a warning response."""
-        warning_indicators = [
-            "corporate control",
-            "privacy violation",
-            "centralization",
-            "surveillance",
-            "regulatory capture"
-        ]
-        
-        content = str(trigger.get("content", "")).lower()
-        return any(indicator in content for indicator in warning_indicators)
+        content = str(trigger.get("content", ""))
+        return WARNING_MATCHER.contains_any(content)
 
     async def _generate_thread(self, context: Dict, intel: Dict) -> List[str]:
         """Generate a thread with supporting evidence."""
@@ -1,13 +1,19 @@
 import os
+import asyncio
 import requests
 import time
 from requests_oauthlib import OAuth1
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
+from .thread_publisher import ThreadJobStore, ThreadLocks, ThreadStatus, make_thread_id
+from ..core.circuit_breaker import CircuitOpenError
+from ..core.log_pipeline import get_logger
+
+logger = get_logger('x_api')
 
 class XAPIClient:
-    def __init__(self):
+    def __init__(self, thread_db_path: str = 'gonzo_threads.db'):
         load_dotenv()
         
         # Load credentials
@@ -34,11 +40,69 @@ class XAPIClient:
         self.rate_limits = {
             'mentions': {'calls': 0, 'reset_time': time.time(), 'max_calls': 180, 'window': 900},  # 180 calls per 15 min
             'posts': {'calls': 0, 'reset_time': time.time(), 'max_calls': 50, 'window': 900},      # 50 posts per 15 min
+            'search': {'calls': 0, 'reset_time': time.time(), 'max_calls': 180, 'window': 900},    # 180 searches per 15 min
             'general': {'calls': 0, 'reset_time': time.time(), 'max_calls': 180, 'window': 900}    # 180 calls per 15 min
         }
         
         # Store last mention ID for pagination
         self.last_mention_id = None
+        
+        # Durable thread progress so partial threads can be resumed
+        self.thread_store = ThreadJobStore(thread_db_path)
+        self.thread_locks = ThreadLocks()
+        
+        # Optional CircuitBreaker fed with the outcome of every API call
+        self.circuit_breaker = None
+
+    def snapshot_state(self) -> Dict:
+        """Mention cursor and rate-limit windows, so a restart neither re-reads mentions nor resets limits"""
+        return {
+            'user_id': self.user_id,
+            'last_mention_id': self.last_mention_id,
+            'rate_limits': self.rate_limits
+        }
+
+    def restore_state(self, state: Dict) -> None:
+        self.user_id = self.user_id or state.get('user_id')
+        self.last_mention_id = state.get('last_mention_id') or self.last_mention_id
+        now = time.time()
+        for bucket, saved in state.get('rate_limits', {}).items():
+            limit = self.rate_limits.get(bucket)
+            # Windows that ended while we were down start fresh
+            if limit is not None and now - saved.get('reset_time', 0) < limit['window']:
+                limit['calls'] = saved.get('calls', 0)
+                limit['reset_time'] = saved['reset_time']
+
+    def _send(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """Issue an authenticated request and report its outcome to the circuit breaker"""
+        if self.circuit_breaker and not self.circuit_breaker.allow_request():
+            raise CircuitOpenError('x_api', self.circuit_breaker.seconds_until_probe())
+        started = time.monotonic()
+        try:
+            response = requests.request(method, endpoint, auth=self.auth, **kwargs)
+        except requests.RequestException as e:
+            if self.circuit_breaker:
+                self.circuit_breaker.record_failure()
+            logger.warning(f'X API {method} failed: {e}', extra={
+                'endpoint': endpoint,
+                'latency_ms': round((time.monotonic() - started) * 1000, 1),
+                'error_type': type(e).__name__
+            })
+            raise
+        
+        logger.debug(f'X API {method} {response.status_code}', extra={
+            'endpoint': endpoint,
+            'status': response.status_code,
+            'latency_ms': round((time.monotonic() - started) * 1000, 1)
+        })
+        
+        if self.circuit_breaker:
+            # Server errors and throttling mean the dependency is unhealthy
+            if response.status_code >= 500 or response.status_code == 429:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+        return response
 
     def _check_rate_limit(self, endpoint_type: str) -> bool:
         """Check if we're within rate limits for the specified endpoint type"""
@@ -68,7 +132,7 @@ class XAPIClient:
         """Wait if rate limit is exceeded"""
         while not self._check_rate_limit(endpoint_type):
             reset_time = self._get_rate_limit_reset(endpoint_type)
-            print(f'Rate limit exceeded for {endpoint_type}. Waiting {reset_time} seconds...')
+            logger.warning(f'Rate limit exceeded for {endpoint_type}. Waiting {reset_time} seconds...')
             time.sleep(min(reset_time + 1, 60))  # Wait up to 60 seconds
     
     def get_user_id(self) -> Optional[str]:
@@ -80,16 +144,13 @@ class XAPIClient:
             self._wait_for_rate_limit('general')
                 
             endpoint = f'{self.base_url}/users/me'
-            response = requests.get(
-                endpoint,
-                auth=self.auth
-            )
+            response = self._send('GET', endpoint)
             
             self._increment_rate_limit('general')
             
             if response.status_code == 429:  # Rate limit exceeded
                 reset_time = int(response.headers.get('x-rate-limit-reset', 900))
-                print(f'Rate limit exceeded for user lookup. Reset in {reset_time} seconds.')
+                logger.warning(f'Rate limit exceeded for user lookup. Reset in {reset_time} seconds.', extra={'error_type': 'RATE_LIMIT_EXCEEDED'})
                 return None
                 
             response.raise_for_status()
@@ -97,7 +158,7 @@ class XAPIClient:
             return self.user_id
             
         except Exception as e:
-            print(f'Error getting user ID: {str(e)}')
+            logger.error(f'Error getting user ID: {str(e)}', extra={'error_type': type(e).__name__})
             return None
 
     def _format_datetime(self, dt: datetime) -> str:
@@ -136,17 +197,13 @@ class XAPIClient:
             
             # Make request
             endpoint = f'{self.base_url}/users/{self.user_id}/mentions'
-            response = requests.get(
-                endpoint,
-                params=params,
-                auth=self.auth
-            )
+            response = self._send('GET', endpoint, params=params)
             
             self._increment_rate_limit('mentions')
             
             if response.status_code == 429:  # Rate limit exceeded
                 reset_time = int(response.headers.get('x-rate-limit-reset', 900))
-                print(f'Rate limit exceeded for mentions. Reset in {reset_time} seconds.')
+                logger.warning(f'Rate limit exceeded for mentions. Reset in {reset_time} seconds.', extra={'error_type': 'RATE_LIMIT_EXCEEDED'})
                 return []
             
             response.raise_for_status()
@@ -159,87 +216,126 @@ class XAPIClient:
             return []
             
         except Exception as e:
-            print(f'Error getting mentions: {str(e)}')
+            logger.error(f'Error getting mentions: {str(e)}', extra={'error_type': type(e).__name__})
             return []
     
-    def create_post(self, text: str) -> Dict:
-        """Create a new post with rate limiting"""
+    def search_recent(self, query: str, since_minutes: int = 5, max_results: int = 10) -> List[Dict]:
+        """Search posts from the last ``since_minutes`` matching ``query``"""
         try:
-            self._wait_for_rate_limit('posts')
+            self._wait_for_rate_limit('search')
             
-            endpoint = f'{self.base_url}/tweets'
-            headers = {'Content-Type': 'application/json'}
-            data = {'text': str(text)[:280]}  # Ensure text is a string and within limits
+            start_time = datetime.now(timezone.utc) - timedelta(minutes=since_minutes)
+            params = {
+                'query': query,
+                'start_time': self._format_datetime(start_time),
+                'max_results': max(10, min(100, max_results)),  # API accepts 10-100
+                'tweet.fields': 'created_at,text,author_id,public_metrics'
+            }
             
-            response = requests.post(
-                endpoint,
-                headers=headers,
-                json=data,
-                auth=self.auth
-            )
+            endpoint = f'{self.base_url}/tweets/search/recent'
+            response = self._send('GET', endpoint, params=params)
             
-            self._increment_rate_limit('posts')
+            self._increment_rate_limit('search')
             
             if response.status_code == 429:  # Rate limit exceeded
                 reset_time = int(response.headers.get('x-rate-limit-reset', 900))
-                print(f'Rate limit exceeded for posting. Reset in {reset_time} seconds.')
-                return None
+                logger.warning(f'Rate limit exceeded for search. Reset in {reset_time} seconds.', extra={'error_type': 'RATE_LIMIT_EXCEEDED'})
+                return []
             
             response.raise_for_status()
-            return response.json()
+            return response.json().get('data', [])
+            
+        except Exception as e:
+            logger.error(f'Error searching posts: {str(e)}', extra={'error_type': type(e).__name__})
+            return []
+    
+    def create_post(self, text: str, reply_to: Optional[str] = None) -> Dict:
+        """Create a new post with rate limiting"""
+        try:
+            return self._post_tweet(text, reply_to)
             
         except Exception as e:
-            print(f'Error creating post: {str(e)}')
+            logger.error(f'Error creating post: {str(e)}', extra={'error_type': type(e).__name__})
             return None
 
-    def create_thread(self, posts: List[str]) -> List[Dict]:
-        """Create a thread with rate limiting"""
+    def _post_tweet(self, text: str, reply_to: Optional[str] = None) -> Dict:
+        """Post a single tweet, optionally as a reply. Raises on failure."""
+        self._wait_for_rate_limit('posts')
+        
+        endpoint = f'{self.base_url}/tweets'
+        headers = {'Content-Type': 'application/json'}
+        data = {'text': str(text)[:280]}  # Ensure text is a string and within limits
+        
+        if reply_to:
+            data['reply'] = {
+                'in_reply_to_tweet_id': reply_to
+            }
+        
+        response = self._send('POST', endpoint, headers=headers, json=data)
+        
+        self._increment_rate_limit('posts')
+        
+        if response.status_code == 429:  # Rate limit exceeded
+            reset_time = int(response.headers.get('x-rate-limit-reset', 900))
+            raise RuntimeError(f'Rate limit exceeded. Reset in {reset_time} seconds.')
+        
+        response.raise_for_status()
+        return response.json()
+
+    async def create_thread(self,
+                            posts: List[str],
+                            thread_id: Optional[str] = None,
+                            post_delay: float = 2.0) -> Optional[Dict]:
+        """Create or resume a thread, recording progress after every tweet.
+        
+        Progress is keyed by ``thread_id`` (derived from the content when not
+        given), so calling this again after a partial failure continues from
+        the last tweet that went out instead of posting duplicates.
+        
+        Returns the thread job progress, including ``posted`` for the number
+        of tweets sent by this call, or None if there was nothing to post.
+        """
         if not posts:
             return None
-            
-        responses = []
-        previous_tweet_id = None
         
-        for post in posts:
-            try:
-                self._wait_for_rate_limit('posts')
-                
-                endpoint = f'{self.base_url}/tweets'
-                headers = {'Content-Type': 'application/json'}
-                
-                # Ensure post is a string and within limits
-                text = str(post)[:280]
-                data = {'text': text}
-                
-                if previous_tweet_id:
-                    data['reply'] = {
-                        'in_reply_to_tweet_id': previous_tweet_id
-                    }
-                
-                response = requests.post(
-                    endpoint,
-                    headers=headers,
-                    json=data,
-                    auth=self.auth
-                )
-                
-                self._increment_rate_limit('posts')
-                
-                if response.status_code == 429:  # Rate limit exceeded
-                    reset_time = int(response.headers.get('x-rate-limit-reset', 900))
-                    print(f'Rate limit exceeded in thread creation. Reset in {reset_time} seconds.')
+        thread_id = thread_id or make_thread_id(posts)
+        
+        async with self.thread_locks.hold(thread_id):
+            job = self.thread_store.get_or_create(thread_id, posts)
+            posted = 0
+            
+            while not job.is_complete:
+                if posted:
+                    # Small delay between thread posts to prevent rapid-fire posting
+                    await asyncio.sleep(post_delay)
+                try:
+                    result = await asyncio.to_thread(
+                        self._post_tweet,
+                        job.posts[job.next_index],
+                        job.last_tweet_id
+                    )
+                except Exception as e:
+                    logger.error(f'Error in thread creation: {str(e)}', extra={'error_type': type(e).__name__, 'thread_id': thread_id})
+                    job.status = ThreadStatus.PARTIAL if job.tweet_ids else ThreadStatus.PENDING
+                    job.last_error = str(e)
+                    self.thread_store.save(job)
                     break
                 
-                response.raise_for_status()
-                result = response.json()
-                responses.append(result)
-                previous_tweet_id = result.get('data', {}).get('id')
-                
-                # Small delay between thread posts to prevent rapid-fire posting
-                time.sleep(2)
-                
-            except Exception as e:
-                print(f'Error in thread creation: {str(e)}')
-                return None
-            
-        return responses
\ No newline at end of file
+                tweet_id = result.get('data', {}).get('id')
+                job.tweet_ids.append(tweet_id)
+                job.next_index += 1
+                job.status = ThreadStatus.COMPLETE if job.is_complete else ThreadStatus.PARTIAL
+                job.last_error = None
+                self.thread_store.save(job)
+                posted += 1
+        
+        progress = job.to_dict()
+        progress['posted'] = posted
+        return progress
+
+    async def resume_unfinished_threads(self) -> List[Dict]:
+        """Resume every thread left half-published by an earlier run"""
+        results = []
+        for job in self.thread_store.unfinished():
+            results.append(await self.create_thread(job.posts, thread_id=job.thread_id))
+        return results
@@ -4,38 +4,48 @@ from .x_api_client import XAPIClient
 from .content_generator import ContentGenerator, ContentType
 from .x_engagement_system import XEngagementSystem, EngagementType
 from .safety_manager import SafetyManager
+from .post_queue import PostQueue, PostPublisher, PostLane
 
 class XIntegration:
-    def __init__(self):
+    def __init__(self, outbox_db_path: str = 'gonzo_outbox.db'):
         self.api_client = XAPIClient()
         self.content_generator = ContentGenerator()
         self.engagement_system = XEngagementSystem()
         self.safety_manager = SafetyManager()
+        self.api_client.circuit_breaker = self.safety_manager.breakers.get('x_api')
+        
+        # Outbound posts are queued and drained by rate-limit aware publishers
+        self.post_queue = PostQueue(outbox_db_path)
+        self.publisher = PostPublisher(self.post_queue, self.api_client, self.safety_manager)
 
-    async def post_content(self, content_type: ContentType, context: Optional[Dict] = None) -> Dict:
-        """Generate and post Gonzo content"""
-        try:
-            # Check technical limits
-            if not self.safety_manager.check_rate_limit():
-                raise Exception('Rate limit exceeded')
+    def start(self) -> None:
+        """Start the outbound publishers (requires a running event loop)"""
+        self.publisher.start()
+
+    async def drain(self) -> None:
+        """Finish posts being published now; the rest stay queued on disk"""
+        await self.publisher.drain()
 
+    async def stop(self) -> None:
+        """Stop the outbound publishers; unsent posts stay queued on disk"""
+        await self.publisher.stop()
+
+    async def post_content(self,
+                           content_type: ContentType,
+                           context: Optional[Dict] = None,
+                           lane: PostLane = PostLane.STANDARD,
+                           scheduled_at: Optional[float] = None) -> Dict:
+        """Generate Gonzo content and queue it for publishing"""
+        try:
             # Generate content using Gonzo's system
             content = await self.content_generator.generate_content(content_type, context)
             
-            # Post content
             if len(content) <= 280:
-                response = self.api_client.create_post(content)
-                if response:
-                    self.safety_manager.record_post()
-                return response
-            else:
-                lines = content.split('\n')
-                chunks = self._chunk_content(lines)
-                response = self.api_client.create_thread(chunks)
-                if response:
-                    for _ in chunks:
-                        self.safety_manager.record_post('thread')
-                return response
+                return self._enqueue('post', content, lane, 'post', scheduled_at)
+            
+            lines = content.split('\n')
+            chunks = self._chunk_content(lines)
+            return self._enqueue('thread', chunks, lane, 'thread', scheduled_at)
                 
         except Exception as e:
             self.safety_manager.log_api_error('POSTING_ERROR', str(e))
@@ -43,13 +53,10 @@ class XIntegration:
 
     async def handle_engagement(self, 
                               trigger_content: Dict,
-                              priority: str = 'medium') -> Dict:
-        """Handle engagement based on Gonzo's system"""
+                              priority: str = 'medium',
+                              lane: Optional[PostLane] = None) -> Dict:
+        """Handle engagement based on Gonzo's system and queue the response"""
         try:
-            # Check technical limits
-            if not self.safety_manager.check_rate_limit():
-                raise Exception('Rate limit exceeded')
-
             # Analyze engagement opportunity
             should_engage, priority = await self.engagement_system.analyze_engagement_opportunity(trigger_content)
             
@@ -57,29 +64,44 @@ class XIntegration:
                 return None
 
             # Generate response using Gonzo's system
-            engagement_type = 'THREAD' if priority in ['CRITICAL', 'HIGH'] else 'REPLY'
+            priority_name = self._priority_name(priority)
+            engagement_type = 'THREAD' if priority_name in ['CRITICAL', 'HIGH'] else 'REPLY'
             response = await self.engagement_system.generate_response(
                 content=trigger_content,
                 engagement_type=engagement_type
             )
             
-            # Post the response
+            if lane is None:
+                lane = PostLane.CRITICAL if priority_name == 'CRITICAL' else PostLane.STANDARD
+            
+            # Queue the response
             if engagement_type == 'THREAD':
-                result = self.api_client.create_thread(response)
-                if result:
-                    for _ in response:
-                        self.safety_manager.record_post('thread')
-                return result
-            else:
-                result = self.api_client.create_post(response)
-                if result:
-                    self.safety_manager.record_post('reply')
-                return result
+                return self._enqueue('thread', response, lane, 'thread')
+            return self._enqueue('post', response, lane, 'reply',
+                                 reply_to=trigger_content.get('tweet_id'))
                 
         except Exception as e:
             self.safety_manager.log_api_error('ENGAGEMENT_ERROR', str(e))
             raise
 
+    def _enqueue(self, kind: str, content, lane: PostLane, post_type: str,
+                 scheduled_at: Optional[float] = None,
+                 reply_to: Optional[str] = None) -> Dict:
+        """Queue content for the publishers and wake them up"""
+        post = self.post_queue.enqueue(
+            kind, content,
+            lane=lane,
+            post_type=post_type,
+            reply_to=reply_to,
+            scheduled_at=scheduled_at
+        )
+        self.publisher.notify()
+        return post.to_dict()
+
+    def _priority_name(self, priority) -> str:
+        """Normalize EngagementPriority enums and plain strings"""
+        return getattr(priority, 'name', str(priority)).upper()
+
     def _chunk_content(self, lines: List[str], max_length: int = 280) -> List[str]:
         """Break content into tweet-sized chunks while preserving line breaks"""
         chunks = []
@@ -107,5 +129,7 @@ class XIntegration:
         """Get technical system status"""
         return {
             'operational': self.safety_manager.is_operational(),
-            'stats': self.safety_manager.get_technical_stats()
+            'stats': self.safety_manager.get_technical_stats(),
+            'outbox': self.post_queue.stats(),
+            'circuits': self.safety_manager.get_circuit_metrics()
         }
\ No newline at end of file
@@ -0,0 +1,157 @@
+import json
+import time
+import zlib
+import random
+import asyncio
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+from aiohttp import web
+
+SEARCH_PATH = '/res/v1/web/search'
+
+AGES = ['12 minutes ago', '2 hours ago', '1 day ago', '3 days ago', '6 days ago']
+SIGNALS = ['Breaking', 'Report finds', 'Major', 'Developing', 'Analysis']
+
+class FakeBraveProvider:
+    """In-process stand-in for the Brave web search API.
+
+    Serves recorded results where the corpus has them and deterministic
+    synthetic results otherwise, with configurable latency, injected
+    server errors and a per-minute rate limit that answers 429. Instances
+    are callable, so they plug straight into ``BraveClient(transport=...)``.
+    """
+
+    def __init__(self,
+                 corpus: Optional[Dict[str, List[Dict]]] = None,
+                 latency: Union[float, Tuple[float, float]] = 0.0,
+                 error_rate: float = 0.0,
+                 rate_limit_per_minute: Optional[int] = None,
+                 seed: int = 3030,
+                 clock: Callable[[], float] = time.monotonic):
+        self.corpus = corpus or {}
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit_per_minute = rate_limit_per_minute
+        self.clock = clock
+
+        self._rng = random.Random(seed)
+        self._seed = seed
+        self._fail_next: Deque[int] = deque()
+        self._window: Deque[float] = deque()
+
+        self.calls: List[Dict] = []
+        self.stats = {'served': 0, 'errors': 0, 'rate_limited': 0}
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> 'FakeBraveProvider':
+        """Load a recorded corpus: ``{query: [results]}`` or ``{query: <raw API response>}``."""
+        with open(path) as f:
+            recorded = json.load(f)
+        corpus = {
+            query: (body.get('web', {}).get('results', []) if isinstance(body, dict) else body)
+            for query, body in recorded.items()
+        }
+        return cls(corpus, **kwargs)
+
+    def fail_next(self, count: int = 1, status: int = 500) -> None:
+        """Make the next ``count`` requests fail with ``status``."""
+        self._fail_next.extend([status] * count)
+
+    async def __call__(self, params: Dict) -> Tuple[int, Any]:
+        delay = self._delay()
+        if delay:
+            await asyncio.sleep(delay)
+        return self.respond(params)
+
+    def respond(self, params: Dict) -> Tuple[int, Any]:
+        """Status and JSON body for one search request."""
+        query = params.get('q', '')
+        count = int(params.get('count', 10))
+        self.calls.append({'q': query, 'count': count})
+
+        if self._rate_limited():
+            self.stats['rate_limited'] += 1
+            return 429, {'type': 'ErrorResponse', 'error': {'code': 'RATE_LIMITED'}}
+
+        status = self._fail_next.popleft() if self._fail_next else None
+        if status is None and self.error_rate and self._rng.random() < self.error_rate:
+            status = 500
+        if status is not None:
+            self.stats['errors'] += 1
+            return status, {'type': 'ErrorResponse', 'error': {'code': 'INJECTED', 'status': status}}
+
+        self.stats['served'] += 1
+        results = self.corpus.get(query) or self._synthetic(query, count)
+        return 200, {'type': 'search', 'query': {'original': query}, 'web': {'results': results[:count]}}
+
+    def _synthetic(self, query: str, count: int) -> List[Dict]:
+        # Seeded by the query so the same search always returns the same corpus
+        rng = random.Random(zlib.crc32(query.encode()) ^ self._seed)
+        terms = query.replace('"', '').split()[:4]
+        slug = '-'.join(terms).lower() or 'search'
+        return [{
+            'title': f"{rng.choice(SIGNALS)}: {' '.join(terms)} ({i + 1})",
+            'url': f'https://fake.brave.test/{slug}/{i + 1}',
+            'description': f"Coverage of {' '.join(terms)} and the corporate surveillance risk it poses.",
+            'age': rng.choice(AGES),
+            'page_age': '',
+            'type': 'search_result'
+        } for i in range(count)]
+
+    def _delay(self) -> float:
+        if isinstance(self.latency, tuple):
+            return self._rng.uniform(*self.latency)
+        return self.latency
+
+    def _rate_limited(self) -> bool:
+        if not self.rate_limit_per_minute:
+            return False
+        now = self.clock()
+        while self._window and now - self._window[0] >= 60:
+            self._window.popleft()
+        if len(self._window) >= self.rate_limit_per_minute:
+            return True
+        self._window.append(now)
+        return False
+
+class FakeBraveServer:
+    """Serves a FakeBraveProvider over local HTTP.
+
+    Use as an async context manager; ``url`` is suitable for
+    ``BraveClient(base_url=...)`` or the ``BRAVE_API_URL`` variable.
+    """
+
+    def __init__(self, provider: Optional[FakeBraveProvider] = None,
+                 host: str = '127.0.0.1', port: int = 0):
+        self.provider = provider or FakeBraveProvider()
+        self.host = host
+        self.port = port
+        self.url: Optional[str] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_get(SEARCH_PATH, self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        port = self._runner.addresses[0][1]
+        self.url = f'http://{self.host}:{port}{SEARCH_PATH}'
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> 'FakeBraveServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        status, body = await self.provider(dict(request.query))
+        headers = {'Retry-After': '60'} if status == 429 else None
+        return web.json_response(body, status=status, headers=headers)
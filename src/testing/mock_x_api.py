@@ -16,12 +16,13 @@ class MockXAPI:
         if not os.path.exists(self.test_data_dir):
             os.makedirs(self.test_data_dir)
     
-    def create_post(self, text: str) -> Dict:
+    def create_post(self, text: str, reply_to: Optional[str] = None) -> Dict:
         """Simulate creating a post"""
         post_id = f"post_{len(self.posts) + 1}"
         post = {
             "id": post_id,
             "text": text,
+            "reply_to": reply_to,
             "created_at": datetime.now(timezone.utc).isoformat(),
         }
         self.posts.append(post)
@@ -50,13 +51,21 @@ class MockXAPI:
         }
         self.mentions.append(mention)
     
-    def create_thread(self, posts: List[str]) -> List[Dict]:
+    async def create_thread(self, posts: List[str], thread_id: Optional[str] = None) -> Dict:
         """Simulate creating a thread"""
-        responses = []
+        tweet_ids = []
         for post in posts:
             response = self.create_post(post)
-            responses.append(response)
-        return responses
+            tweet_ids.append(response["data"]["id"])
+        return {
+            "thread_id": thread_id or f"thread_{len(self.posts)}",
+            "status": "complete",
+            "tweet_ids": tweet_ids,
+            "next_index": len(posts),
+            "total": len(posts),
+            "last_error": None,
+            "posted": len(posts)
+        }
     
     def get_posts(self) -> List[Dict]:
         """Get all posts for analysis"""
@@ -0,0 +1,100 @@
+import time
+import random
+import pytest
+from src.analysis import keyword_matcher
+from src.analysis.keyword_matcher import KeywordMatcher
+from src.intelligence.brave_intelligence import RELEVANCE_MATCHER
+from src.analysis.narrative_detector import NarrativeDetector
+from src.intelligence.info_gatherer import InformationGatherer
+
+def test_single_pass_reports_overlapping_hits():
+    matcher = KeywordMatcher({'a': ['he', 'she', 'hers'], 'b': ['urgent', 'urgent alert']},
+                             weights={'a': 0.1, 'b': 0.5})
+    hits = matcher.find_all('Ushers URGENT alert')
+
+    assert [(h.keyword, h.start) for h in hits] == [
+        ('she', 1), ('he', 2), ('hers', 2), ('urgent', 7), ('urgent alert', 7)
+    ]
+    assert matcher.categories('ushers') == {'a'}
+    assert matcher.category_score('ushers urgent') == pytest.approx(0.6)
+    assert matcher.keyword_score('ushers') == pytest.approx(0.3)
+
+def test_whole_words_rejects_partial_matches():
+    matcher = KeywordMatcher({'risk': ['risk']}, whole_words=True)
+    assert not matcher.contains_any('asterisk')
+    assert matcher.contains_any('a systemic risk.')
+
+def test_matches_naive_substring_scan():
+    rng = random.Random(7)
+    words = ['privacy', 'defi', 'control', 'web3', 'governance', 'corporate', 'the', 'a']
+    keywords = {'x': ['privacy', 'control', 'corp'], 'y': ['defi governance', 'web', 'e']}
+    matcher = KeywordMatcher(keywords)
+
+    for _ in range(200):
+        text = ' '.join(rng.choice(words) for _ in range(8))
+        expected = [(c, k) for c, ks in keywords.items() for k in ks if k in text]
+        assert [(h.category, h.keyword) for h in matcher.match(text)] == expected
+
+def test_scorers_use_compiled_matchers():
+    gatherer = InformationGatherer()
+    result = {"title": "Open source privacy tech fights surveillance and regulation"}
+    assert gatherer._identify_patterns(result) == [
+        "manipulation:regulation", "manipulation:surveillance",
+        "resistance:privacy tech", "resistance:open source"
+    ]
+    assert gatherer._calculate_relevance(result) == pytest.approx(0.8)
+
+    detector = NarrativeDetector()
+    assert detector._matches_narrative("You have nothing to hide, it's for PUBLIC SAFETY") == {"privacy_danger"}
+
+@pytest.mark.parametrize('limit', [0, 128])
+def test_presence_paths_agree_with_spans(monkeypatch, limit):
+    # limit=0 forces the regex scan that large matchers use for presence checks
+    monkeypatch.setattr(keyword_matcher, 'IN_SCAN_LIMIT', limit)
+    matcher = KeywordMatcher({'a': ['he', 'she', 'hers', 'web'], 'b': ['urgent alert', 'alert']},
+                             weights={'a': 0.1, 'b': 0.5})
+    matcher.add('risk', 'c', 1.0, whole_word=True)
+    rng = random.Random(11)
+    words = ['ushers', 'urgent', 'alert', 'risky', 'risk', 'web3', 'the', 'asterisk']
+
+    for _ in range(200):
+        text = ' '.join(rng.choice(words) for _ in range(6))
+        hits = matcher.match(text)
+        assert matcher.categories(text) == {hit.category for hit in hits}
+        assert matcher.keyword_score(text) == pytest.approx(sum(hit.weight for hit in hits))
+
+def test_relevance_scoring_keeps_up_with_substring_scans():
+    indicators = {
+        "high": ["privacy", "surveillance", "control", "regulation",
+                 "corporate", "monopoly", "resistance", "freedom"],
+        "medium": ["blockchain", "cryptocurrency", "defi", "web3", "decentralized", "governance"],
+        "low": ["technology", "digital", "future", "development"]
+    }
+    weights = {"high": 0.3, "medium": 0.2, "low": 0.1}
+
+    def baseline(content):
+        content = content.lower()
+        return sum(weights[level] for level, words in indicators.items() for word in words if word in content)
+
+    texts = [
+        "City council debates new privacy rules for street cameras as residents voice "
+        "concerns about how footage is stored and who can access it " * 2,
+        "Corporate surveillance expands as regulators weigh rules for decentralized finance, "
+        "blockchain governance, digital rights and the future of technology development " * 2,
+        "A quiet afternoon at the park with ducks, bread crumbs and a light breeze over the pond " * 3
+    ]
+    for text in texts:
+        assert RELEVANCE_MATCHER.keyword_score(text) == pytest.approx(baseline(text))
+
+    def best_of(score):
+        runs = []
+        for _ in range(5):
+            started = time.perf_counter()
+            for _ in range(500):
+                for text in texts:
+                    score(text)
+            runs.append(time.perf_counter() - started)
+        return min(runs)
+
+    # Generous bound for noisy machines; the Aho-Corasick walk was ~17x slower
+    assert best_of(RELEVANCE_MATCHER.keyword_score) < 2.5 * best_of(baseline)
@@ -0,0 +1,45 @@
+import pytest
+from src.analysis.narrative_detector import NarrativeDetector, PropagandaTechnique
+from src.analysis.keyword_matcher import KeywordMatcher
+
+@pytest.fixture
+def detector():
+    return NarrativeDetector()
+
+@pytest.mark.asyncio
+async def test_techniques_are_detected(detector):
+    result = await detector.analyze_narrative(
+        "Experts say DeFi risks are a threat: it's either compliance or ruin."
+    )
+    assert result["techniques"] == [
+        PropagandaTechnique.EMOTIONAL_MANIPULATION,
+        PropagandaTechnique.FALSE_DICHOTOMY,
+        PropagandaTechnique.APPEAL_TO_AUTHORITY
+    ]
+    assert [p["narrative"] for p in result["patterns"]] == ["crypto_fear"]
+
+@pytest.mark.asyncio
+async def test_technique_cues_only_match_whole_words(detector):
+    result = await detector.analyze_narrative("Fearless builders ship software")
+    assert result["techniques"] == []
+
+@pytest.mark.asyncio
+async def test_batch_matches_single_item_analysis(detector):
+    contents = [
+        "Regulatory clarity will bring institutional adoption",
+        "Nothing to hide? Studies show surveillance prevents crime",
+        "gm frens",
+        ""
+    ]
+    batch = await detector.analyze_batch(contents)
+
+    assert len(batch) == len(contents)
+    for content, result in zip(contents, batch):
+        assert result == await detector.analyze_narrative(content)
+    assert batch[1]["triggers"] == ["nothing to hide", "studies show"]
+    assert batch[2]["patterns"] == []
+
+def test_batch_spans_are_relative_to_each_text():
+    matcher = KeywordMatcher({"k": ["risk"]})
+    hits = matcher.find_all_batch(["no match", "a risk", "risk"])
+    assert [[(h.start, h.end) for h in item] for item in hits] == [[], [(2, 6)], [(0, 4)]]
@@ -0,0 +1,56 @@
+import zlib
+import pytest
+from src.analysis.narrative_detector import NarrativeDetector
+
+class BagOfWordsEmbedder:
+    """Deterministic stand-in: hashed bag of words, so shared vocabulary means similarity."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def get_embeddings(self, texts):
+        self.calls.append(list(texts))
+        vectors = []
+        for text in texts:
+            vector = [0.0] * 64
+            for word in text.lower().replace(",", " ").split():
+                vector[zlib.crc32(word.strip(".?!").encode()) % 64] += 1.0
+            vectors.append(vector)
+        return vectors
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / 'centroids.npz')
+
+@pytest.mark.asyncio
+async def test_paraphrases_match_semantically(cache_path):
+    detector = NarrativeDetector(semantic=True, embedder=BagOfWordsEmbedder(),
+                                 semantic_threshold=0.35, centroid_cache=cache_path)
+    result = await detector.analyze_narrative("Every bitcoin user is a criminal, crypto is danger itself")
+
+    pattern = result["patterns"][0]
+    assert pattern["narrative"] == "crypto_fear"
+    assert pattern["match"] == "semantic"
+    assert pattern["similarity"] >= 0.35
+
+@pytest.mark.asyncio
+async def test_keyword_hits_skip_embedding(cache_path):
+    embedder = BagOfWordsEmbedder()
+    detector = NarrativeDetector(semantic=True, embedder=embedder, centroid_cache=cache_path)
+    results = await detector.analyze_batch(["You have nothing to hide", "gm frens"])
+
+    assert results[0]["patterns"][0]["match"] == "keyword"
+    # One call builds the centroids, one classifies the single keyword miss
+    assert embedder.calls[-1] == ["gm frens"]
+
+@pytest.mark.asyncio
+async def test_centroids_are_cached_on_disk(cache_path):
+    first = NarrativeDetector(semantic=True, embedder=BagOfWordsEmbedder(), centroid_cache=cache_path)
+    await first.analyze_narrative("gm")
+
+    embedder = BagOfWordsEmbedder()
+    second = NarrativeDetector(semantic=True, embedder=embedder, centroid_cache=cache_path)
+    await second.analyze_narrative("gm")
+
+    assert embedder.calls == [["gm"]]
+    assert second.centroids.names == list(second.known_narratives)
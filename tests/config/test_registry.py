@@ -0,0 +1,106 @@
+import os
+import json
+import shutil
+import pytest
+from src.config.registry import ConfigRegistry, DEFAULT_DATA_DIR, RegistryValidationError
+from src.intelligence.info_gatherer import InformationGatherer
+from src.intelligence.brave_searcher import BraveSearcher
+from src.analysis.narrative_detector import NarrativeDetector
+
+@pytest.fixture
+def data_dir(tmp_path):
+    path = tmp_path / 'data'
+    shutil.copytree(DEFAULT_DATA_DIR, path)
+    return path
+
+def edit(data_dir, section, change):
+    path = data_dir / f'{section}.json'
+    document = json.loads(path.read_text())
+    change(document)
+    path.write_text(json.dumps(document))
+    # Make sure the mtime moves even on coarse-grained filesystems
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+def test_reload_applies_changed_files(data_dir):
+    registry = ConfigRegistry(str(data_dir))
+    version = registry.version
+    assert not registry.reload()
+
+    edit(data_dir, 'topics', lambda d: d['data'].append('mesh networks'))
+
+    assert registry.reload()
+    assert registry.version != version
+    assert 'mesh networks' in registry.get('topics')
+
+def test_invalid_edit_keeps_previous_snapshot(data_dir):
+    registry = ConfigRegistry(str(data_dir))
+    version = registry.version
+
+    edit(data_dir, 'search_categories', lambda d: d['data']['crypto'].update(relevance_threshold=3))
+
+    assert not registry.reload()
+    assert registry.version == version
+    assert registry.get('search_categories')['crypto']['relevance_threshold'] == 0.7
+
+def test_unknown_narrative_type_or_bad_document_is_rejected(data_dir):
+    registry = ConfigRegistry(str(data_dir))
+    version = registry.version
+
+    # Every section must accept the update or none does
+    edit(data_dir, 'narratives', lambda d: d['data']['known_narratives']['crypto_fear'].update(type='vibes'))
+    assert not registry.reload()
+    assert registry.version == version
+
+    edit(data_dir, 'narratives', lambda d: d['data']['known_narratives']['crypto_fear'].update(type='fear_mongering'))
+    (data_dir / 'topics.json').write_text(json.dumps(['not', 'an', 'object']))
+    assert not registry.reload()
+    assert registry.version == version
+
+def test_invalid_initial_load_raises(data_dir):
+    (data_dir / 'topics.json').unlink()
+    with pytest.raises(RegistryValidationError):
+        ConfigRegistry(str(data_dir))
+
+def test_subscribers_rebuild_on_reload(data_dir):
+    registry = ConfigRegistry(str(data_dir))
+    gatherer = InformationGatherer(registry=registry)
+    searcher = BraveSearcher(db_path=':memory:', registry=registry)
+    searcher.next_search_at['privacy rights'] = 99.0
+
+    edit(data_dir, 'discovery_patterns', lambda d: d['data'].update(resistance=['mesh networks']))
+    edit(data_dir, 'topics', lambda d: d.update(data=['privacy rights', 'mesh networks']))
+    registry.reload()
+
+    assert gatherer.registry_version == registry.version
+    assert gatherer._identify_patterns({'title': 'mesh networks beat surveillance'}) == [
+        'manipulation:surveillance', 'resistance:mesh networks'
+    ]
+    assert searcher.topics == ['privacy rights', 'mesh networks']
+    assert searcher.next_search_at == {'privacy rights': 99.0, 'mesh networks': 0.0}
+
+@pytest.mark.asyncio
+async def test_narrative_reload_rebuilds_index(data_dir):
+    registry = ConfigRegistry(str(data_dir))
+    detector = NarrativeDetector(registry=registry)
+
+    def add_narrative(document):
+        document['data']['known_narratives']['cbdc_safety'] = {
+            'type': 'consensus_manufacturing',
+            'triggers': ['programmable money'],
+            'description': 'Central bank money sold as the safe digital option',
+            'corporate_benefit': 'Spending controls',
+            'future_impact': 'The Allowance Era'
+        }
+    edit(data_dir, 'narratives', add_narrative)
+    await registry.reload_async()
+
+    result = await detector.analyze_narrative('Programmable money keeps you safe')
+    assert [p['narrative'] for p in result['patterns']] == ['cbdc_safety']
+
+    # An unknown narrative type is rejected by the registry, so the detector keeps its index
+    edit(data_dir, 'narratives', lambda d: d['data']['known_narratives']['cbdc_safety'].update(type='vibes'))
+    assert not await registry.reload_async()
+
+    assert 'cbdc_safety' in detector.known_narratives
+    assert detector.registry_version == registry.version
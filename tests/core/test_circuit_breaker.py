@@ -0,0 +1,81 @@
+import pytest
+from src.core.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitState
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker('x_api', failure_threshold=0.5, min_calls=4, window=60,
+                          base_probe_interval=5, max_probe_interval=40, clock=clock)
+
+def test_opens_on_failure_rate(breaker):
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow_request()
+
+def test_old_outcomes_leave_the_window(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now = 120
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+
+def test_half_open_probe_closes_on_success(breaker, clock):
+    breaker.trip()
+    clock.now = 5
+    assert breaker.allow_request()
+    assert breaker.state == CircuitState.HALF_OPEN
+    # Only a single probe at a time
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow_request()
+
+def test_failed_probes_back_off_exponentially(breaker, clock):
+    breaker.trip()
+    intervals = []
+    for _ in range(4):
+        clock.now += breaker.seconds_until_probe()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        intervals.append(breaker.probe_interval)
+
+    assert intervals == [10, 20, 40, 40]
+    assert breaker.metrics()['opens'] == 5
+
+def test_registry_reports_every_dependency():
+    registry = CircuitBreakerRegistry()
+    registry.get('brave').trip()
+
+    metrics = registry.metrics()
+    assert set(metrics) == {'x_api', 'brave', 'llm', 'embeddings'}
+    assert metrics['brave']['state'] == 'open'
+    assert registry.seconds_until_probe() > 0
+
+def test_availability_check_does_not_claim_the_probe(breaker, clock):
+    breaker.trip()
+    assert not breaker.is_available()
+
+    clock.now = 5
+    for _ in range(3):
+        assert breaker.is_available()
+    assert breaker.metrics_counters['probes'] == 0
+
+    # The real call still gets the probe, and status checks then report it taken
+    assert breaker.allow_request()
+    assert not breaker.is_available()
@@ -0,0 +1,101 @@
+import asyncio
+import pytest
+from src.core.lifecycle import LifecycleManager
+
+@pytest.mark.asyncio
+async def test_drains_then_stops_in_reverse_order():
+    calls = []
+    manager = LifecycleManager()
+    for name in ('store', 'queue', 'producer'):
+        manager.register(
+            name,
+            start=lambda n=name: calls.append(('start', n)),
+            drain=lambda n=name: calls.append(('drain', n)),
+            stop=lambda n=name: calls.append(('stop', n))
+        )
+
+    await manager.start()
+    report = await manager.shutdown()
+
+    assert calls == [
+        ('start', 'store'), ('start', 'queue'), ('start', 'producer'),
+        ('drain', 'producer'), ('drain', 'queue'), ('drain', 'store'),
+        ('stop', 'producer'), ('stop', 'queue'), ('stop', 'store')
+    ]
+    assert report['queue'] == {'drain': 'ok', 'stop': 'ok'}
+    assert manager.shutdown_requested.is_set()
+
+@pytest.mark.asyncio
+async def test_stuck_drain_hits_deadline_but_stop_still_runs():
+    stopped = []
+
+    async def stuck():
+        await asyncio.sleep(10)
+
+    async def stop():
+        stopped.append(True)
+
+    manager = LifecycleManager(deadline=0.05)
+    manager.register('queue', drain=stuck, stop=stop)
+    manager.register('failing', drain=lambda: 1 / 0)
+    await manager.start()
+    report = await manager.shutdown()
+
+    assert report['queue'] == {'drain': 'timeout', 'stop': 'ok'}
+    assert report['failing'] == {'drain': 'error'}
+    assert stopped == [True]
+    assert report['duration'] < 1
+
+@pytest.mark.asyncio
+async def test_leftover_tasks_are_cancelled():
+    cancelled = asyncio.Event()
+
+    async def forgotten():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    manager = LifecycleManager()
+    asyncio.create_task(forgotten())
+    await asyncio.sleep(0)
+    report = await manager.shutdown()
+
+    assert report['cancelled'] == 1
+    assert cancelled.is_set()
+
+@pytest.mark.asyncio
+async def test_start_failure_stops_what_already_started():
+    calls = []
+
+    def broken():
+        raise RuntimeError('no credentials')
+
+    manager = LifecycleManager()
+    manager.register('store', start=lambda: calls.append('start store'), stop=lambda: calls.append('stop store'))
+    manager.register('client', start=broken, stop=lambda: calls.append('stop client'))
+
+    with pytest.raises(RuntimeError):
+        await manager.start()
+    # The component that failed to start is not stopped
+    assert calls == ['start store', 'stop store']
+
+@pytest.mark.asyncio
+async def test_concurrent_shutdowns_share_one_run():
+    drains = []
+
+    async def drain():
+        drains.append(True)
+        await asyncio.sleep(0.01)
+
+    manager = LifecycleManager()
+    manager.register('queue', drain=drain)
+    await manager.start()
+    second = asyncio.create_task(manager.shutdown())
+    await asyncio.sleep(0)
+    first = await manager.shutdown()
+
+    assert drains == [True]
+    # Neither caller was cancelled as a leftover task
+    assert await second is first
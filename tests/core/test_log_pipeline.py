@@ -0,0 +1,56 @@
+import json
+import logging
+import pytest
+from src.core.log_pipeline import (
+    configure_logging, shutdown_logging, get_logger, set_component_level, parse_component_levels
+)
+
+@pytest.fixture
+def log_path(tmp_path):
+    path = tmp_path / 'gonzo.log'
+    configure_logging(str(path), console_level=logging.CRITICAL)
+    yield path
+    shutdown_logging()
+
+def read_entries(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+def test_records_are_structured_json(log_path):
+    logger = get_logger('x_api')
+    logger.warning('Post failed', extra={'tweet_id': '123', 'latency_ms': 41.5,
+                                         'error_type': 'HTTPError'})
+    shutdown_logging()
+
+    entry = read_entries(log_path)[-1]
+    assert entry['component'] == 'x_api'
+    assert entry['level'] == 'WARNING'
+    assert entry['message'] == 'Post failed'
+    assert entry['tweet_id'] == '123'
+    assert entry['latency_ms'] == 41.5
+    assert entry['error_type'] == 'HTTPError'
+
+def test_exceptions_are_captured(log_path):
+    try:
+        raise ValueError('timeline collapse')
+    except ValueError:
+        get_logger('orchestrator').exception('Processing failed')
+    shutdown_logging()
+
+    entry = read_entries(log_path)[-1]
+    assert 'ValueError: timeline collapse' in entry['exception']
+
+def test_component_levels(log_path):
+    set_component_level('brave', 'ERROR')
+    get_logger('brave').warning('suppressed')
+    get_logger('safety').warning('kept')
+    shutdown_logging()
+    set_component_level('brave', logging.NOTSET)
+
+    messages = [e['message'] for e in read_entries(log_path)]
+    assert 'kept' in messages
+    assert 'suppressed' not in messages
+
+def test_parse_component_levels():
+    assert parse_component_levels('x_api=debug, brave=WARNING,') == {
+        'x_api': 'DEBUG', 'brave': 'WARNING'
+    }
@@ -0,0 +1,118 @@
+import asyncio
+import pytest
+from src.core.scheduler import Job, JobScheduler, MissedRunPolicy
+
+@pytest.mark.asyncio
+async def test_jobs_run_on_independent_cadences():
+    runs = {'fast': 0, 'slow': 0}
+
+    async def fast():
+        runs['fast'] += 1
+
+    async def slow():
+        runs['slow'] += 1
+        await asyncio.sleep(0.2)
+
+    scheduler = JobScheduler()
+    scheduler.add_job('fast', fast, interval=0.02)
+    scheduler.add_job('slow', slow, interval=10)
+    scheduler.start()
+    await asyncio.sleep(0.15)
+    await scheduler.stop()
+
+    # The slow job's long run never held the fast one back
+    assert runs['slow'] == 1
+    assert runs['fast'] >= 5
+    assert scheduler.stats()['fast']['runs'] == runs['fast']
+
+def test_missed_run_policies():
+    scheduler = JobScheduler(clock=lambda: 0.0)
+
+    def job(policy):
+        return Job('j', None, interval=10, missed=policy)
+
+    # A run that started at slot 0 and ended at 35 overran slots 10, 20 and 30
+    skip = job(MissedRunPolicy.SKIP)
+    assert scheduler._next_slot(skip, 0, 35) == 40
+    assert skip.stats.missed == 3
+
+    coalesce = job(MissedRunPolicy.COALESCE)
+    assert scheduler._next_slot(coalesce, 0, 35) == 35
+    assert coalesce.stats.missed == 2
+
+    catch_up = job(MissedRunPolicy.CATCH_UP)
+    assert scheduler._next_slot(catch_up, 0, 35) == 10
+    assert catch_up.stats.missed == 0
+
+    assert scheduler._next_slot(skip, 0, 5) == 10
+
+@pytest.mark.asyncio
+async def test_returned_delay_and_failures():
+    calls = []
+
+    async def flaky():
+        calls.append(len(calls))
+        if len(calls) == 1:
+            raise RuntimeError('boom')
+        return 60  # Come back in a minute, not on the 0.01s interval
+
+    scheduler = JobScheduler()
+    scheduler.add_job('flaky', flaky, interval=0.01)
+    scheduler.start()
+    await asyncio.sleep(0.1)
+
+    stats = scheduler.stats()['flaky']
+    assert len(calls) == 2
+    assert stats['failures'] == 1
+    assert stats['last_error'] == 'boom'
+    assert stats['next_run_in'] > 50
+
+    # A trigger runs it now without waiting out the returned delay
+    scheduler.trigger('flaky')
+    await asyncio.sleep(0.02)
+    await scheduler.stop()
+    assert len(calls) == 3
+
+@pytest.mark.asyncio
+async def test_stop_cancels_running_jobs_and_timeouts_are_counted():
+    cancelled = asyncio.Event()
+
+    async def hang():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def slow():
+        await asyncio.sleep(10)
+
+    scheduler = JobScheduler()
+    scheduler.add_job('hang', hang, interval=60)
+    scheduler.add_job('slow', slow, interval=60, timeout=0.02)
+    scheduler.start()
+    await asyncio.sleep(0.05)
+    await scheduler.stop()
+
+    assert cancelled.is_set()
+    assert scheduler.stats()['slow']['timeouts'] == 1
+
+def test_restored_last_run_brings_long_intervals_forward():
+    wall = [100000.0]
+    scheduler = JobScheduler(clock=lambda: 0.0, wall_clock=lambda: wall[0])
+    daily = scheduler.add_job('daily', None, interval=86400, run_immediately=False)
+    frequent = scheduler.add_job('frequent', None, interval=60)
+
+    # Compaction last ran 23 hours before the restart, so it is due in an hour
+    scheduler.restore_state({'last_run_at': {'daily': wall[0] - 82800, 'frequent': wall[0] - 30, 'gone': 0.0}})
+    assert daily.next_run == 3600
+    assert frequent.next_run == 0.0
+
+    daily.last_run_at = wall[0]
+    assert scheduler.snapshot_state() == {'last_run_at': {'daily': wall[0], 'frequent': wall[0] - 30}}
+
+    # Long overdue runs straight away
+    fresh = JobScheduler(clock=lambda: 0.0, wall_clock=lambda: wall[0])
+    job = fresh.add_job('daily', None, interval=86400, run_immediately=False)
+    fresh.restore_state({'last_run_at': {'daily': wall[0] - 200000}})
+    assert job.next_run == 0.0
@@ -0,0 +1,84 @@
+import struct
+from datetime import datetime
+from decimal import Decimal
+import pytest
+from src.core.snapshot import (
+    SNAPSHOT_MAGIC, SnapshotError, SnapshotManager, decode_snapshot, encode_snapshot
+)
+
+class Counter:
+    def __init__(self):
+        self.state = {'count': 0, 'seen': set()}
+
+    def snapshot_state(self):
+        return self.state
+
+    def restore_state(self, state):
+        self.state = state
+
+class Broken(Counter):
+    def restore_state(self, state):
+        raise KeyError('schema changed')
+
+def test_round_trip_keeps_sets_and_datetimes():
+    state = {'seen': {'b', 'a'}, 'at': datetime(2030, 1, 1, 12), 'nested': {'n': [1, 2.5, None]}}
+    data = encode_snapshot(state)
+
+    assert data.startswith(SNAPSHOT_MAGIC)
+    assert decode_snapshot(data) == state
+
+def test_unreadable_snapshots_are_rejected():
+    data = encode_snapshot({'a': 1})
+
+    with pytest.raises(SnapshotError, match='version'):
+        decode_snapshot(SNAPSHOT_MAGIC + struct.pack('>H', 99) + data[6:])
+    with pytest.raises(SnapshotError, match='checksum'):
+        decode_snapshot(data[:-1] + bytes([data[-1] ^ 1]))
+    with pytest.raises(SnapshotError):
+        decode_snapshot(b'{"a": 1}')
+
+def test_manager_restores_components_independently(tmp_path):
+    path = str(tmp_path / 'state.snapshot')
+    before = SnapshotManager(path)
+    counter, broken = Counter(), Broken()
+    counter.state = {'count': 7, 'seen': {'x'}}
+    before.register('counter', counter)
+    before.register('broken', broken)
+    assert before.save() > 0
+
+    after = SnapshotManager(path)
+    restored, other = Counter(), Broken()
+    after.register('counter', restored)
+    after.register('broken', other)
+    after.register('new', Counter())
+
+    # A failing component keeps its fresh state; one not in the file is skipped
+    assert after.restore() == {'counter': True, 'broken': False}
+    assert restored.state == {'count': 7, 'seen': {'x'}}
+    assert other.state == {'count': 0, 'seen': set()}
+
+def test_missing_or_corrupt_file_is_a_cold_start(tmp_path):
+    path = tmp_path / 'state.snapshot'
+    manager = SnapshotManager(str(path))
+    manager.register('counter', Counter())
+    assert manager.restore() == {}
+
+    path.write_bytes(b'garbage')
+    assert manager.restore() == {}
+
+def test_unsupported_values_fail_the_save(tmp_path):
+    with pytest.raises(TypeError, match='Decimal'):
+        encode_snapshot({'amount': Decimal('1.5')})
+
+    path = tmp_path / 'state.snapshot'
+    manager = SnapshotManager(str(path))
+    counter = Counter()
+    manager.register('counter', counter)
+    assert manager.save() > 0
+    previous = path.read_bytes()
+
+    # The previous snapshot is kept rather than replaced with stringified state
+    counter.state = {'amount': Decimal('1.5')}
+    assert manager.save() is None
+    assert manager.metrics['failures'] == 1
+    assert path.read_bytes() == previous
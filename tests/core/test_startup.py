@@ -0,0 +1,67 @@
+from src.core.startup import LazySubsystem, StartupProfiler, get_profiler, is_loaded
+from src.core.orchestrator import GonzoOrchestrator
+
+class Owner:
+    counter = LazySubsystem('collections', 'Counter')
+    relative = LazySubsystem('.log_pipeline', 'JsonFormatter', 'src.core')
+
+    def __init__(self):
+        self.loaded = []
+
+    def _on_subsystem_loaded(self, name, subsystem):
+        self.loaded.append(name)
+
+def test_profiler_records_phases_and_readiness():
+    now = [0.0]
+    profiler = StartupProfiler(clock=lambda: now[0])
+
+    with profiler.measure('store', 'import'):
+        now[0] += 0.25
+    with profiler.measure('store', 'init'):
+        now[0] += 0.5
+    assert profiler.mark_ready() == 0.75
+
+    with profiler.measure('llm', 'init'):
+        now[0] += 2.0
+    report = profiler.report()
+    assert report['time_to_ready_ms'] == 750.0
+    assert report['components']['store'] == {'deferred': False, 'import_ms': 250.0, 'init_ms': 500.0}
+    # Built after readiness, so it did not count against startup
+    assert report['components']['llm']['deferred'] is True
+
+def test_lazy_subsystem_builds_once_on_first_access():
+    owner = Owner()
+    assert not is_loaded(owner, 'counter')
+    assert owner.loaded == []
+
+    counter = owner.counter
+    counter['x'] += 1
+    assert owner.counter is counter
+    assert is_loaded(owner, 'counter')
+    assert owner.loaded == ['counter']
+    assert 'Counter' in get_profiler().components
+
+    assert type(owner.relative).__name__ == 'JsonFormatter'
+    assert owner.loaded == ['counter', 'relative']
+
+def test_orchestrator_defers_restored_state_until_subsystem_is_built():
+    class Learning:
+        def __init__(self):
+            self.state = None
+
+        def restore_state(self, state):
+            self.state = state
+
+    orchestrator = GonzoOrchestrator()
+    saved = {'system_metrics': {'learning_events': 3}, 'learning': {'current_evolution_stage': 2}}
+    orchestrator.restore_state(saved)
+
+    # Nothing was built to restore or to save
+    assert not any(is_loaded(orchestrator, name) for name in ('knowledge', 'pattern_recognition', 'learning'))
+    state = orchestrator.snapshot_state()
+    assert state['learning'] == {'current_evolution_stage': 2}
+    assert state['system_metrics']['learning_events'] == 3
+
+    learning = Learning()
+    orchestrator._on_subsystem_loaded('learning', learning)
+    assert learning.state == {'current_evolution_stage': 2}
@@ -0,0 +1,133 @@
+import asyncio
+import pytest
+from src.core.work_queue import WorkQueue
+
+class Recorder:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.order = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, payload):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.order.append(payload)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+
+@pytest.mark.asyncio
+async def test_highest_priority_runs_first():
+    handler = Recorder()
+    queue = WorkQueue(max_workers=1)
+    queue.register('mention', handler)
+    queue.register('finding', handler)
+
+    queue.put('mention', 'standard mention', 45)
+    queue.put('finding', 'minor finding', 50)
+    queue.put('finding', 'critical finding', 80)
+    queue.put('mention', 'owner mention', 100)
+
+    queue.start()
+    await queue.join()
+    await queue.stop()
+
+    assert handler.order == ['owner mention', 'critical finding', 'minor finding', 'standard mention']
+    assert queue.metrics()['completed'] == 4
+
+@pytest.mark.asyncio
+async def test_aging_lets_old_low_priority_work_through():
+    now = [0.0]
+    handler = Recorder()
+    queue = WorkQueue(max_workers=1, aging_rate=1.0, clock=lambda: now[0])
+    queue.register('mention', handler)
+
+    queue.put('mention', 'old', 10)
+    now[0] = 60
+    queue.put('mention', 'new', 50)
+
+    queue.start()
+    await queue.join()
+    await queue.stop()
+
+    # 10 + 60s of aging outranks a fresh 50
+    assert handler.order == ['old', 'new']
+
+@pytest.mark.asyncio
+async def test_per_kind_caps_bound_concurrency():
+    mentions, findings = Recorder(delay=0.02), Recorder(delay=0.02)
+    queue = WorkQueue(max_workers=4)
+    queue.register('mention', mentions, max_concurrent=3)
+    queue.register('finding', findings, max_concurrent=1)
+
+    for i in range(6):
+        queue.put('mention', i, 50)
+        queue.put('finding', i, 90)
+
+    queue.start()
+    await queue.join()
+    await queue.stop()
+
+    assert findings.peak == 1
+    assert mentions.peak == 3
+    assert len(findings.order) == len(mentions.order) == 6
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_least_urgent():
+    queue = WorkQueue(max_size=2)
+    queue.register('finding', Recorder())
+
+    assert queue.put('finding', 'a', 10)
+    assert queue.put('finding', 'b', 20)
+    assert not queue.put('finding', 'c', 5)
+    assert queue.put('finding', 'd', 30)
+
+    assert sorted(entry.item.payload for entry in queue._heaps['finding']) == ['b', 'd']
+    assert queue.stats['dropped'] == 2
+
+@pytest.mark.asyncio
+async def test_failing_handler_does_not_stop_workers():
+    async def explode(payload):
+        raise RuntimeError(payload)
+
+    handler = Recorder()
+    queue = WorkQueue(max_workers=1)
+    queue.register('bad', explode)
+    queue.register('good', handler)
+    queue.put('bad', 'x', 90)
+    queue.put('good', 'y', 10)
+
+    queue.start()
+    await queue.join()
+    await queue.stop()
+
+    assert handler.order == ['y']
+    assert queue.stats['failed'] == 1
+
+@pytest.mark.asyncio
+async def test_dump_and_load_keep_unhandled_work():
+    now = [0.0]
+    blocker = asyncio.Event()
+
+    async def slow(payload):
+        await blocker.wait()
+
+    queue = WorkQueue(max_workers=1, clock=lambda: now[0])
+    queue.register('mention', slow)
+    queue.put('mention', 'running', 50)
+    queue.start()
+    await asyncio.sleep(0.01)
+    queue.put('mention', 'low', 10)
+    queue.put('mention', 'high', 40)
+    now[0] = 60.0
+
+    pending = queue.dump()
+    await queue.stop()
+    # In-flight work is kept too, and aging earned so far carries over
+    assert [item['payload'] for item in pending] == ['running', 'high', 'low']
+    assert pending[1]['priority'] == pytest.approx(41)
+
+    restored = WorkQueue()
+    restored.register('mention', slow)
+    assert restored.load(pending + [{'kind': 'unknown', 'payload': None, 'priority': 1}]) == 3
+    assert len(restored) == 3
@@ -0,0 +1,105 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from src.core.circuit_breaker import CircuitOpenError, get_breaker
+from src.intelligence.brave_client import BraveClient, TTLCache
+from src.intelligence.brave_quota import QuotaManager
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest_asyncio.fixture
+async def brave_server():
+    calls = []
+
+    async def handle(request):
+        calls.append(request.query['q'])
+        assert request.headers['X-Subscription-Token'] == 'test-key'
+        await asyncio.sleep(0.02)
+        return web.json_response({'web': {'results': [
+            {'title': f"Result for {request.query['q']}", 'url': 'https://example.com', 'age': '1 hour ago'}
+        ]}})
+
+    app = web.Application()
+    app.router.add_get('/res/v1/web/search', handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    yield f'http://127.0.0.1:{port}/res/v1/web/search', calls
+    await runner.cleanup()
+
+def test_ttl_cache_evicts_lru_and_expires():
+    clock = FakeClock()
+    cache = TTLCache(max_size=2, ttl=10, clock=clock)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+
+    clock.now = 11
+    assert cache.get('a') is None
+    assert len(cache) == 0
+    assert cache.stats == {'evictions': 1, 'expirations': 2}
+
+    cache.set('d', 4)
+    clock.now = 16
+    assert cache.get('d', max_age=10) == 4
+    assert cache.get('d', max_age=4) is None
+    assert cache.get('d', max_age=0) is None
+
+@pytest.mark.asyncio
+async def test_identical_queries_share_one_request(brave_server):
+    url, calls = brave_server
+    client = BraveClient(api_key='test-key', base_url=url)
+
+    results = await asyncio.gather(*(client.search('surveillance') for _ in range(5)))
+    again = await client.search('surveillance')
+    await client.close()
+
+    assert calls == ['surveillance']
+    assert all(r == results[0] for r in results)
+    assert again['results'][0]['title'] == 'Result for surveillance'
+    metrics = client.metrics()
+    assert metrics['coalesced'] == 4
+    assert metrics['hits'] == 1
+    assert metrics['hit_rate'] == pytest.approx(5 / 6)
+
+@pytest.mark.asyncio
+async def test_callers_cannot_corrupt_the_cache(brave_server):
+    url, calls = brave_server
+    client = BraveClient(api_key='test-key', base_url=url)
+
+    first, second = await asyncio.gather(client.search('drones'), client.search('drones'))
+    first['results'][0]['title'] = 'tampered'
+    second['results'].clear()
+    again = await client.search('drones')
+    await client.close()
+
+    assert calls == ['drones']
+    assert again['results'][0]['title'] == 'Result for drones'
+
+@pytest.mark.asyncio
+async def test_open_circuit_does_not_charge_quota(brave_server, tmp_path):
+    url, calls = brave_server
+    quota = QuotaManager(per_minute=10, daily=100, state_path=str(tmp_path / 'quota.json'))
+    client = BraveClient(api_key='test-key', base_url=url, quota=quota)
+
+    get_breaker('brave').trip()
+    try:
+        with pytest.raises(CircuitOpenError):
+            await client.search('outage')
+    finally:
+        get_breaker('brave').reset()
+        await client.close()
+
+    assert calls == []
+    assert quota.stats['granted'] == 0
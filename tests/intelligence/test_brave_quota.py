@@ -0,0 +1,60 @@
+import pytest
+from src.intelligence.brave_quota import QuotaManager, QuotaExceededError
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def state_path(tmp_path):
+    return str(tmp_path / 'quota.json')
+
+@pytest.mark.asyncio
+async def test_wait_is_exactly_until_window_frees(state_path):
+    clock = FakeClock()
+    quota = QuotaManager(per_minute=2, daily=100, state_path=state_path, clock=clock)
+    await quota.acquire()
+    clock.now = 15
+    await quota.acquire()
+
+    assert quota.wait_time() == pytest.approx(45)
+    clock.now = 60
+    assert quota.wait_time() == 0
+    await quota.acquire()
+    assert quota.wait_time() == pytest.approx(15)
+
+@pytest.mark.asyncio
+async def test_reserved_shares_protect_each_workload(state_path):
+    clock = FakeClock()
+    quota = QuotaManager(per_minute=10, daily=100, state_path=state_path, clock=clock,
+                         shares={'monitoring': 0.5, 'responder': 0.3})
+
+    # Monitoring can use its 5 reserved slots plus the 2-slot shared pool
+    for _ in range(7):
+        await quota.acquire('monitoring')
+    assert quota.wait_time('monitoring') > 0
+
+    # ...but never the responder's reservation
+    for _ in range(3):
+        await quota.acquire('responder')
+    assert quota.wait_time('responder') > 0
+
+@pytest.mark.asyncio
+async def test_daily_budget_is_persisted(state_path):
+    quota = QuotaManager(per_minute=100, daily=3, state_path=state_path)
+    for _ in range(2):
+        await quota.acquire('monitoring')
+
+    reopened = QuotaManager(per_minute=100, daily=3, state_path=state_path)
+    assert reopened.remaining_today('monitoring') == 1
+    await reopened.acquire('monitoring')
+    with pytest.raises(QuotaExceededError):
+        await reopened.acquire('monitoring')
+
+def test_shares_cannot_exceed_budget(state_path):
+    quota = QuotaManager(shares={'monitoring': 0.6}, state_path=state_path)
+    with pytest.raises(ValueError):
+        quota.allocate('responder', 0.5)
@@ -0,0 +1,49 @@
+import pytest
+from src.intelligence.dedup import MinHasher, NearDuplicateDetector, similarity
+
+STORY = {
+    "title": "FTC opens antitrust probe into Big Tech cloud merger",
+    "description": "Regulators will examine whether the deal hands three firms control of the cloud.",
+    "url": "https://news.example/ftc-cloud-probe"
+}
+
+@pytest.fixture
+def now():
+    return [0.0]
+
+@pytest.fixture
+def detector(now):
+    return NearDuplicateDetector(window=3600, clock=lambda: now[0])
+
+def test_rewordings_cluster_under_first_copy(detector):
+    syndicated = {**STORY, "title": STORY["title"] + " - Reuters", "url": "https://wire.example/a1"}
+    other = {"title": "Privacy advocates ship an open source messenger", "url": "https://news.example/msg"}
+
+    assert detector.filter([STORY, syndicated, other]) == [STORY, other]
+
+    cluster = detector.clusters()[0]
+    assert cluster.canonical is STORY
+    assert cluster.count == 2
+    assert detector.dedup_ratio == pytest.approx(1 / 3)
+
+def test_same_url_is_duplicate_regardless_of_text(detector):
+    detector.add(STORY)
+    _, is_new = detector.add({"title": "Totally different words", "url": STORY["url"] + "?utm_source=x"})
+    assert not is_new
+
+def test_clusters_expire_after_window(detector, now):
+    detector.add(STORY)
+    now[0] = 3599
+    assert not detector.add(STORY)[1]
+
+    # The repeat kept the cluster alive; an hour of silence evicts it
+    now[0] = 3599 + 3600
+    assert detector.add(STORY)[1]
+    assert detector.metrics()["evicted"] == 1
+
+def test_signature_similarity_tracks_overlap():
+    hasher = MinHasher()
+    base = hasher.signature(STORY["title"])
+    assert similarity(base, hasher.signature(STORY["title"].lower())) == 1.0
+    assert similarity(base, hasher.signature("Open source messenger launches")) < 0.2
+    assert hasher.signature("...") is None
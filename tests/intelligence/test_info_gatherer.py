@@ -0,0 +1,86 @@
+import asyncio
+import time
+import pytest
+from src.intelligence.info_gatherer import InformationGatherer
+
+RELEVANT = {"title": "Regulation and surveillance vs open source privacy tech and decentralization"}
+
+class StubBrave:
+    def __init__(self):
+        self.queries = []
+
+    async def search(self, query, count=10, workload='default'):
+        self.queries.append(query)
+        if query == "censorship events":
+            raise RuntimeError("boom")
+        return {"query": query, "results": [RELEVANT]}
+
+class StubX:
+    def __init__(self):
+        self.queries = []
+
+    def search_recent(self, query, since_minutes=5, max_results=10):
+        self.queries.append((query, since_minutes))
+        return [{"id": "1", "text": "gm"}]
+
+@pytest.fixture
+def gatherer():
+    now = [0.0]
+    gatherer = InformationGatherer(x_client=StubX(), brave_client=StubBrave(), clock=lambda: now[0])
+    gatherer.now = now
+    return gatherer
+
+@pytest.mark.asyncio
+async def test_sources_poll_concurrently_with_partial_results(gatherer):
+    result = await gatherer.gather_intelligence()
+
+    # Three of four Brave topics succeed, each with one relevant result
+    assert result["insights"]["brave_search"]["count"] == 3
+    assert result["insights"]["twitter"]["count"] == 0
+    assert gatherer.x_client.queries[0] == (
+        "(crypto OR defi OR web3 OR privacy OR censorship OR corporate control) -is:retweet", 5
+    )
+    assert {name: s["status"] for name, s in result["sources"].items()} == {"twitter": "ok", "brave_search": "ok"}
+
+@pytest.mark.asyncio
+async def test_only_due_sources_are_polled(gatherer):
+    await gatherer.gather_intelligence()
+    gatherer.now[0] = 300
+    result = await gatherer.gather_intelligence()
+
+    assert list(result["insights"]) == ["twitter"]
+    assert result["sources"]["brave_search"] == {"status": "skipped"}
+    assert len(gatherer.brave_client.queries) == 4
+    assert gatherer.seconds_until_next_poll() == 300
+
+@pytest.mark.asyncio
+async def test_slow_source_times_out_without_blocking_others(gatherer):
+    async def hang(config):
+        await asyncio.sleep(10)
+
+    async def slow(config):
+        await asyncio.sleep(0.1)
+        return [RELEVANT]
+
+    gatherer.pollers = {"twitter": hang, "brave_search": slow}
+    gatherer.sources["twitter"]["timeout"] = 0.15
+
+    started = time.monotonic()
+    result = await gatherer.gather_intelligence()
+
+    assert time.monotonic() - started < 0.5
+    assert result["sources"]["twitter"]["status"] == "timeout"
+    assert result["insights"]["twitter"]["count"] == 0
+    assert [item["content"] for item in result["insights"]["brave_search"]["items"]] == [RELEVANT]
+
+@pytest.mark.asyncio
+async def test_analysis_flags_manipulation_and_resistance(gatherer):
+    result = await gatherer.gather_intelligence()
+
+    brave = result["insights"]["brave_search"]
+    assert brave["top_relevance"] == 1.0
+    assert brave["categories"] == {"manipulation": 3, "resistance": 3}
+    assert [(a["type"], a["content"]["source"]) for a in result["action_items"]] == [("urgent_warning", "brave_search")]
+    assert {(w["pattern"], w["count"]) for w in result["warnings"]} == {
+        ("manipulation:regulation", 3), ("manipulation:surveillance", 3)
+    }
@@ -0,0 +1,66 @@
+import asyncio
+import pytest
+from src.intelligence.intel_snapshot import IntelSnapshotService
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def counting_fetch(delay=0.0):
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return {"trends": [{"pattern": f"run {len(calls)}"}]}
+    return fetch, calls
+
+@pytest.mark.asyncio
+async def test_snapshot_is_shared_and_immutable():
+    fetch, calls = counting_fetch(delay=0.01)
+    service = IntelSnapshotService(fetch, ttl=60)
+
+    first, second = await asyncio.gather(service.get(), service.get())
+    assert first is second
+    assert len(calls) == 1
+    assert first.version == 1
+    with pytest.raises(TypeError):
+        first.data["trends"] = []
+
+@pytest.mark.asyncio
+async def test_stale_snapshot_served_while_revalidating():
+    clock = FakeClock()
+    fetch, calls = counting_fetch()
+    service = IntelSnapshotService(fetch, ttl=60, max_stale=600, clock=clock)
+    await service.get()
+
+    clock.now = 120
+    stale = await service.get()
+    assert stale.version == 1
+    while service.metrics()["refreshing"]:  # let the background refresh run
+        await asyncio.sleep(0)
+
+    fresh = await service.get()
+    assert fresh.version == 2
+    assert fresh.data["trends"][0]["pattern"] == "run 2"
+    assert service.metrics()['stale_reads'] == 1
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_previous_snapshot():
+    clock = FakeClock()
+    fetch, _ = counting_fetch()
+    service = IntelSnapshotService(fetch, ttl=60, max_stale=100, clock=clock)
+    await service.get()
+
+    async def broken():
+        raise RuntimeError("MegaCorp outage")
+
+    service.fetch = broken
+    clock.now = 500
+    snapshot = await service.get()
+
+    assert snapshot.version == 1
+    assert service.metrics()['refresh_failures'] == 1
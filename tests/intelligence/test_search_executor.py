@@ -0,0 +1,63 @@
+import asyncio
+import pytest
+from src.intelligence.search_executor import SearchExecutor
+from src.intelligence.brave_intelligence import BraveIntelligence
+
+@pytest.mark.asyncio
+async def test_queries_run_concurrently_under_limit():
+    active = 0
+    peak = 0
+
+    async def search(query):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.02)
+        active -= 1
+        return [query]
+
+    executor = SearchExecutor(search, max_concurrent=3, per_minute=100)
+    results = [r async for r in executor.stream([(i % 2, f"q{i}") for i in range(9)])]
+
+    assert len(results) == 9
+    assert peak == 3
+    assert executor.metrics()['executed'] == 9
+
+@pytest.mark.asyncio
+async def test_minute_budget_delays_excess_calls():
+    now = [0.0]
+
+    async def search(query):
+        return []
+
+    executor = SearchExecutor(search, per_minute=2, clock=lambda: now[0])
+    await executor.run("a")
+    await executor.run("b")
+
+    pending = asyncio.ensure_future(executor.run("c"))
+    await asyncio.sleep(0.01)
+    assert not pending.done()
+    assert executor.stats['budget_waits'] == 1
+
+    now[0] = 60.0
+    pending.cancel()
+
+@pytest.mark.asyncio
+async def test_gather_intel_aggregates_per_category():
+    intel = BraveIntelligence()
+    failing = intel.search_categories["crypto"]["queries"][0]
+
+    async def fake_search(query):
+        if query == failing:
+            raise RuntimeError("MegaCorp jammed the signal")
+        return [{"title": f"surveillance regulation: {query}", "description": "growing movement",
+                 "url": "", "timestamp": "", "relevance_score": 0.9}]
+
+    intel.executor.search = fake_search
+    intel._analyze_intel = lambda results: results
+    results = await asyncio.wait_for(intel.gather_intel(), timeout=1)
+
+    assert {c: len(r) for c, r in results.items()} == {
+        "crypto": 4, "corporate_control": 5, "resistance": 5
+    }
+    assert intel.executor.metrics()['failed'] == 1
@@ -0,0 +1,77 @@
+import pytest
+from src.core.circuit_breaker import get_breaker
+from src.intelligence.brave_client import BraveClient
+from src.intelligence.brave_searcher import BraveSearcher
+from src.intelligence.seen_store import BloomFilter, SeenURLStore, normalize_url
+from src.testing.fake_brave import FakeBraveProvider
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def searcher(tmp_path):
+    get_breaker('brave').reset()
+    provider = FakeBraveProvider()
+    clock = FakeClock()
+    searcher = BraveSearcher(client=BraveClient(transport=provider),
+                             db_path=str(tmp_path / 'seen.db'), clock=clock)
+    return searcher, provider, clock
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    urls = [f'https://example.com/{i}' for i in range(1000)]
+    for url in urls:
+        bloom.add(url)
+    assert all(url in bloom for url in urls)
+    assert sum(f'https://other.com/{i}' in bloom for i in range(1000)) < 50
+
+def test_seen_urls_persist_and_normalize(tmp_path):
+    store = SeenURLStore(str(tmp_path / 'seen.db'))
+    store.mark_seen('privacy rights', ['https://Example.com/story/?utm_source=x'])
+
+    reopened = SeenURLStore(str(tmp_path / 'seen.db'))
+    assert not reopened.is_new('privacy rights', 'https://example.com/story')
+    assert reopened.is_new('surveillance state', 'https://example.com/story')
+    assert normalize_url('https://EXAMPLE.com/a/#frag') == 'https://example.com/a'
+
+@pytest.mark.asyncio
+async def test_monitor_emits_only_new_findings(searcher):
+    searcher, provider, clock = searcher
+    first = await searcher.monitor_topics()
+    assert len(provider.calls) == len(searcher.topics)
+    assert first
+    assert len({f['url'] for f in first}) == len(first)
+
+    # Nothing is due until the topic intervals elapse
+    assert await searcher.monitor_topics() == []
+    assert searcher.seconds_until_next_search() > 0
+
+    clock.now = searcher.max_search_interval
+    repeat = await searcher.monitor_topics()
+    emitted = {f['url'] for f in first}
+    assert not any(f['url'] in emitted for f in repeat)
+
+def test_no_topics_means_nothing_to_wait_for(searcher):
+    searcher, _, _ = searcher
+    searcher.next_search_at.clear()
+    assert searcher.seconds_until_next_search() == 0.0
+
+@pytest.mark.asyncio
+async def test_quiet_topics_back_off(searcher):
+    searcher, provider, clock = searcher
+    searcher.topics = ['privacy rights']
+    searcher.next_search_at = {'privacy rights': 0.0}
+    searcher.topic_intervals = {'privacy rights': 300}
+
+    for _ in range(4):
+        await searcher.monitor_topics()
+        clock.now = searcher.next_search_at['privacy rights']
+
+    # Every due search reached Brave instead of replaying the cached response
+    assert len(provider.calls) == 4
+    # Synthetic results are fixed, so once they are all seen the topic goes quiet
+    assert searcher.topic_intervals['privacy rights'] > 300
@@ -0,0 +1,56 @@
+import pytest
+from src.social.interaction_store import UserInteractionStore
+from src.social.response_manager import ResponseManager, UserTier
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'interactions.db')
+
+def test_aggregates_are_incremental(db_path):
+    store = UserInteractionStore(db_path, recent_per_user=2)
+    for score in [0.2, 0.4, 0.9]:
+        store.record_interaction({"user_id": "u1", "type": "reply",
+                                  "engagement_score": score, "sentiment": 0.5})
+
+    aggregate = store.get("u1")
+    assert aggregate.interactions == 3
+    assert aggregate.avg_engagement == pytest.approx(0.5)
+    assert aggregate.avg_sentiment == pytest.approx(0.5)
+    # Ring buffer keeps only the most recent interactions
+    assert [i["engagement_score"] for i in store.get_recent("u1")] == [0.4, 0.9]
+
+def test_cache_is_bounded_and_backed_by_disk(db_path):
+    store = UserInteractionStore(db_path, max_cached_users=2)
+    for user in ["a", "b", "c"]:
+        store.record_interaction({"user_id": user, "type": "like", "engagement_score": 1.0})
+
+    assert len(store._cache) == 2
+    assert store.get("a").interactions == 1
+
+def test_daily_counts_are_running_and_persisted(db_path):
+    store = UserInteractionStore(db_path)
+    store.record_response("a")
+    store.record_response("a")
+    store.record_response("b")
+
+    reopened = UserInteractionStore(db_path)
+    assert reopened.total_responses_today() == 3
+    assert reopened.responses_today("a") == 2
+
+def test_tier_updates_as_interactions_arrive(db_path):
+    manager = ResponseManager(db_path=db_path)
+    assert manager._get_user_tier("troll") == UserTier.STANDARD
+
+    for _ in range(3):
+        manager.update_interaction_history({"user_id": "troll", "type": "reply", "sentiment": -0.9})
+
+    assert manager._get_user_tier("troll") == UserTier.SUSPICIOUS
+
+def test_limits_use_store_counts(db_path):
+    manager = ResponseManager(db_path=db_path)
+    manager.daily_limits["per_user"] = 1
+    assert manager._check_limits("u1")
+
+    manager.interactions.record_response("u1")
+    assert not manager._check_limits("u1")
+    assert manager._check_limits("u2")
@@ -0,0 +1,171 @@
+import time
+import asyncio
+import pytest
+from src.social.post_queue import PostQueue, PostPublisher, PostLane, PostStatus
+from src.testing.mock_x_api import MockXAPI
+
+@pytest.fixture
+def queue(tmp_path):
+    return PostQueue(str(tmp_path / 'outbox.db'), base_backoff=10, max_attempts=3)
+
+class FakeSafetyManager:
+    def __init__(self):
+        self.recorded = []
+        self.errors = []
+
+    def check_rate_limit(self):
+        return True
+
+    def record_post(self, post_type='post'):
+        self.recorded.append(post_type)
+
+    def log_api_error(self, error_type, details):
+        self.errors.append(error_type)
+
+class FakeXClient:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.posts = []
+
+    def create_post(self, text, reply_to=None):
+        if self.fail:
+            return None
+        self.posts.append(text)
+        return {'data': {'id': str(len(self.posts))}}
+
+    async def create_thread(self, posts, thread_id=None):
+        self.posts.extend(posts)
+        return {'status': 'complete', 'posted': len(posts), 'tweet_ids': []}
+
+def test_enqueue_is_idempotent(queue):
+    first = queue.enqueue('post', 'The MegaCorps are coming')
+    second = queue.enqueue('post', 'The MegaCorps are coming')
+
+    assert first.idempotency_key == second.idempotency_key
+    assert queue.stats()['pending'] == 1
+
+def test_claim_respects_lanes_and_schedule(queue):
+    queue.enqueue('post', 'standard', lane=PostLane.STANDARD, scheduled_at=100)
+    queue.enqueue('post', 'critical', lane=PostLane.CRITICAL, scheduled_at=200)
+    queue.enqueue('post', 'owner', lane=PostLane.OWNER_REPLY, scheduled_at=500)
+
+    assert queue.claim_next(now=300).content == 'critical'
+    assert queue.claim_next(now=300).content == 'standard'
+    assert queue.claim_next(now=300) is None
+    assert queue.next_due_in(now=300) == 200
+    assert queue.claim_next(now=500).content == 'owner'
+
+def test_failures_back_off_then_go_dead(queue):
+    queue.enqueue('post', 'flaky', scheduled_at=0)
+
+    post = queue.claim_next(now=0)
+    queue.mark_failed(post, 'boom', now=0)
+    rescheduled = queue.get(post.idempotency_key)
+    assert rescheduled.status == PostStatus.PENDING
+    assert 10 <= rescheduled.scheduled_at <= 12
+
+    post = queue.claim_next(now=100)
+    queue.mark_failed(post, 'boom', now=100)
+    assert 120 <= queue.get(post.idempotency_key).scheduled_at <= 124
+
+    post = queue.claim_next(now=1000)
+    queue.mark_failed(post, 'boom', now=1000)
+    assert queue.get(post.idempotency_key).status == PostStatus.DEAD
+
+def test_in_flight_posts_survive_restart(tmp_path):
+    path = str(tmp_path / 'outbox.db')
+    queue = PostQueue(path)
+    queue.enqueue('post', 'interrupted', scheduled_at=0)
+    queue.claim_next(now=0)
+
+    restarted = PostQueue(path)
+    assert restarted.requeue_in_flight() == 1
+    assert restarted.claim_next(now=0).content == 'interrupted'
+
+@pytest.mark.asyncio
+async def test_publisher_records_outcomes(queue):
+    safety = FakeSafetyManager()
+    client = FakeXClient()
+    publisher = PostPublisher(queue, client, safety)
+
+    queue.enqueue('post', 'single', scheduled_at=0)
+    queue.enqueue('thread', ['one', 'two'], scheduled_at=0)
+    await publisher.publish(queue.claim_next())
+    await publisher.publish(queue.claim_next())
+
+    assert client.posts == ['single', 'one', 'two']
+    assert safety.recorded == ['post', 'thread', 'thread']
+    assert queue.stats()['done'] == 2
+
+@pytest.mark.asyncio
+async def test_publisher_reschedules_failures(queue):
+    safety = FakeSafetyManager()
+    publisher = PostPublisher(queue, FakeXClient(fail=True), safety)
+
+    post = queue.enqueue('post', 'rejected', scheduled_at=0)
+    await publisher.publish(queue.claim_next())
+
+    assert queue.get(post.idempotency_key).status == PostStatus.PENDING
+    assert safety.errors == ['POSTING_ERROR']
+
+def test_same_reply_to_different_tweets_is_two_posts(queue):
+    first = queue.enqueue('post', 'Fear and loathing', post_type='reply', reply_to='1')
+    second = queue.enqueue('post', 'Fear and loathing', post_type='reply', reply_to='2')
+    standalone = queue.enqueue('post', 'Fear and loathing')
+
+    assert len({first.idempotency_key, second.idempotency_key, standalone.idempotency_key}) == 3
+    assert queue.stats()['pending'] == 3
+
+@pytest.mark.asyncio
+async def test_cancelled_publish_records_the_finished_post(queue):
+    class SlowClient(FakeXClient):
+        def create_post(self, text, reply_to=None):
+            time.sleep(0.1)
+            return super().create_post(text, reply_to)
+
+    client = SlowClient()
+    publisher = PostPublisher(queue, client, FakeSafetyManager())
+    post = queue.enqueue('post', 'on the wire', scheduled_at=0)
+    task = asyncio.create_task(publisher.publish(queue.claim_next()))
+    await asyncio.sleep(0.02)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # The post went out, so it must not be pending again after a restart
+    assert client.posts == ['on the wire']
+    assert queue.get(post.idempotency_key).status == PostStatus.DONE
+
+def test_stats_counters_track_every_transition(queue, tmp_path):
+    done = queue.enqueue('post', 'done', scheduled_at=0)
+    queue.enqueue('post', 'dead', scheduled_at=1)
+    queue.enqueue('post', 'orphaned', scheduled_at=2)
+    queue.enqueue('post', 'waiting', scheduled_at=3)
+
+    queue.mark_done(queue.claim_next(now=10))
+    dead = queue.claim_next(now=10)
+    dead.attempts = queue.max_attempts
+    queue.mark_failed(dead, 'gone', now=10)
+    queue.claim_next(now=10)
+    assert queue.stats() == {'pending': 1, 'in_flight': 1, 'done': 1, 'dead': 1}
+
+    queue.requeue_in_flight()
+    queue.conn.execute('UPDATE outbound_posts SET created_at = 0 WHERE idempotency_key = ?',
+                       (done.idempotency_key,))
+    assert queue.purge() == 1
+
+    # A reopened queue counts from the table; the running counters must agree
+    assert queue.stats() == {'pending': 2, 'in_flight': 0, 'done': 0, 'dead': 1}
+    assert PostQueue(str(tmp_path / 'outbox.db')).stats() == queue.stats()
+
+@pytest.mark.asyncio
+async def test_replies_publish_through_the_mock_client(queue, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    client = MockXAPI()
+    publisher = PostPublisher(queue, client, FakeSafetyManager())
+
+    queue.enqueue('post', 'Objection, your honor', post_type='reply', reply_to='42', scheduled_at=0)
+    await publisher.publish(queue.claim_next())
+
+    assert client.posts[0]['reply_to'] == '42'
+    assert queue.stats()['done'] == 1
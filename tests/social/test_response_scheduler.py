@@ -0,0 +1,91 @@
+import asyncio
+import pytest
+from src.social.response_scheduler import ResponseScheduler
+from src.social.response_manager import ResponseManager, UserTier
+
+@pytest.mark.asyncio
+async def test_jobs_run_in_due_order():
+    scheduler = ResponseScheduler(workers=2)
+    ran = []
+
+    def job(name):
+        async def run():
+            ran.append(name)
+        return run
+
+    await scheduler.schedule(0.05, job('late'))
+    await scheduler.schedule(0.0, job('now'))
+    await scheduler.schedule(0.02, job('soon'))
+    await asyncio.sleep(0.15)
+    await scheduler.stop()
+
+    assert ran == ['now', 'soon', 'late']
+    metrics = scheduler.metrics()
+    assert metrics['dispatched'] == 3
+    assert metrics['queue_depth'] == 0
+    assert metrics['max_lateness'] >= 0
+
+@pytest.mark.asyncio
+async def test_failed_jobs_are_counted():
+    scheduler = ResponseScheduler(workers=1)
+
+    async def boom():
+        raise RuntimeError('MegaCorp interference')
+
+    await scheduler.schedule(0, boom)
+    await asyncio.sleep(0.05)
+    await scheduler.stop()
+
+    assert scheduler.metrics()['failed'] == 1
+
+@pytest.mark.asyncio
+async def test_delayed_mentions_do_not_block(tmp_path):
+    manager = ResponseManager(db_path=str(tmp_path / 'interactions.db'))
+    manager.response_probabilities[UserTier.STANDARD] = 1.0
+    manager.cooldowns[UserTier.STANDARD] = 300
+    delivered = []
+
+    async def generate(mention, tier):
+        return {"content": f"reply to {mention['username']}"}
+
+    async def deliver(mention, response):
+        delivered.append(response)
+
+    manager._generate_response = generate
+    manager.on_response = deliver
+
+    result = await asyncio.wait_for(
+        manager.handle_mention({"user_id": "1", "username": "citizen"}), timeout=1
+    )
+
+    assert result["priority"] == "scheduled"
+    assert result["delay"] > 0
+    assert manager.get_scheduler_metrics()['queue_depth'] == 1
+    assert delivered == []
+    await manager.scheduler.stop()
+
+@pytest.mark.asyncio
+async def test_burst_of_delayed_mentions_respects_limits(tmp_path):
+    manager = ResponseManager(db_path=str(tmp_path / 'interactions.db'))
+    manager.response_probabilities[UserTier.STANDARD] = 1.0
+    manager.daily_limits["per_user"] = 2
+
+    async def fail(mention, tier):
+        raise RuntimeError('generation failed')
+
+    manager._generate_response = fail
+
+    results = [
+        await manager.handle_mention({"id": str(i), "user_id": "1", "username": "citizen"})
+        for i in range(5)
+    ]
+
+    # Slots are counted when scheduled, not when the delayed response is sent
+    assert [r is not None for r in results] == [True, True, False, False, False]
+    assert manager.interactions.responses_today("1") == 2
+    await manager.scheduler.stop()
+
+    # A response that fails to generate gives its slot back
+    with pytest.raises(RuntimeError):
+        await manager._dispatch_response({"user_id": "1", "username": "citizen"}, UserTier.STANDARD)
+    assert manager.interactions.responses_today("1") == 1
@@ -0,0 +1,59 @@
+import pytest
+from src.social.rate_window import MinuteBucketCounter
+from src.social.safety_manager import SafetyManager
+from src.core.circuit_breaker import CircuitBreakerRegistry
+
+@pytest.fixture
+def safety_manager(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return SafetyManager(state_path=str(tmp_path / 'safety.json'),
+                         breakers=CircuitBreakerRegistry(base_probe_interval=0))
+
+def test_counter_hour_and_day_windows():
+    counter = MinuteBucketCounter()
+    counter.add(now=0)
+    counter.add(2, now=30 * 60)
+
+    assert counter.last_hour(now=30 * 60) == 3
+    assert counter.last_hour(now=61 * 60) == 2
+    assert counter.last_day(now=61 * 60) == 3
+    assert counter.last_day(now=1440 * 60) == 2
+    assert counter.last_day(now=3000 * 60) == 0
+
+def test_counter_round_trip():
+    counter = MinuteBucketCounter()
+    counter.add(now=0)
+    counter.add(now=90 * 60)
+
+    restored = MinuteBucketCounter.from_dict(counter.to_dict())
+    assert restored.last_hour(now=90 * 60) == 1
+    assert restored.last_day(now=90 * 60) == 2
+
+def test_rate_limit_uses_hourly_window(safety_manager):
+    for _ in range(safety_manager.max_posts_per_hour):
+        assert safety_manager.check_rate_limit()
+        safety_manager.record_post()
+
+    assert not safety_manager.check_rate_limit()
+    assert safety_manager.get_technical_stats()['rate_limits_hit'] == 1
+
+def test_stats_persist_across_restart(safety_manager, tmp_path):
+    safety_manager.record_post('reply')
+    safety_manager.record_post('thread')
+
+    restarted = SafetyManager(state_path=str(tmp_path / 'safety.json'))
+    stats = restarted.get_technical_stats()
+    assert stats['posts'] == 2
+    assert stats['replies'] == 1
+    assert stats['posts_last_hour'] == 2
+
+def test_emergency_shutdown_recovers_after_probe(safety_manager):
+    safety_manager.log_api_error('API_UNAVAILABLE', 'X API down')
+    assert safety_manager.emergency_shutdown
+
+    # Probe interval has elapsed, so a single probe is let through
+    assert safety_manager.is_operational()
+    safety_manager.record_dependency_result('x_api', success=True)
+
+    assert not safety_manager.emergency_shutdown
+    assert safety_manager.get_circuit_metrics()['x_api']['state'] == 'closed'
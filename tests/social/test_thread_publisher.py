@@ -0,0 +1,67 @@
+import pytest
+from src.social.thread_publisher import ThreadJobStore, ThreadStatus, make_thread_id
+from src.social.x_api_client import XAPIClient
+
+@pytest.fixture
+def x_client(tmp_path, monkeypatch):
+    for var in ['X_API_KEY', 'X_API_SECRET', 'X_ACCESS_TOKEN', 'X_ACCESS_SECRET']:
+        monkeypatch.setenv(var, 'test')
+    return XAPIClient(thread_db_path=str(tmp_path / 'threads.db'))
+
+def test_thread_id_is_stable():
+    posts = ['first', 'second']
+    assert make_thread_id(posts) == make_thread_id(list(posts))
+    assert make_thread_id(posts) != make_thread_id(['second', 'first'])
+
+def test_store_round_trip(tmp_path):
+    store = ThreadJobStore(str(tmp_path / 'threads.db'))
+    job = store.get_or_create('t1', ['a', 'b'])
+    job.tweet_ids.append('100')
+    job.next_index = 1
+    job.status = ThreadStatus.PARTIAL
+    store.save(job)
+
+    reopened = ThreadJobStore(str(tmp_path / 'threads.db'))
+    loaded = reopened.get('t1')
+    assert loaded.tweet_ids == ['100']
+    assert loaded.next_index == 1
+    assert [j.thread_id for j in reopened.unfinished()] == ['t1']
+
+@pytest.mark.asyncio
+async def test_thread_resumes_after_partial_failure(x_client):
+    sent = []
+    failures = {'two': 1}
+
+    def flaky_post(text, reply_to=None):
+        if failures.get(text):
+            failures[text] -= 1
+            raise RuntimeError('API unavailable')
+        sent.append((text, reply_to))
+        return {'data': {'id': f'id_{text}'}}
+
+    x_client._post_tweet = flaky_post
+    posts = ['one', 'two', 'three']
+
+    first = await x_client.create_thread(posts, post_delay=0)
+    assert first['status'] == 'partial'
+    assert first['posted'] == 1
+    assert first['tweet_ids'] == ['id_one']
+
+    second = await x_client.create_thread(posts, post_delay=0)
+    assert second['status'] == 'complete'
+    assert second['posted'] == 2
+    assert second['tweet_ids'] == ['id_one', 'id_two', 'id_three']
+    # 'one' was never re-posted and 'two' replied to it
+    assert sent == [('one', None), ('two', 'id_one'), ('three', 'id_two')]
+
+@pytest.mark.asyncio
+async def test_completed_thread_is_not_reposted(x_client):
+    calls = []
+    x_client._post_tweet = lambda text, reply_to=None: calls.append(text) or {'data': {'id': text}}
+
+    await x_client.create_thread(['a', 'b'], post_delay=0)
+    again = await x_client.create_thread(['a', 'b'], post_delay=0)
+
+    assert calls == ['a', 'b']
+    assert again['posted'] == 0
+    assert again['status'] == 'complete'
@@ -0,0 +1,74 @@
+import pytest
+from src.social.interaction_store import UserInteractionStore
+from src.social.tier_engine import TierEngine, UserTier
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def store(tmp_path):
+    return UserInteractionStore(str(tmp_path / 'interactions.db'))
+
+def record(store, engine, user_id, count, **fields):
+    for _ in range(count):
+        store.record_interaction({"user_id": user_id, "type": "reply", **fields})
+    engine.mark_dirty(user_id)
+
+def test_tiers_follow_engagement_and_reports(store):
+    engine = TierEngine(store, allowlist=["ally"])
+    record(store, engine, "fan", 25, engagement_score=0.95, sentiment=0.8)
+    record(store, engine, "regular", 6, engagement_score=0.7, sentiment=0.2)
+    record(store, engine, "troll", 4, engagement_score=0.9)
+    store.record_interaction({"user_id": "troll", "type": "report"})
+    engine.mark_dirty("troll")
+
+    assert engine.get_tier("fan") == UserTier.TRUSTED
+    assert engine.get_tier("regular") == UserTier.RESISTANCE
+    assert engine.get_tier("troll") == UserTier.SUSPICIOUS
+    assert engine.get_tier("ally") == UserTier.TRUSTED
+    assert engine.get_tier("stranger") == UserTier.STANDARD
+
+def test_tier_is_cached_until_dirty_or_expired(store):
+    clock = FakeClock()
+    engine = TierEngine(store, ttl=60, clock=clock)
+    engine.get_tier("u1")
+    engine.get_tier("u1")
+    assert engine.stats == {"hits": 1, "recomputes": 1}
+
+    record(store, engine, "u1", 1, sentiment=-0.9)
+    engine.get_tier("u1")
+    assert engine.stats["recomputes"] == 2
+
+    clock.now = 61
+    engine.get_tier("u1")
+    assert engine.stats["recomputes"] == 3
+
+def test_retier_all_persists_tiers(store, tmp_path):
+    engine = TierEngine(store)
+    for user in ["a", "b", "c"]:
+        for _ in range(3):
+            store.record_interaction({"user_id": user, "type": "reply", "sentiment": -0.9})
+
+    counts = engine.retier_all(batch_size=2)
+    assert counts[UserTier.SUSPICIOUS.value] == 3
+
+    reopened = UserInteractionStore(str(tmp_path / 'interactions.db'))
+    assert reopened.get_tier("b") == UserTier.SUSPICIOUS.value
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    store = UserInteractionStore(str(tmp_path / 'interactions.db'), max_cached_users=2)
+    engine = TierEngine(store)
+    engine.get_tier("hot")
+    engine.get_tier("cold")
+    engine.get_tier("hot")
+    engine.get_tier("new")
+
+    recomputes = engine.stats["recomputes"]
+    engine.get_tier("hot")
+    assert engine.stats["recomputes"] == recomputes
+    engine.get_tier("cold")
+    assert engine.stats["recomputes"] == recomputes + 1